@@ -15,7 +15,15 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import asyncio
+import collections
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
 from pymongo import MongoClient
+from pymongo.collection import Collection
+from pymongo.database import Database
 
 from utils.config import get_key
 
@@ -25,4 +33,94 @@ host = get_key("DB_Host", "localhost")
 port = get_key("DB_Port", "27017")
 db = get_key("DB_Database", "akabot")
 
-client = MongoClient(f'mongodb://{name}:{password}@{host}:{port}/', 27017)[db]
+# Blocking client, only meant for code that runs before the event loop starts (database migrations, scripts)
+sync_client = MongoClient(f'mongodb://{name}:{password}@{host}:{port}/', 27017)[db]
+
+# Every database call made from the bot runs on this pool, so the event loop never waits on database I/O.
+# The pool size also bounds how many database operations can be in flight at once.
+db_executor = ThreadPoolExecutor(max_workers=int(get_key("DB_Max_Workers", "16")), thread_name_prefix="akabot-db")
+
+
+async def run_db(func, *args, **kwargs):
+    """Run a blocking database function on the database thread pool
+
+    Args:
+        func: Blocking function to run
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        Whatever the function returns
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor, functools.partial(func, *args, **kwargs))
+
+
+class AsyncCursor:
+    """Awaitable wrapper around a PyMongo find or aggregate cursor. The cursor is only created once it's used."""
+
+    def __init__(self, factory, batch_size: int = 100):
+        self._factory = factory
+        self._cursor = None
+        self._batch_size = batch_size
+        self._batch = collections.deque()
+
+    async def _get_cursor(self):
+        if self._cursor is None:
+            self._cursor = await run_db(self._factory)
+        return self._cursor
+
+    async def to_list(self, length: int | None = None) -> list:
+        cursor = await self._get_cursor()
+        return await run_db(lambda: list(itertools.islice(cursor, length)))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._batch:
+            cursor = await self._get_cursor()
+            self._batch.extend(await run_db(lambda: list(itertools.islice(cursor, self._batch_size))))
+            if not self._batch:
+                raise StopAsyncIteration
+
+        return self._batch.popleft()
+
+
+class AsyncCollection:
+    """Collection whose operations are awaited instead of blocking the event loop
+
+    Every method of a PyMongo collection is available, with the same arguments. `find` and `aggregate` return
+    an `AsyncCursor`, anything else returns a coroutine.
+    """
+
+    def __init__(self, collection: Collection):
+        self.collection = collection
+
+    def find(self, *args, **kwargs) -> AsyncCursor:
+        return AsyncCursor(functools.partial(self.collection.find, *args, **kwargs))
+
+    def aggregate(self, *args, **kwargs) -> AsyncCursor:
+        return AsyncCursor(functools.partial(self.collection.aggregate, *args, **kwargs))
+
+    def __getattr__(self, item):
+        method = getattr(self.collection, item)
+
+        async def call(*args, **kwargs):
+            return await run_db(method, *args, **kwargs)
+
+        return call
+
+
+class AsyncDatabase:
+    def __init__(self, database: Database):
+        self.database = database
+        self.collections = {}
+
+    def __getitem__(self, item: str) -> AsyncCollection:
+        if item not in self.collections:
+            self.collections[item] = AsyncCollection(self.database[item])
+        return self.collections[item]
+
+
+client = AsyncDatabase(sync_client)
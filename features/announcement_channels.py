@@ -37,56 +37,57 @@ class AnnouncementChannels(discord.Cog):
     async def announcement_channels_subscribe(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
         try:
             if not channel.permissions_for(ctx.guild.me).send_messages:
-                await ctx.respond(trl(ctx.author.id, ctx.guild.id, "announcement_no_send_messages_permission"),
+                await ctx.respond(await trl(ctx.author.id, ctx.guild.id, "announcement_no_send_messages_permission"),
                                   ephemeral=True)
                 return
 
-            db_add_announcement_channel(ctx.guild.id, channel.id)
+            await db_add_announcement_channel(ctx.guild.id, channel.id)
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "announcement_subscribed", append_tip=True).format(
+                (await trl(ctx.user.id, ctx.guild.id, "announcement_subscribed", append_tip=True)).format(
                     channel=channel.mention),
                 ephemeral=True)
             return
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.author.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.author.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @announcement_channels_group.command(name="unsubscribe",
                                          description="Unsubscribe a channel from Akabot announcements")
     async def announcement_channels_unsubscribe(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
         try:
-            if not db_is_subscribed_to_announcements(ctx.guild.id, channel.id):
+            if not await db_is_subscribed_to_announcements(ctx.guild.id, channel.id):
                 await ctx.respond(
-                    trl(ctx.author.id, ctx.guild.id, "announcement_not_subscribed").format(channel=channel.mention),
+                    (await trl(ctx.author.id, ctx.guild.id,
+                               "announcement_not_subscribed")).format(channel=channel.mention),
                     ephemeral=True)
                 return
 
-            db_remove_announcement_channel(ctx.guild.id, channel.id)
-            await ctx.respond(trl(ctx.author.id, ctx.guild.id, "announcement_unsubscribed", append_tip=True).format(
+            await db_remove_announcement_channel(ctx.guild.id, channel.id)
+            await ctx.respond((await trl(ctx.author.id, ctx.guild.id, "announcement_unsubscribed", append_tip=True)).format(
                 channel=channel.mention),
                 ephemeral=True)
             return
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.author.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.author.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @announcement_channels_group.command(name="list",
                                          description="List all channels subscribed to Akabot announcements")
     async def announcement_channels_list(self, ctx: discord.ApplicationContext):
         try:
-            channels = db_get_announcement_channels(ctx.guild.id)
+            channels = await db_get_announcement_channels(ctx.guild.id)
             if not channels:
-                await ctx.respond(trl(ctx.author.id, ctx.guild.id, "announcement_none_subscribed"),
+                await ctx.respond(await trl(ctx.author.id, ctx.guild.id, "announcement_none_subscribed"),
                                   ephemeral=True)
                 return
 
             channel_mentions = [f"<#{channel[1]}>" for channel in channels]
             message = "\n".join(channel_mentions)
-            if get_per_user_setting(ctx.user.id, "tips_enabled", "true") == "true":
-                language = get_language(ctx.guild.id, ctx.user.id)
+            if await get_per_user_setting(ctx.user.id, "tips_enabled", "true") == "true":
+                language = await get_language(ctx.guild.id, ctx.user.id)
                 message = append_tip_to_message(ctx.guild.id, ctx.user.id, message, language)
             await ctx.respond(message, ephemeral=True)
             return
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.author.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.author.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
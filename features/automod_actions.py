@@ -29,20 +29,20 @@ from utils.languages import get_translation_for_key_localized as trl
 from utils.warning import add_warning
 
 
-def db_add_automod_action(guild_id: int, rule_id: int, rule_name: str, action: str, additional) -> ObjectId:
-    insert_result = client['AutomodActions'].insert_one(
+async def db_add_automod_action(guild_id: int, rule_id: int, rule_name: str, action: str, additional) -> ObjectId:
+    insert_result = await client['AutomodActions'].insert_one(
         {'GuildID': str(guild_id), 'RuleID': str(rule_id), 'RuleName': rule_name, 'Action': action,
          'Additional': additional})
 
     return insert_result.inserted_id
 
 
-def db_remove_automod_action(action_id: ObjectId):
-    client['AutomodActions'].delete_one({'_id': action_id})
+async def db_remove_automod_action(action_id: ObjectId):
+    await client['AutomodActions'].delete_one({'_id': action_id})
 
 
-def db_get_automod_actions(guild_id: int):
-    result = client['AutomodActions'].find({'GuildID': str(guild_id)}).to_list()
+async def db_get_automod_actions(guild_id: int):
+    result = await client['AutomodActions'].find({'GuildID': str(guild_id)}).to_list()
     return [(str(i['_id']), i['RuleID'], i['RuleName'], i['Action'], i['Additional']) for i in result]
 
 
@@ -82,7 +82,7 @@ class AutomodActions(discord.Cog):
                 return
 
             self.storage_1.add_event(payload.rule_id, payload.message_id)
-            automod_actions = db_get_automod_actions(payload.guild_id)
+            automod_actions = await db_get_automod_actions(payload.guild_id)
             for automod_action in automod_actions:
                 if int(automod_action[1]) == payload.rule_id:
 
@@ -140,9 +140,9 @@ class AutomodActions(discord.Cog):
                                   message_reason: str = None):
         try:
             # verify count of rules
-            automod_db_actions = db_get_automod_actions(ctx.guild.id)
+            automod_db_actions = await db_get_automod_actions(ctx.guild.id)
             if len(automod_db_actions) >= int(get_key("AutomodActions_MaxActions", "5")):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "automod_actions_max_reached"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "automod_actions_max_reached"), ephemeral=True)
                 return
 
             automod_actions = await ctx.guild.fetch_auto_moderation_rules()
@@ -156,36 +156,38 @@ class AutomodActions(discord.Cog):
 
             if not automod_rule:
                 valid_rules = ', '.join([f"{rule.name}" for rule in automod_actions])
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "automod_rule_doesnt_exist").format(rules=valid_rules),
+                await ctx.respond((await trl(ctx.user.id, ctx.guild.id,
+                                             "automod_rule_doesnt_exist")).format(rules=valid_rules),
                                   ephemeral=True)
                 return
 
             # Check if there's already a timeout action
             for i in automod_db_actions:
                 if i[1] == automod_rule.id and i[3] == action:
-                    await ctx.respond(trl(ctx.user.id, ctx.guild.id, "automod_rule_action_already_exists"),
+                    await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "automod_rule_action_already_exists"),
                                       ephemeral=True)
                     return
 
                 if i[1] == automod_rule.id and i[3].startswith("timeout") and action.startswith("timeout"):
-                    await ctx.respond(trl(ctx.user.id, ctx.guild.id, "automod_rule_timeout_action_already_exists"),
+                    await ctx.respond(await trl(ctx.user.id, ctx.guild.id,
+                                                "automod_rule_timeout_action_already_exists"),
                                       ephemeral=True)
                     return
 
             # Determine message if not specified
             if action == "DM" and not message_reason:
-                message_reason = trl(0, ctx.guild.id, "automod_default_dm")
+                message_reason = await trl(0, ctx.guild.id, "automod_default_dm")
             elif not message_reason:
-                message_reason = trl(0, ctx.guild.id, "automod_default")
+                message_reason = await trl(0, ctx.guild.id, "automod_default")
 
-            action_id = db_add_automod_action(ctx.guild.id, automod_rule.id, rule_name, action,
-                                              additional=message_reason)
+            action_id = await db_add_automod_action(ctx.guild.id, automod_rule.id, rule_name, action,
+                                                    additional=message_reason)
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "automod_added", append_tip=True).format(id=str(action_id)),
+                (await trl(ctx.user.id, ctx.guild.id, "automod_added", append_tip=True)).format(id=str(action_id)),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @automod_actions_subcommands.command(name='remove', description='Remove an automod action.')
     @discord_commands_ext.bot_has_permissions(manage_guild=True)
@@ -197,10 +199,10 @@ class AutomodActions(discord.Cog):
             # verify action exists, rule_name is NOT rule_id
 
             if not ObjectId.is_valid(action_id):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "automod_rule_doesnt_exist_2"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "automod_rule_doesnt_exist_2"), ephemeral=True)
                 return
 
-            automod_actions = db_get_automod_actions(ctx.guild.id)
+            automod_actions = await db_get_automod_actions(ctx.guild.id)
             automod_rule = None
             for rule in automod_actions:
                 if rule[0] == action_id:
@@ -208,14 +210,14 @@ class AutomodActions(discord.Cog):
                     break
 
             if not automod_rule:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "automod_rule_doesnt_exist_2"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "automod_rule_doesnt_exist_2"), ephemeral=True)
                 return
 
-            db_remove_automod_action(ObjectId(action_id))
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "automod_removed", append_tip=True), ephemeral=True)
+            await db_remove_automod_action(ObjectId(action_id))
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "automod_removed", append_tip=True), ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @automod_actions_subcommands.command(name='list', description='List automod actions.')
     @discord_commands_ext.bot_has_permissions(manage_guild=True)
@@ -223,16 +225,16 @@ class AutomodActions(discord.Cog):
     @analytics("automod action list")
     async def automod_actions_list(self, ctx: discord.ApplicationContext):
         try:
-            automod_actions = db_get_automod_actions(ctx.guild.id)
+            automod_actions = await db_get_automod_actions(ctx.guild.id)
             if not automod_actions:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "automod_actions_list_empty", append_tip=True),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "automod_actions_list_empty", append_tip=True),
                                   ephemeral=True)
                 return
 
             actions = '\n'.join([f"`{action[0]}`: {action[2]}: {action[3]}" for action in automod_actions])
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "automod_actions_list", append_tip=True).format(actions=actions),
+                (await trl(ctx.user.id, ctx.guild.id, "automod_actions_list", append_tip=True)).format(actions=actions),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
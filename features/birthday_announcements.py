@@ -50,7 +50,7 @@ class BirthdayAnnouncements(discord.Cog):
         if now.hour != 12 or now.minute != 0:
             return
 
-        birthdays = client['UserBirthday'].find(
+        birthdays = await client['UserBirthday'].find(
             {'Birth.Year': now.year, 'Birth.Month': now.month, 'Birth.Day': now.day}).to_list()
         for birthday in birthdays:
             # Test DM
@@ -59,8 +59,8 @@ class BirthdayAnnouncements(discord.Cog):
                 if member is None:
                     continue
 
-                if get_per_user_setting(member.id, 'birthday_send_dm', True):
-                    await member.send(trl(member.id, 0, 'birthday_dm'))
+                if await get_per_user_setting(member.id, 'birthday_send_dm', True):
+                    await member.send(await trl(member.id, 0, 'birthday_dm'))
             except Exception as e:
                 sentry_sdk.capture_exception(e)
 
@@ -72,9 +72,9 @@ class BirthdayAnnouncements(discord.Cog):
     @commands.has_permissions(manage_guild=True)
     @analytics("birthday_announcements channel")
     async def set_channel(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
-        set_setting(ctx.guild.id, "birthday_announcements_channel", str(channel.id))
+        await set_setting(ctx.guild.id, "birthday_announcements_channel", str(channel.id))
         await ctx.respond(
-            trl(ctx.user.id, ctx.guild.id, "birthday_announcements_channel_set", append_tip=True).format(
+            (await trl(ctx.user.id, ctx.guild.id, "birthday_announcements_channel_set", append_tip=True)).format(
                 channel=channel.mention),
             ephemeral=True)
 
@@ -84,5 +84,5 @@ class BirthdayAnnouncements(discord.Cog):
     @commands.has_permissions(manage_guild=True)
     @analytics("birthday_announcements message")
     async def birthday_announcements_message(self, ctx: discord.ApplicationContext, message: str):
-        set_setting(ctx.guild.id, "birthday_announcements_message", message)
+        await set_setting(ctx.guild.id, "birthday_announcements_message", message)
         await ctx.respond("Birthday announcement message set", ephemeral=True)
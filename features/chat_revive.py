@@ -15,65 +15,133 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import asyncio
 import time
 
 import discord
 import sentry_sdk
 from discord.ext import commands as commands_ext
-from discord.ext import tasks
 
 from database import client
 from utils.analytics import analytics
+from utils.deadline_scheduler import DeadlineScheduler
 from utils.languages import get_translation_for_key_localized as trl
 from utils.logging_util import log_into_logs
+from utils.message_dispatch import message_dispatcher, MessageContext
+from utils.write_behind import write_behind
+
+
+# How long to wait before trying again when a revival message can't be sent
+RETRY_INTERVAL = 60
+
+
+class RevivalChannel:
+    """A channel with chat revive set up, as loaded from the database"""
+
+    __slots__ = ('guild_id', 'channel_id', 'role_id', 'revival_time', 'last_message', 'revived')
+
+    def __init__(self, guild_id: int, channel_id: int, role_id: int, revival_time: int, last_message: float,
+                 revived: bool):
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.role_id = role_id
+        self.revival_time = revival_time
+        self.last_message = last_message
+        self.revived = revived
+
+    @property
+    def deadline(self) -> float:
+        return self.last_message + self.revival_time
 
 
 class ChatRevive(discord.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
+        # Channel ID -> RevivalChannel, every channel with chat revive set up
+        self.channels: dict[int, RevivalChannel] = {}
+        self.scheduler = DeadlineScheduler()
+        self.scheduler_task = None
+        message_dispatcher.register("chat_revive", self.handle_message,
+                                    lambda message, settings: message.channel.id in self.channels)
 
     @discord.Cog.listener()
     async def on_ready(self):
-        self.revive_channels.start()
+        if self.scheduler_task is None or self.scheduler_task.done():
+            self.scheduler_task = asyncio.create_task(self.run_scheduler())
 
-    @discord.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        try:
-            if message.author.bot:
-                return
+    def add_channel(self, channel: RevivalChannel):
+        self.channels[channel.channel_id] = channel
+        if not channel.revived:
+            self.scheduler.schedule(channel.channel_id, channel.deadline)
 
-            client['ChatRevive'].update_one({'GuildID': str(message.guild.id), 'ChannelID': str(message.channel.id)},
-                                            {'$set': {'LastMessage': time.time(), 'Revived': False}})
-        except Exception as e:
-            sentry_sdk.capture_exception(e)
+    def remove_channel(self, channel_id: int):
+        self.channels.pop(channel_id, None)
+        self.scheduler.cancel(channel_id)
+
+    async def load_channels(self):
+        async for i in client['ChatRevive'].find():
+            channel = RevivalChannel(int(i['GuildID']), int(i['ChannelID']), int(i['RoleID']), i['RevivalTime'],
+                                     i['LastMessage'], i['Revived'])
+
+            # LastMessage is only saved when the channel gets revived or becomes active again, the channel's last
+            # message from the gateway is more recent
+            discord_channel = self.bot.get_channel(channel.channel_id)
+            if discord_channel is not None and getattr(discord_channel, 'last_message_id', None):
+                last_message = discord.utils.snowflake_time(discord_channel.last_message_id).timestamp()
+                channel.last_message = max(channel.last_message, last_message)
 
-    @tasks.loop(minutes=1)
-    async def revive_channels(self):
+            self.add_channel(channel)
+
+    async def run_scheduler(self):
+        """Sleep until a channel's revival time passes without messages, then revive it"""
         try:
-            for guild in self.bot.guilds:
-                data = client['ChatRevive'].find({'GuildID': str(guild.id)}).to_list()
-                for revive_channel in data:
-                    if revive_channel['Revived']:
-                        continue
-
-                    if time.time() - revive_channel['LastMessage'] > revive_channel['RevivalTime']:
-                        role = guild.get_role(int(revive_channel['RoleID']))
-                        if role is None:
-                            continue
-
-                        channel = guild.get_channel(int(revive_channel['ChannelID']))
-                        if channel is None:
-                            continue
-
-                        if not channel.can_send():
-                            continue
-
-                        await channel.send(f'{role.mention}, this channel has been inactive for a while.')
-                        client['ChatRevive'].update_one({'GuildID': str(guild.id), 'ChannelID': str(channel.id)},
-                                                        {'$set': {'Revived': True}})
+            await self.load_channels()
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
+        while True:
+            for channel_id in await self.scheduler.wait():
+                channel = self.channels.get(channel_id)
+                if channel is None or channel.revived:
+                    continue
+
+                # Messages only move last_message forward, the timer is moved when it fires
+                if channel.deadline > time.time():
+                    self.scheduler.schedule(channel_id, channel.deadline)
+                    continue
+
+                try:
+                    await self.revive_channel(channel)
+                except Exception as e:
+                    sentry_sdk.capture_exception(e)
+                    self.scheduler.schedule(channel_id, time.time() + RETRY_INTERVAL)
+
+    async def revive_channel(self, revive_channel: RevivalChannel):
+        guild = self.bot.get_guild(revive_channel.guild_id)
+        role = guild.get_role(revive_channel.role_id) if guild is not None else None
+        channel = guild.get_channel(revive_channel.channel_id) if guild is not None else None
+        if role is None or channel is None or not channel.can_send():
+            self.scheduler.schedule(revive_channel.channel_id, time.time() + RETRY_INTERVAL)
+            return
+
+        await channel.send(f'{role.mention}, this channel has been inactive for a while.')
+        revive_channel.revived = True
+        await client['ChatRevive'].update_one({'GuildID': str(guild.id), 'ChannelID': str(channel.id)},
+                                              {'$set': {'Revived': True, 'LastMessage': revive_channel.last_message}})
+
+    async def handle_message(self, ctx: MessageContext):
+        channel = self.channels.get(ctx.message.channel.id)
+        if channel is None:
+            return
+
+        channel.last_message = time.time()
+        if channel.revived:
+            # The channel is active again, the only time a message needs a database write
+            channel.revived = False
+            self.scheduler.schedule(channel.channel_id, channel.deadline)
+            write_behind.set('ChatRevive', {'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.channel_id)},
+                             {'LastMessage': channel.last_message, 'Revived': False})
+
     chat_revive_subcommand = discord.SlashCommandGroup(name='chatrevive', description='Revive channels')
 
     @chat_revive_subcommand.command(name="set", description="Set revive settings for a channel")
@@ -89,32 +157,35 @@ class ChatRevive(discord.Cog):
         try:
             # Permission checks
             if not revival_role.mentionable and not ctx.guild.me.guild_permissions.manage_roles:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "chat_revive_set_error_not_mentionable"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "chat_revive_set_error_not_mentionable"),
                                   ephemeral=True)
                 return
 
             # Database access
 
             # Delete existing record
-            client['ChatRevive'].delete_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)})
+            await client['ChatRevive'].delete_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)})
 
             # Set new one
-            client['ChatRevive'].insert_one(
+            revival_channel = RevivalChannel(ctx.guild.id, channel.id, revival_role.id, revival_minutes * 60,
+                                             time.time(), False)
+            await client['ChatRevive'].insert_one(
                 {'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id), 'RoleID': str(revival_role.id),
-                 'RevivalTime': revival_minutes * 60, 'LastMessage': time.time(),
+                 'RevivalTime': revival_channel.revival_time, 'LastMessage': revival_channel.last_message,
                  'Revived': False})
+            self.add_channel(revival_channel)
 
             # Embed for logs
-            logging_embed = discord.Embed(title=trl(ctx.user.id, ctx.guild.id, "chat_revive_log_set_title"))
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_channel"),
+            logging_embed = discord.Embed(title=await trl(ctx.user.id, ctx.guild.id, "chat_revive_log_set_title"))
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_channel"),
                                     value=f"{ctx.channel.mention}", inline=True)
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_user"),
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_user"),
                                     value=f"{ctx.user.mention}", inline=True)
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "chat_revive_list_role"),
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "chat_revive_list_role"),
                                     value=f"{revival_role.mention}", inline=False)
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "chat_revive_log_set_revival_time"),
-                                    value=trl(ctx.user.id, ctx.guild.id,
-                                              "chat_revive_log_set_revival_time_value").format(
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "chat_revive_log_set_revival_time"),
+                                    value=(await trl(ctx.user.id, ctx.guild.id,
+                                                     "chat_revive_log_set_revival_time_value")).format(
                                         time=str(revival_minutes)), inline=True)
 
             # Send to logs
@@ -122,11 +193,12 @@ class ChatRevive(discord.Cog):
 
             # Send back response
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "chat_revive_set_response_success").format(channel=channel.mention),
+                (await trl(ctx.user.id, ctx.guild.id,
+                           "chat_revive_set_response_success")).format(channel=channel.mention),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @chat_revive_subcommand.command(name="remove", description="List the revive settings")
     @commands_ext.guild_only()
@@ -135,13 +207,14 @@ class ChatRevive(discord.Cog):
     @analytics("chatrevive remove")
     async def remove_revive_settings(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
         try:
-            client['ChatRevive'].delete_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)})
+            await client['ChatRevive'].delete_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)})
+            self.remove_channel(channel.id)
 
             # Create embed
-            logging_embed = discord.Embed(title=trl(ctx.user.id, ctx.guild.id, "chat_revive_remove_log_title"))
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_channel"),
+            logging_embed = discord.Embed(title=await trl(ctx.user.id, ctx.guild.id, "chat_revive_remove_log_title"))
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_channel"),
                                     value=f"{ctx.channel.mention}", inline=True)
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_user"),
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_user"),
                                     value=f"{ctx.user.mention}", inline=True)
 
             # Send to logs
@@ -149,11 +222,11 @@ class ChatRevive(discord.Cog):
 
             # Respond
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "chat_revive_remove_success").format(channel=channel.mention),
+                (await trl(ctx.user.id, ctx.guild.id, "chat_revive_remove_success")).format(channel=channel.mention),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @chat_revive_subcommand.command(name="list", description="List the revive settings")
     @commands_ext.guild_only()
@@ -162,24 +235,24 @@ class ChatRevive(discord.Cog):
     @analytics("chatrevive list")
     async def list_revive_settings(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
         try:
-            result = client['ChatRevive'].find_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)})
+            result = await client['ChatRevive'].find_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)})
 
             if not result:
                 await ctx.respond(
-                    trl(ctx.user.id, ctx.guild.id, "chat_revive_list_empty").format(channel=channel.mention),
+                    (await trl(ctx.user.id, ctx.guild.id, "chat_revive_list_empty")).format(channel=channel.mention),
                     ephemeral=True)
                 return
 
             role = ctx.guild.get_role(int(result['RoleID']))
 
             embed = discord.Embed(
-                title=trl(ctx.user.id, ctx.guild.id, "chat_revive_list_title").format(name=channel.name),
+                title=(await trl(ctx.user.id, ctx.guild.id, "chat_revive_list_title")).format(name=channel.name),
                 color=discord.Color.blurple())
-            embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "chat_revive_list_role"), value=role.mention)
-            embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "chat_revive_list_time"),
+            embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "chat_revive_list_role"), value=role.mention)
+            embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "chat_revive_list_time"),
                             value=str(result['RevivalTime']))
 
             await ctx.respond(embed=embed, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
@@ -20,16 +20,23 @@ import datetime
 import discord
 import sentry_sdk
 from discord.ext import commands as commands_ext, pages
+from pymongo import ReturnDocument
 
 from database import client
 from utils.analytics import analytics
+from utils.counted_today import counted_today
 from utils.languages import get_translation_for_key_localized as trl, get_language
 from utils.logging_util import log_into_logs
+from utils.message_dispatch import message_dispatcher, MessageContext
 from utils.per_user_settings import get_per_user_setting
 from utils.settings import get_setting, set_setting
 from utils.tips import append_tip_to_message
 from utils.tzutil import get_server_midnight_time
 
+# A streak expires when the last counted day is more than a day (plus an hour of leeway) before today
+STREAK_EXPIRY = datetime.timedelta(days=1, hours=1)
+STREAK_EXPIRY_MS = STREAK_EXPIRY.total_seconds() * 1000
+
 
 class ChatStreakStorage:
     """Chat Streaks Storage.
@@ -40,51 +47,55 @@ class ChatStreakStorage:
     def __init__(self) -> None:
         super().__init__()
 
-    def set_streak(self, guild_id: int, member_id: int) -> tuple[str, int, int]:
+    async def set_streak(self, guild_id: int, member_id: int,
+                         midnight: datetime.datetime | None = None) -> tuple[str, int, int]:
         """Set streak
 
         Args:
             guild_id (int): Guild ID
             member_id (int): Member ID
+            midnight (datetime, optional): The server's current local midnight, looked up if not given
 
         Returns:
             str: The state of the streak
         """
 
-        res = client['ChatStreaks'].find_one({'GuildID': str(guild_id), 'MemberID': str(member_id)})
+        if midnight is None:
+            midnight = await get_server_midnight_time(guild_id)
+
+        # One round trip: the update runs server-side, restarting the streak if it's new or expired, and returns the
+        # document as it was before, which is all that's needed to work out the old and new streak
+        res = await client['ChatStreaks'].find_one_and_update(
+            {'GuildID': str(guild_id), 'MemberID': str(member_id)},
+            [{'$set': {
+                'StartTime': {'$cond': [{'$or': [
+                    {'$eq': [{'$type': '$LastMessage'}, 'missing']},
+                    {'$gt': [{'$subtract': [midnight, '$LastMessage']}, STREAK_EXPIRY_MS]}
+                ]}, midnight, '$StartTime']},
+                'LastMessage': midnight
+            }}],
+            upsert=True, return_document=ReturnDocument.BEFORE)
 
         if not res:
-            start_time = get_server_midnight_time(guild_id)
-            client['ChatStreaks'].insert_one(
-                {'GuildID': str(guild_id), 'MemberID': str(member_id), 'LastMessage': start_time,
-                 'StartTime': start_time})
-
             return "started", 0, 0
 
         last_message = res['LastMessage']
         start_time = res['StartTime']
 
         # Check for streak expiry
-        if get_server_midnight_time(guild_id) - last_message > datetime.timedelta(days=1, hours=1):
+        if midnight - last_message > STREAK_EXPIRY:
             streak = max((last_message - start_time).days, 0)
-            client['ChatStreaks'].update_one({'GuildID': str(guild_id), 'MemberID': str(member_id)}, {
-                '$set': {'LastMessage': get_server_midnight_time(guild_id),
-                         'StartTime': get_server_midnight_time(guild_id)}})
             return "expired", streak, 0
 
         before_update = (last_message - start_time).days
-
-        client['ChatStreaks'].update_one({'GuildID': str(guild_id), 'MemberID': str(member_id)},
-                                         {'$set': {'LastMessage': get_server_midnight_time(guild_id)}})
-
-        after_update = (get_server_midnight_time(guild_id) - start_time).days
+        after_update = (midnight - start_time).days
 
         if before_update != after_update:
             return "updated", before_update, after_update
 
         return "stayed", after_update, 0
 
-    def reset_streak(self, guild_id: int, member_id: int) -> None:
+    async def reset_streak(self, guild_id: int, member_id: int) -> None:
         """Reset streak
 
         Args:
@@ -92,14 +103,10 @@ class ChatStreakStorage:
             member_id (int): Member ID
         """
 
-        if client['ChatStreaks'].find_one({'GuildID': str(guild_id), 'MemberID': str(member_id)}) is None:
-            client['ChatStreaks'].insert_one({'GuildID': str(guild_id), 'MemberID': str(member_id),
-                                              'LastMessage': get_server_midnight_time(guild_id),
-                                              'StartTime': get_server_midnight_time(guild_id)})
-        else:
-            client['ChatStreaks'].update_one({'GuildID': str(guild_id), 'MemberID': str(member_id)}, {
-                '$set': {'LastMessage': get_server_midnight_time(guild_id),
-                         'StartTime': get_server_midnight_time(guild_id)}})
+        midnight = await get_server_midnight_time(guild_id)
+        await client['ChatStreaks'].update_one({'GuildID': str(guild_id), 'MemberID': str(member_id)},
+                                               {'$set': {'LastMessage': midnight, 'StartTime': midnight}},
+                                               upsert=True)
 
 
 class ChatStreaks(discord.Cog):
@@ -107,37 +114,38 @@ class ChatStreaks(discord.Cog):
         super().__init__()
         self.bot = bot
         self.streak_storage = ChatStreakStorage()
+        message_dispatcher.register("chat_streaks", self.handle_message)
 
-    @discord.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        try:
-            if message.author.bot:
-                return
+    async def handle_message(self, ctx: MessageContext):
+        message = ctx.message
 
-            (state, old_streak, new_streak) = self.streak_storage.set_streak(message.guild.id, message.author.id)
-
-            print('[Chat Streaks] Info', state, old_streak, new_streak)
-
-            if state == "expired":
-                if old_streak == 0:
-                    return
-                if get_per_user_setting(message.author.id, 'chat_streaks_alerts', 'on') == 'off':
-                    return
-                msg = await message.reply(
-                    trl(message.author.id, message.guild.id, "chat_streaks_expired").format(streak=old_streak))
-                if get_setting(msg.guild.id, 'chat_streaks_delete_sent_message_expired', '60') != '0':
-                    await msg.delete(
-                        delay=int(get_setting(msg.guild.id, 'chat_streaks_delete_sent_message_expired', '60')))
-            if state == "updated":
-                if get_per_user_setting(message.author.id, 'chat_streaks_alerts', 'on') != 'on':
-                    return  # Only trigger if the user has the setting on
-                msg = await message.reply(
-                    trl(message.author.id, message.guild.id, "chat_streaks_updated").format(streak=new_streak))
-                if get_setting(msg.guild.id, 'chat_streaks_delete_sent_message_updated', '10') != '0':
-                    await msg.delete(
-                        delay=int(get_setting(msg.guild.id, 'chat_streaks_delete_sent_message_updated', '10')))
-        except Exception as e:
-            sentry_sdk.capture_exception(e)
+        # Only the first message of the server's day changes the streak, later ones don't need the database
+        midnight = await get_server_midnight_time(message.guild.id)
+        if counted_today.is_counted(message.guild.id, message.author.id, midnight):
+            return
+
+        (state, old_streak, new_streak) = await self.streak_storage.set_streak(message.guild.id, message.author.id,
+                                                                               midnight)
+        counted_today.add(message.guild.id, message.author.id, midnight)
+
+        print('[Chat Streaks] Info', state, old_streak, new_streak)
+
+        if state == "expired":
+            if old_streak == 0:
+                return
+            if await get_per_user_setting(message.author.id, 'chat_streaks_alerts', 'on') == 'off':
+                return
+            msg = await message.reply(
+                (await ctx.locale()).trl("chat_streaks_expired").format(streak=old_streak))
+            if ctx.get_setting('chat_streaks_delete_sent_message_expired', '60') != '0':
+                await msg.delete(delay=int(ctx.get_setting('chat_streaks_delete_sent_message_expired', '60')))
+        if state == "updated":
+            if await get_per_user_setting(message.author.id, 'chat_streaks_alerts', 'on') != 'on':
+                return  # Only trigger if the user has the setting on
+            msg = await message.reply(
+                (await ctx.locale()).trl("chat_streaks_updated").format(streak=new_streak))
+            if ctx.get_setting('chat_streaks_delete_sent_message_updated', '10') != '0':
+                await msg.delete(delay=int(ctx.get_setting('chat_streaks_delete_sent_message_updated', '10')))
 
     streaks_subcommand = discord.SlashCommandGroup(name='streaks', description='Manage the chat streaks')
 
@@ -150,24 +158,26 @@ class ChatStreaks(discord.Cog):
     async def reset_streak_command(self, ctx: discord.ApplicationContext, user: discord.Member):
         try:
             # Reset streak
-            self.streak_storage.reset_streak(ctx.guild.id, user.id)
+            await self.streak_storage.reset_streak(ctx.guild.id, user.id)
+            counted_today.discard(ctx.guild.id, user.id)
 
             # Create a embed for logs
-            logging_embed = discord.Embed(title=trl(ctx.user.id, ctx.guild.id, "chat_streaks_reset_log_title"))
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "chat_streaks_reset_log_admin"),
+            logging_embed = discord.Embed(title=await trl(ctx.user.id, ctx.guild.id, "chat_streaks_reset_log_title"))
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "chat_streaks_reset_log_admin"),
                                     value=f'{ctx.user.mention}')
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_user"), value=f'{user.mention}')
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_user"), value=f'{user.mention}')
 
             # Send to log
             await log_into_logs(ctx.guild, logging_embed)
 
             # Respond
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "chat_streaks_reset_success", append_tip=True).format(user=user.mention),
+                (await trl(ctx.user.id, ctx.guild.id, "chat_streaks_reset_success",
+                           append_tip=True)).format(user=user.mention),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @streaks_subcommand.command(name="streak", description="Get someone's streak, to get yours, /streak.")
     @commands_ext.guild_only()
@@ -177,14 +187,14 @@ class ChatStreaks(discord.Cog):
     @analytics("streaks streak")
     async def get_user_streak(self, ctx: discord.ApplicationContext, user: discord.Member):
         try:
-            (_, streak, _) = self.streak_storage.set_streak(ctx.guild.id, user.id)
+            (_, streak, _) = await self.streak_storage.set_streak(ctx.guild.id, user.id)
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "chat_streaks_streak_admin", append_tip=True).format(user=user.mention,
-                                                                                                    streak=str(streak)),
+                (await trl(ctx.user.id, ctx.guild.id, "chat_streaks_streak_admin", append_tip=True)).format(
+                    user=user.mention, streak=str(streak)),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @streaks_subcommand.command(name="configure_messages", description="Configure Chat Streaks messages")
     @commands_ext.guild_only()
@@ -198,13 +208,16 @@ class ChatStreaks(discord.Cog):
     async def configure_messages(self, ctx: discord.ApplicationContext, delete_sent_message_expired: int = -1,
                                  delete_sent_message_updated: int = -1):
         try:
-            prev_expired = get_setting(ctx.guild.id, 'chat_streaks_delete_sent_message_expired', '60')
-            prev_updated = get_setting(ctx.guild.id, 'chat_streaks_delete_sent_message_updated', '10')
+            prev_expired = await get_setting(ctx.guild.id, 'chat_streaks_delete_sent_message_expired', '60')
+            prev_updated = await get_setting(ctx.guild.id, 'chat_streaks_delete_sent_message_updated', '10')
 
-            set_setting(ctx.guild.id, 'chat_streaks_delete_sent_message_expired', str(delete_sent_message_expired))
-            set_setting(ctx.guild.id, 'chat_streaks_delete_sent_message_updated', str(delete_sent_message_updated))
+            await set_setting(ctx.guild.id, 'chat_streaks_delete_sent_message_expired',
+                              str(delete_sent_message_expired))
+            await set_setting(ctx.guild.id, 'chat_streaks_delete_sent_message_updated',
+                              str(delete_sent_message_updated))
 
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "chat_streaks_configure_messages_success"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "chat_streaks_configure_messages_success"),
+                              ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
@@ -212,13 +225,13 @@ class ChatStreaks(discord.Cog):
     @analytics("streak")
     async def get_streak_command(self, ctx: discord.ApplicationContext):
         try:
-            (_, streak, _) = self.streak_storage.set_streak(ctx.guild.id, ctx.user.id)
+            (_, streak, _) = await self.streak_storage.set_streak(ctx.guild.id, ctx.user.id)
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "chat_streaks_streak", append_tip=True).format(streak=streak),
+                (await trl(ctx.user.id, ctx.guild.id, "chat_streaks_streak", append_tip=True)).format(streak=streak),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     # Leaderboard
 
@@ -227,7 +240,7 @@ class ChatStreaks(discord.Cog):
     @analytics("streaks leaderboard")
     async def streaks_lb(self, ctx: discord.ApplicationContext):
         try:
-            rows = client['ChatStreaks'].aggregate([
+            rows = await client['ChatStreaks'].aggregate([
                 {
                     "$match": {"GuildID": str(ctx.guild.id)}
                 },
@@ -243,7 +256,7 @@ class ChatStreaks(discord.Cog):
 
             lb_pages = []
             lb_last = False
-            message = trl(ctx.user.id, ctx.guild.id, "chat_streak_leaderboard_title")
+            message = await trl(ctx.user.id, ctx.guild.id, "chat_streak_leaderboard_title")
 
             i = 1
             for _, row in enumerate(rows):
@@ -253,25 +266,24 @@ class ChatStreaks(discord.Cog):
 
                 days = int(row['MaxStreak'])
 
-                message += trl(ctx.user.id, ctx.guild.id, "chat_streak_leaderboard_line").format(position=i,
-                                                                                                 user=member.mention,
-                                                                                                 days=str(days))
+                message += (await trl(ctx.user.id, ctx.guild.id, "chat_streak_leaderboard_line")).format(
+                    position=i, user=member.mention, days=str(days))
 
                 i += 1
                 lb_last = True
 
                 if i % 10 == 0:
-                    if get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
-                        language = get_language(ctx.guild.id, ctx.user.id)
+                    if await get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
+                        language = await get_language(ctx.guild.id, ctx.user.id)
                         message = append_tip_to_message(ctx.guild.id, ctx.user.id, message, language)
 
                     lb_pages.append(message)
-                    message = trl(ctx.user.id, ctx.guild.id, "chat_streak_leaderboard_title")
+                    message = await trl(ctx.user.id, ctx.guild.id, "chat_streak_leaderboard_title")
                     lb_last = False
 
             if not lb_last:
-                if get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
-                    language = get_language(ctx.guild.id, ctx.user.id)
+                if await get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
+                    language = await get_language(ctx.guild.id, ctx.user.id)
                     message = append_tip_to_message(ctx.guild.id, ctx.user.id, message, language)
 
                 lb_pages.append(message)
@@ -280,4 +292,4 @@ class ChatStreaks(discord.Cog):
             await resp.respond(ctx.interaction, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
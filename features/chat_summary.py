@@ -15,52 +15,137 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import asyncio
 import datetime
+import time
 
 import discord
 import sentry_sdk
 from discord.ext import commands as commands_ext
-from discord.ext import tasks
 
 from database import client
 from utils.analytics import analytics
+from utils.deadline_scheduler import DeadlineScheduler
 from utils.languages import get_translation_for_key_localized as trl
 from utils.logging_util import log_into_logs
+from utils.message_dispatch import message_dispatcher, MessageContext
 from utils.settings import get_setting, set_setting
-from utils.tzutil import get_now_for_server
+from utils.tzutil import get_timezone_offset, get_timezone_offsets, next_midnight_timestamp, now_for_offset
+from utils.write_behind import write_behind
+
+
+# Daily counters are kept for this long after the day ends, then MongoDB's TTL monitor deletes them
+COUNTER_RETENTION = datetime.timedelta(days=3)
+
+
+def get_day_bucket(local_time: datetime.datetime) -> str:
+    """Get the key of the daily counters a server's local time belongs to"""
+    return local_time.strftime('%Y-%m-%d')
+
+
+async def count_message(message: discord.Message):
+    """Count a message into the channel's counters for the server's current day
+
+    Every day has its own documents: one with the channel's message count in ChatSummaryDays, and one per author in
+    ChatSummaryCounts. A new day starts new documents, so nothing has to be reset and no document grows with the
+    number of authors.
+    """
+    local_now = now_for_offset(await get_timezone_offset(message.guild.id), datetime.datetime.now(datetime.UTC))
+    query = {'GuildID': str(message.guild.id), 'ChannelID': str(message.channel.id), 'Day': get_day_bucket(local_now)}
+    expire_at = {'ExpireAt': datetime.datetime.now(datetime.UTC) + COUNTER_RETENTION}
+
+    write_behind.inc('ChatSummaryDays', query, {'MessageCount': 1}, upsert=True, set_on_insert=expire_at)
+    write_behind.inc('ChatSummaryCounts', {**query, 'UserID': str(message.author.id)}, {'Count': 1}, upsert=True,
+                     set_on_insert=expire_at)
+
+
+async def get_top_members(guild_id: int, channel_id: int, day: str, count: int) -> tuple[int, list[dict]]:
+    """Get a channel's message count and its most active members for a day
+
+    Args:
+        guild_id (int): Guild ID
+        channel_id (int): Channel ID
+        day (str): Day bucket, see `get_day_bucket`
+        count (int): Number of members to get
+
+    Returns:
+        tuple: Total messages, and up to `count` counter documents sorted by most messages
+    """
+    query = {'GuildID': str(guild_id), 'ChannelID': str(channel_id), 'Day': day}
+    total = await client['ChatSummaryDays'].find_one(query)
+    # Walks the (GuildID, ChannelID, Day, Count) index, so only the top `count` documents are read
+    top = await client['ChatSummaryCounts'].find(query, sort=[('Count', -1), ('UserID', 1)], limit=count).to_list()
+    return (total or {}).get('MessageCount', 0), top
 
 
 class ChatSummary(discord.Cog):
     def __init__(self, bot: discord.Bot) -> None:
         super().__init__()
         self.bot = bot
+        self.scheduler = DeadlineScheduler()
+        self.scheduler_task = None
+        message_dispatcher.register("chat_summary", self.handle_message)
 
     @discord.Cog.listener()
     async def on_ready(self):
-        self.summarize.start()
+        if self.scheduler_task is None or self.scheduler_task.done():
+            self.scheduler_task = asyncio.create_task(self.run_scheduler())
 
     @discord.Cog.listener()
-    async def on_message(self, message: discord.Message):
+    async def on_timezone_change(self, guild_id: int):
+        if str(guild_id) in self.scheduler.deadlines:
+            await self.schedule_guild(guild_id)
+
+    async def schedule_guild(self, guild_id: int | str):
+        """Schedule a server's summaries for its next local midnight"""
+        tz_offset = await get_timezone_offset(guild_id)
+        self.scheduler.schedule(str(guild_id), next_midnight_timestamp(tz_offset, time.time()))
+
+    async def migrate_counters(self):
+        """Move the counters channel documents had before the daily buckets into the server's current day, so the
+        day's summary still counts the messages sent before the update"""
+        documents = await client['ChatSummary'].find({'Messages': {'$exists': True}}).to_list()
+        if not documents:
+            return
+
+        now = datetime.datetime.now(datetime.UTC)
+        expire_at = {'ExpireAt': now + COUNTER_RETENTION}
+        tz_offsets = await get_timezone_offsets([i['GuildID'] for i in documents])
+        for i in documents:
+            query = {'GuildID': i['GuildID'], 'ChannelID': i['ChannelID'],
+                     'Day': get_day_bucket(now_for_offset(tz_offsets[i['GuildID']], now))}
+            if i.get('MessageCount'):
+                await client['ChatSummaryDays'].update_one(
+                    query, {'$inc': {'MessageCount': i['MessageCount']}, '$setOnInsert': expire_at}, upsert=True)
+            for user_id, count in (i['Messages'] or {}).items():
+                await client['ChatSummaryCounts'].update_one(
+                    {**query, 'UserID': user_id}, {'$inc': {'Count': count}, '$setOnInsert': expire_at}, upsert=True)
+            await client['ChatSummary'].update_one({'_id': i['_id']}, {'$unset': {'Messages': '', 'MessageCount': ''}})
+
+    async def run_scheduler(self):
+        """Sleep until the next server reaches midnight, then summarize that server's channels"""
         try:
-            if message.guild is None:
-                return
-
-            if message.author.bot:
-                return
+            await self.migrate_counters()
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
 
-            if client['ChatSummary'].count_documents(
-                    {'GuildID': str(message.guild.id), 'ChannelID': str(message.channel.id)}) == 0:
-                client['ChatSummary'].insert_one({
-                    'GuildID': str(message.guild.id),
-                    'ChannelID': str(message.channel.id),
-                    'Enabled': False,
-                    'MessageCount': 0
-                })
-
-            client['ChatSummary'].update_one({'GuildID': str(message.guild.id), 'ChannelID': str(message.channel.id)},
-                                             {'$inc': {f'Messages.{message.author.id}': 1, 'MessageCount': 1}})
+        try:
+            guild_ids = await client['ChatSummary'].distinct('GuildID', {'Enabled': True})
         except Exception as e:
             sentry_sdk.capture_exception(e)
+            guild_ids = []
+
+        # Only servers with chat summary enabled are scheduled, channels are loaded once the server's midnight comes
+        now = time.time()
+        for guild_id, tz_offset in (await get_timezone_offsets(guild_ids)).items():
+            self.scheduler.schedule(guild_id, next_midnight_timestamp(tz_offset, now))
+
+        while True:
+            for guild_id in await self.scheduler.wait():
+                await self.summarize(guild_id)
+
+    async def handle_message(self, ctx: MessageContext):
+        await count_message(ctx.message)
 
     @discord.Cog.listener()
     async def on_message_edit(self, old_message: discord.Message, new_message: discord.Message):
@@ -71,39 +156,38 @@ class ChatSummary(discord.Cog):
             if new_message.author.bot:
                 return
 
-            countedits = get_setting(new_message.guild.id, "chatsummary_countedits", "False")
+            countedits = await get_setting(new_message.guild.id, "chatsummary_countedits", "False")
             if countedits == "False":
                 return
 
-            if client['ChatSummary'].count_documents(
-                    {'GuildID': str(new_message.guild.id), 'ChannelID': str(new_message.channel.id)}) == 0:
-                client['ChatSummary'].insert_one({
-                    'GuildID': str(new_message.guild.id),
-                    'ChannelID': str(new_message.channel.id),
-                    'Enabled': False,
-                    'MessageCount': 0
-                })
-
-            client['ChatSummary'].update_one(
-                {'GuildID': str(new_message.guild.id), 'ChannelID': str(new_message.channel.id)},
-                {'$inc': {f'Messages.{new_message.author.id}': 1, 'MessageCount': 1}})
+            await count_message(new_message)
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
-    @tasks.loop(minutes=1)
-    async def summarize(self):
+    async def summarize(self, guild_id: str):
         try:
-            res = client['ChatSummary'].find({'Enabled': True}).to_list()
-            for i in res:
-                yesterday = get_now_for_server(i['GuildID'])
+            tz_offset = await get_timezone_offset(guild_id)
+            local_now = now_for_offset(tz_offset, datetime.datetime.now(datetime.UTC))
+            if local_now.hour != 0:
+                # Woke up at the wrong time, the timezone changed without a timezone_change event (another process)
+                await self.schedule_guild(guild_id)
+                return
 
-                if yesterday.hour != 0 or yesterday.minute != 0:
-                    continue
+            res = await client['ChatSummary'].find({'GuildID': guild_id, 'Enabled': True}).to_list()
+            if not res:
+                return  # Every channel was removed, don't schedule the server again
 
-                guild = self.bot.get_guild(int(i['GuildID']))
-                if guild is None:
-                    continue
+            await self.schedule_guild(guild_id)
+
+            # Counts still buffered in memory belong to the day being summarized
+            await write_behind.flush()
+
+            guild = self.bot.get_guild(int(guild_id))
+            if guild is None:
+                return
 
+            yesterday = local_now - datetime.timedelta(days=1)  # Get yesterday
+            for i in res:
                 channel = guild.get_channel(int(i['ChannelID']))
                 if channel is None:
                     continue
@@ -111,10 +195,8 @@ class ChatSummary(discord.Cog):
                 if not channel.can_send():
                     continue
 
-                yesterday = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=1)  # Get yesterday
-
                 # Get date format
-                date_format = get_setting(guild.id, "chatsummary_dateformat", "YYYY/MM/DD")
+                date_format = await get_setting(guild.id, "chatsummary_dateformat", "YYYY/MM/DD")
 
                 # Better formatting for day
                 day = str(yesterday.day)
@@ -140,36 +222,28 @@ class ChatSummary(discord.Cog):
                 else:
                     date = f"{yesterday.year}/{month}/{day}"
 
-                chat_summary_message = trl(0, guild.id, "chat_summary_title").format(date=date)
-                chat_summary_message += '\n'
-                chat_summary_message += trl(0, guild.id, "chat_summary_messages").format(
-                    messages=str(i['MessageCount']))
+                top_count = max(int(await get_setting(guild.id, "chatsummary_top_count", 5)), 1)
+                message_count, top_members = await get_top_members(guild.id, channel.id, get_day_bucket(yesterday),
+                                                                   top_count)
 
-                top_members = {k: v for k, v in sorted(i['Messages'].items(), key=lambda item: item[1], reverse=True)}
+                chat_summary_message = (await trl(0, guild.id, "chat_summary_title")).format(date=date)
+                chat_summary_message += '\n'
+                chat_summary_message += (await trl(0, guild.id, "chat_summary_messages")).format(
+                    messages=str(message_count))
 
-                j = 0  # idk
-                for k, v in top_members.items():
-                    j += 1
-                    member = guild.get_member(int(k))
+                for j, counter in enumerate(top_members, start=1):
+                    member = guild.get_member(int(counter['UserID']))
                     if member is not None:
-                        chat_summary_message += trl(0, guild.id, "chat_summary_line").format(position=j,
-                                                                                             name=member.display_name,
-                                                                                             messages=v)
+                        chat_summary_message += (await trl(0, guild.id, "chat_summary_line")).format(
+                            position=j, name=member.display_name, messages=counter['Count'])
                     else:
-                        chat_summary_message += trl(0, guild.id, "chat_summary_line_unknown_user").format(position=j,
-                                                                                                          id=k,
-                                                                                                          messages=v)
-
-                    if j >= int(get_setting(guild.id, "chatsummary_top_count", 5)):
-                        break
+                        chat_summary_message += (await trl(0, guild.id, "chat_summary_line_unknown_user")).format(
+                            position=j, id=counter['UserID'], messages=counter['Count'])
 
                 try:
                     await channel.send(chat_summary_message)
                 except Exception as e:
                     sentry_sdk.capture_exception(e)
-
-                client['ChatSummary'].update_one({'GuildID': str(guild.id), 'ChannelID': str(channel.id)},
-                                                 {'$set': {'Messages': {}, 'MessageCount': 0}})
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
@@ -184,25 +258,29 @@ class ChatSummary(discord.Cog):
     @analytics("chatsummary add")
     async def command_add(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
         try:
-            res = client['ChatSummary'].update_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)},
-                                                   {'$set': {'Enabled': True}})
-            if res.modified_count == 0:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "chat_summary_add_already_added"), ephemeral=True)
+            res = await client['ChatSummary'].find_one_and_update(
+                {'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)}, {'$set': {'Enabled': True}}, upsert=True)
+            if res is not None and res.get('Enabled'):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "chat_summary_add_already_added"),
+                                  ephemeral=True)
                 return
 
+            await self.schedule_guild(ctx.guild.id)
+
             # Logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "chat_summary_add_log_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_channel"), value=f"{channel.mention}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "chat_summary_add_log_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_channel"), value=f"{channel.mention}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
 
             # Log into logs
             await log_into_logs(ctx.guild, logging_embed)
 
             # Send response
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "chat_summary_add_added", append_tip=True), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "chat_summary_add_added", append_tip=True),
+                              ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @chat_summary_subcommand.command(name="remove", description="Remove a channel from being counted to chat summary")
     @commands_ext.guild_only()
@@ -211,27 +289,28 @@ class ChatSummary(discord.Cog):
     @analytics("chatsummary remove")
     async def command_remove(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
         try:
-            res = client['ChatSummary'].update_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)},
-                                                   {'$set': {'Enabled': False}})
+            res = await client['ChatSummary'].update_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)},
+                                                         {'$set': {'Enabled': False}})
             if res.modified_count == 0:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, 'chat_summary_remove_already_removed'), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, 'chat_summary_remove_already_removed'),
+                                  ephemeral=True)
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(ctx.user.id, ctx.guild.id, "chat_summary_remove_log_title"))
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_channel"),
+            logging_embed = discord.Embed(title=await trl(ctx.user.id, ctx.guild.id, "chat_summary_remove_log_title"))
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_channel"),
                                     value=f"{channel.mention}")
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_user"),
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_user"),
                                     value=f"{ctx.user.mention}")
 
             # Send
             await log_into_logs(ctx.guild, logging_embed)
 
             # Respond
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "chat_summary_remove_removed", append_tip=True),
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "chat_summary_remove_removed", append_tip=True),
                               ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @chat_summary_subcommand.command(name="dateformat", description="Set the date format of Chat Streak messages.")
     @commands_ext.guild_only()
@@ -243,16 +322,16 @@ class ChatSummary(discord.Cog):
     async def summary_dateformat(self, ctx: discord.ApplicationContext, date_format: str):
         try:
             # Get old setting
-            old_date_format = get_setting(ctx.guild.id, "chatsummary_dateformat", "YYYY/MM/DD")
+            old_date_format = await get_setting(ctx.guild.id, "chatsummary_dateformat", "YYYY/MM/DD")
 
             # Save setting
-            set_setting(ctx.guild.id, "chatsummary_dateformat", date_format)
+            await set_setting(ctx.guild.id, "chatsummary_dateformat", date_format)
 
             # Create logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "chat_summary_dateformat_log_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "chat_summary_dateformat_log_dateformat"),
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "chat_summary_dateformat_log_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "chat_summary_dateformat_log_dateformat"),
                                     value=f"{old_date_format} -> {date_format}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"),
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"),
                                     value=f"{ctx.user.mention}")
 
             # Send
@@ -260,12 +339,12 @@ class ChatSummary(discord.Cog):
 
             # Respond
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "chat_summary_dateformat_set", append_tip=True).format(
+                (await trl(ctx.user.id, ctx.guild.id, "chat_summary_dateformat_set", append_tip=True)).format(
                     format=date_format),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @chat_summary_subcommand.command(name="countedits",
                                      description="Enable or disable counting of message edits as sent messages.")
@@ -276,17 +355,17 @@ class ChatSummary(discord.Cog):
     async def chatsummary_countedits(self, ctx: discord.ApplicationContext, countedits: bool):
         try:
             # Get old setting
-            old_count_edits = get_setting(ctx.guild.id, "chatsummary_count_edits", str(False))
+            old_count_edits = await get_setting(ctx.guild.id, "chatsummary_count_edits", str(False))
 
             # Save setting
-            set_setting(ctx.guild.id, "chatsummary_countedits", str(countedits))
+            await set_setting(ctx.guild.id, "chatsummary_countedits", str(countedits))
 
             # Create logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "chat_summary_count_edits_log_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "chat_summary_count_edits_log_count_edits"),
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "chat_summary_count_edits_log_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "chat_summary_count_edits_log_count_edits"),
                                     value="{old} -> {new}".format(old=("Yes" if old_count_edits == "True" else "No"),
                                                                   new=("Yes" if countedits else "No")))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"),
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"),
                                     value=f"{ctx.user.mention}")
 
             # Send
@@ -294,12 +373,12 @@ class ChatSummary(discord.Cog):
 
             # Respond
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "chat_summary_count_edits_on", append_tip=True) if countedits else
-                trl(ctx.user.id, ctx.guild.id, "chat_summary_count_edits_off", append_tip=True),
+                await trl(ctx.user.id, ctx.guild.id, "chat_summary_count_edits_on", append_tip=True) if countedits else
+                await trl(ctx.user.id, ctx.guild.id, "chat_summary_count_edits_off", append_tip=True),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     # The commented code below is for testing purposes
     # @chat_summary_subcommand.command(name="test", description="Test command for testing purposes")
@@ -17,6 +17,12 @@
 
 import discord
 
+from utils.audit_log_cache import audit_log_cache
+from utils.counted_today import counted_today
+from utils.language_cache import language_cache
+from utils.message_dispatch import message_dispatcher
+from utils.settings import settings_cache
+from utils.translation_catalog import catalog
 from utils.tzutil import get_now_for_server
 
 
@@ -32,4 +38,37 @@ class DebugCommands(discord.Cog):
 
     @dev_commands_group.command(name="now", description="Get now for server")
     async def now(self, ctx: discord.ApplicationContext):
-        await ctx.respond(f"Current time: {get_now_for_server(ctx.guild.id).isoformat()}", ephemeral=True)
+        await ctx.respond(f"Current time: {(await get_now_for_server(ctx.guild.id)).isoformat()}", ephemeral=True)
+
+    @dev_commands_group.command(name="cache_stats", description="Get cache hit and miss counters")
+    async def cache_stats(self, ctx: discord.ApplicationContext):
+        settings_stats = settings_cache.stats()
+        audit_log_stats = audit_log_cache.stats()
+        language_stats = language_cache.stats()
+        streak_stats = counted_today.stats()
+        await ctx.respond(f"Server settings: {settings_stats['hits']} hits, {settings_stats['misses']} misses "
+                          f"({settings_stats['hit_ratio']:.1%} hit ratio), {settings_stats['invalidations']} "
+                          f"invalidations, {settings_stats['cached_guilds']} servers cached\n"
+                          f"Audit log: {audit_log_stats['hits']} hits, {audit_log_stats['misses']} REST fallbacks "
+                          f"({audit_log_stats['hit_ratio']:.1%} hit ratio), {audit_log_stats['cached_entries']} "
+                          f"entries cached\n"
+                          f"Languages: {language_stats['hits']} hits, {language_stats['misses']} misses "
+                          f"({language_stats['hit_ratio']:.1%} hit ratio), {language_stats['cached']} entries cached\n"
+                          f"Chat streaks counted today: {streak_stats['hits']} hits, {streak_stats['misses']} misses "
+                          f"({streak_stats['hit_ratio']:.1%} hit ratio), {streak_stats['members']} members in "
+                          f"{streak_stats['guilds']} servers, {streak_stats['memory'] / 1024 / 1024:.1f} MiB",
+                          ephemeral=True)
+
+    @dev_commands_group.command(name="reload_translations", description="Reload the language files")
+    async def reload_translations(self, ctx: discord.ApplicationContext):
+        reloaded = await catalog.reload(force=True)
+        await ctx.respond(f"Reloaded {len(catalog.languages)} languages" if reloaded else
+                          "Language files aren't valid, kept the loaded translations", ephemeral=True)
+
+    @dev_commands_group.command(name="message_stats", description="Get message handler timings")
+    async def message_stats(self, ctx: discord.ApplicationContext):
+        msg = ""
+        for name, stats in message_dispatcher.stats().items():
+            msg += (f"{name}: {stats['calls']} calls, {stats['errors']} errors, {stats['average'] * 1000:.1f} ms "
+                    f"average, {stats['max'] * 1000:.1f} ms max\n")
+        await ctx.respond(msg or "No message handlers", ephemeral=True)
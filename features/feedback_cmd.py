@@ -48,12 +48,10 @@ class PrivacyPolicyView(discord.ui.View):
 
 
 class BugReportModal(discord.ui.Modal):
-    def __init__(self, user_id: int) -> None:
+    def __init__(self, user_id: int, title: str, description: str) -> None:
         super().__init__(title="Bug Report", timeout=600)
 
         self.user_id = user_id
-        title = trl(user_id, 0, "title")
-        description = trl(user_id, 0, "description")
         self.title_input = InputText(label=title, style=discord.InputTextStyle.short, max_length=100, min_length=8,
                                      required=True)
         self.description_input = InputText(label=description, style=discord.InputTextStyle.long, max_length=1000,
@@ -91,7 +89,7 @@ class BugReportModal(discord.ui.Modal):
                                                             ephemeral=True)
                     return
         await interaction.response.send_message(
-            trl(self.user_id, 0, "feedback_bug_report_submitted", append_tip=True), ephemeral=True)
+            await trl(self.user_id, 0, "feedback_bug_report_submitted", append_tip=True), ephemeral=True)
 
     async def submit_bug_report_on_gitlab(self, interaction: discord.Interaction):
         issue_body = ("- This bug report was created by {display} ({user} {id}) on Discord\n\n"
@@ -113,7 +111,8 @@ class BugReportModal(discord.ui.Modal):
             'labels': ['bug', 'in-bot']
         })
 
-        await interaction.response.send_message(trl(self.user_id, 0, "feedback_feature_submitted", append_tip=True),
+        await interaction.response.send_message(await trl(self.user_id, 0, "feedback_feature_submitted",
+                                                          append_tip=True),
                                                 ephemeral=True)
 
     async def submit_bug_report_on_forgejo(self, interaction):
@@ -141,7 +140,7 @@ class BugReportModal(discord.ui.Modal):
                                     }) as r:
                 if r.ok:
                     await interaction.response.send_message(
-                        trl(self.user_id, 0, "feedback_bug_report_submitted", append_tip=True),
+                        await trl(self.user_id, 0, "feedback_bug_report_submitted", append_tip=True),
                         ephemeral=True)
                 else:
                     await interaction.response.send_message(f"Failed to submit bug report: {await r.text()}",
@@ -164,16 +163,14 @@ class BugReportModal(discord.ui.Modal):
 
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await interaction.response.send_message(trl(self.user_id, 0, "command_error_generic"), ephemeral=True)
+            await interaction.response.send_message(await trl(self.user_id, 0, "command_error_generic"), ephemeral=True)
 
 
 class FeatureModal(discord.ui.Modal):
-    def __init__(self, user_id: int) -> None:
+    def __init__(self, user_id: int, form_title: str, title: str, description: str) -> None:
         self.user_id = user_id
-        super().__init__(title=trl(user_id, 0, "feedback_feature_form_title"), timeout=600)
+        super().__init__(title=form_title, timeout=600)
 
-        title = trl(user_id, 0, "title")
-        description = trl(user_id, 0, "description")
         self.title_input = InputText(label=title, style=discord.InputTextStyle.short, max_length=100, min_length=8,
                                      required=True)
         self.description_input = InputText(label=description, style=discord.InputTextStyle.long, max_length=1000,
@@ -210,7 +207,8 @@ class FeatureModal(discord.ui.Modal):
                     await interaction.response.send_message(
                         f"Failed to submit feature request: {await response.text()}", ephemeral=True)
                     return
-        await interaction.response.send_message(trl(self.user_id, 0, "feedback_feature_submitted", append_tip=True),
+        await interaction.response.send_message(await trl(self.user_id, 0, "feedback_feature_submitted",
+                                                          append_tip=True),
                                                 ephemeral=True)
 
     async def submit_feature_on_gitlab(self, interaction: discord.Interaction):
@@ -233,7 +231,8 @@ class FeatureModal(discord.ui.Modal):
             'labels': ['suggestion', 'in-bot']
         })
 
-        await interaction.response.send_message(trl(self.user_id, 0, "feedback_feature_submitted", append_tip=True),
+        await interaction.response.send_message(await trl(self.user_id, 0, "feedback_feature_submitted",
+                                                          append_tip=True),
                                                 ephemeral=True)
 
     async def submit_feature_on_forgejo(self, interaction):
@@ -261,7 +260,7 @@ class FeatureModal(discord.ui.Modal):
                                     }) as r:
                 if r.ok:
                     await interaction.response.send_message(
-                        trl(self.user_id, 0, "feedback_feature_submitted", append_tip=True),
+                        await trl(self.user_id, 0, "feedback_feature_submitted", append_tip=True),
                         ephemeral=True)
                 else:
                     await interaction.response.send_message(f"Failed to submit feature request: {await r.text()}",
@@ -284,55 +283,55 @@ class FeatureModal(discord.ui.Modal):
 
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await interaction.response.send_message(trl(self.user_id, 0, "command_error_generic"), ephemeral=True)
+            await interaction.response.send_message(await trl(self.user_id, 0, "command_error_generic"), ephemeral=True)
 
 
 class ConfirmSubmitBugReport(discord.ui.View):
-    def __init__(self, user_id: int):
+    def __init__(self, user_id: int, agree_label: str, prefer_github_label: str):
         super().__init__()
         self.user_id = user_id
 
-        self.agree_button = discord.ui.Button(label=trl(user_id, 0, "feedback_agree"))
+        self.agree_button = discord.ui.Button(label=agree_label)
         self.agree_button.callback = self.submit
         self.add_item(self.agree_button)
 
-        self.cancel_github = discord.ui.Button(label=trl(user_id, 0, "feedback_prefer_github"),
-                                               style=discord.ButtonStyle.secondary)
+        self.cancel_github = discord.ui.Button(label=prefer_github_label, style=discord.ButtonStyle.secondary)
         self.cancel_github.callback = self.cancel_gh
         self.add_item(self.cancel_github)
 
     async def submit(self, interaction: discord.Interaction):
-        modal = BugReportModal(self.user_id)
+        modal = BugReportModal(self.user_id, await trl(self.user_id, 0, "title"),
+                               await trl(self.user_id, 0, "description"))
         await interaction.response.send_modal(modal)
 
     async def cancel_gh(self, interaction: discord.Interaction):
         self.disable_all_items()
         await interaction.respond(
-            trl(self.user_id, 0, "feedback_bug_report_direct", append_tip=True),
+            await trl(self.user_id, 0, "feedback_bug_report_direct", append_tip=True),
             ephemeral=True)
 
 
 class ConfirmSubmitFeatureRequest(discord.ui.View):
-    def __init__(self, user_id: int):
+    def __init__(self, user_id: int, agree_label: str, prefer_github_label: str):
         super().__init__()
         self.user_id = user_id
 
-        self.agree_button = discord.ui.Button(label=trl(user_id, 0, "feedback_agree"))
+        self.agree_button = discord.ui.Button(label=agree_label)
         self.agree_button.callback = self.submit
         self.add_item(self.agree_button)
 
-        self.cancel_github = discord.ui.Button(label=trl(user_id, 0, "feedback_prefer_github"),
-                                               style=discord.ButtonStyle.secondary)
+        self.cancel_github = discord.ui.Button(label=prefer_github_label, style=discord.ButtonStyle.secondary)
         self.cancel_github.callback = self.cancel_gh
         self.add_item(self.cancel_github)
 
     async def submit(self, interaction: discord.Interaction):
-        modal = FeatureModal(self.user_id)
+        modal = FeatureModal(self.user_id, await trl(self.user_id, 0, "feedback_feature_form_title"),
+                             await trl(self.user_id, 0, "title"), await trl(self.user_id, 0, "description"))
         await interaction.response.send_modal(modal)
 
     async def cancel_gh(self, interaction: discord.Interaction):
         await interaction.respond(
-            trl(self.user_id, 0, "feedback_feature_direct", append_tip=True),
+            await trl(self.user_id, 0, "feedback_feature_direct", append_tip=True),
             ephemeral=True)
 
 
@@ -352,13 +351,14 @@ class SupportCmd(discord.Cog):
     @discord.slash_command(name="website", help="Get the website link")
     @analytics("website")
     async def website(self, ctx: discord.ApplicationContext):
-        await ctx.respond(trl(ctx.user.id, ctx.guild.id, "feedback_visit_website", append_tip=True), ephemeral=True)
+        await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "feedback_visit_website", append_tip=True),
+                          ephemeral=True)
 
     @discord.slash_command(name="vote", description="Vote on the bot")
     @analytics("vote")
     async def vote(self, ctx: discord.ApplicationContext):
         await ctx.respond(
-            trl(ctx.user.id, ctx.guild.id, "feedback_vote", append_tip=True),
+            await trl(ctx.user.id, ctx.guild.id, "feedback_vote", append_tip=True),
             view=VoteView(),
             ephemeral=True
         )
@@ -367,7 +367,7 @@ class SupportCmd(discord.Cog):
     @analytics("privacy policy")
     async def privacy_policy(self, ctx: discord.ApplicationContext):
         await ctx.respond(
-            trl(ctx.user.id, ctx.guild.id, "feedback_privacy_policy", append_tip=True),
+            await trl(ctx.user.id, ctx.guild.id, "feedback_privacy_policy", append_tip=True),
             view=PrivacyPolicyView(),
             ephemeral=True
         )
@@ -375,7 +375,7 @@ class SupportCmd(discord.Cog):
     @discord.slash_command(name="donate", description="Donate to the bot to support it")
     @analytics("donate")
     async def donate(self, ctx: discord.ApplicationContext):
-        await ctx.respond(trl(ctx.user.id, ctx.guild.id, "feedback_donate", append_tip=True), ephemeral=True)
+        await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "feedback_donate", append_tip=True), ephemeral=True)
 
     @discord.slash_command(name='support_discord', description='Support Discord server link')
     async def support_discord(self, ctx: discord.ApplicationContext):
@@ -421,10 +421,11 @@ This is due to recent raids and attacks on the server due to the developer leavi
 
                 await ctx.respond(changelog, ephemeral=True)
             else:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "feedback_changelog_invalid_version"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "feedback_changelog_invalid_version"),
+                                  ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     feedback_subcommand = discord.SlashCommandGroup(name="feedback", description="Give feedback for the bot")
 
@@ -432,19 +433,22 @@ This is due to recent raids and attacks on the server due to the developer leavi
     @cmds_ext.cooldown(1, 300, cmds_ext.BucketType.user)
     @analytics("feedback bug")
     async def report_bug(self, ctx: discord.ApplicationContext):
-        await ctx.respond(content=trl(ctx.user.id, ctx.guild.id, "feedback_bug_report_disclaimer", append_tip=True),
+        await ctx.respond(content=await trl(ctx.user.id, ctx.guild.id, "feedback_bug_report_disclaimer",
+                                            append_tip=True),
                           ephemeral=True,
-                          view=ConfirmSubmitBugReport(ctx.user.id))
+                          view=ConfirmSubmitBugReport(ctx.user.id, await trl(ctx.user.id, 0, "feedback_agree"),
+                                                      await trl(ctx.user.id, 0, "feedback_prefer_github")))
 
     @feedback_subcommand.command(name="feature", description="Suggest a feature")
     @cmds_ext.cooldown(1, 300, cmds_ext.BucketType.user)
     @analytics("feedback feature")
     async def suggest_feature(self, ctx: discord.ApplicationContext):
-        await ctx.respond(content=trl(ctx.user.id, ctx.guild.id, "feedback_feature_disclaimer", append_tip=True),
+        await ctx.respond(content=await trl(ctx.user.id, ctx.guild.id, "feedback_feature_disclaimer", append_tip=True),
                           ephemeral=True,
-                          view=ConfirmSubmitFeatureRequest(ctx.user.id))
+                          view=ConfirmSubmitFeatureRequest(ctx.user.id, await trl(ctx.user.id, 0, "feedback_agree"),
+                                                           await trl(ctx.user.id, 0, "feedback_prefer_github")))
 
     @discord.slash_command(name="about", description="Get information about the bot")
     @analytics("about")
     async def about(self, ctx: discord.ApplicationContext):
-        await ctx.respond(trl(ctx.user.id, ctx.guild.id, "feedback_about", append_tip=True), ephemeral=True)
+        await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "feedback_about", append_tip=True), ephemeral=True)
@@ -15,22 +15,88 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import asyncio
 import datetime
 import random
+import time
 
 import discord
+import pymongo
 import sentry_sdk
 from bson import ObjectId
 from discord.ext import commands as commands_ext
-from discord.ext import tasks
+from pymongo import UpdateOne
 
 from database import client
 from utils.analytics import analytics
+from utils.config import get_key
 from utils.generic import pretty_time_delta
 from utils.languages import get_translation_for_key_localized as trl, get_language
 from utils.per_user_settings import get_per_user_setting
 from utils.tips import append_tip_to_message
-from utils.tzutil import get_now_for_server
+from utils.tzutil import get_now_for_server, get_timezone_offset
+
+
+# How long to wait before trying to end a giveaway again, when its channel isn't available
+RETRY_INTERVAL = datetime.timedelta(minutes=1)
+
+
+async def get_end_timestamp(giveaway: dict) -> float:
+    """Get the UNIX timestamp a giveaway ends at"""
+    if 'EndTime' in giveaway:
+        return giveaway['EndTime'].replace(tzinfo=datetime.UTC).timestamp()
+
+    # Not migrated yet, EndDate is in the server's timezone
+    offset = await get_timezone_offset(giveaway['GuildID']) if 'GuildID' in giveaway else 0
+    end_date = datetime.datetime.fromisoformat(giveaway['EndDate']) - datetime.timedelta(hours=offset)
+    return end_date.replace(tzinfo=datetime.UTC).timestamp()
+
+
+async def add_participant(message_id: str, user_id: str):
+    """Enter a user into the giveaway of a message, entering twice does nothing"""
+    giveaway = await client['Giveaways'].find_one({'MessageID': message_id}, projection={'_id': True})
+    if giveaway is None:
+        return
+
+    res = await client['GiveawayParticipants'].update_one(
+        {'GiveawayID': giveaway['_id'], 'UserID': user_id},
+        {'$setOnInsert': {'EnteredAt': datetime.datetime.now(datetime.UTC)}}, upsert=True)
+    if res.upserted_id is not None:
+        await client['Giveaways'].update_one({'_id': giveaway['_id']}, {'$inc': {'ParticipantCount': 1}})
+
+
+async def remove_participant(message_id: str, user_id: str):
+    """Remove a user from the giveaway of a message"""
+    giveaway = await client['Giveaways'].find_one({'MessageID': message_id}, projection={'_id': True})
+    if giveaway is None:
+        return
+
+    res = await client['GiveawayParticipants'].delete_one({'GiveawayID': giveaway['_id'], 'UserID': user_id})
+    if res.deleted_count:
+        await client['Giveaways'].update_one({'_id': giveaway['_id']}, {'$inc': {'ParticipantCount': -1}})
+
+
+async def reservoir_sample(items, k: int) -> list:
+    """Pick up to `k` random items from an async iterator in one pass, without holding more than `k` of them
+
+    Args:
+        items: Async iterator
+        k (int): Number of items to pick
+
+    Returns:
+        list: The picked items, all of them if there are `k` or fewer
+    """
+    sample = []
+    seen = 0
+    async for item in items:
+        seen += 1
+        if len(sample) < k:
+            sample.append(item)
+        else:
+            i = random.randrange(seen)
+            if i < k:
+                sample[i] = item
+    return sample
 
 
 class Giveaways(discord.Cog):
@@ -38,7 +104,14 @@ class Giveaways(discord.Cog):
 
     def __init__(self, bot: discord.Bot):
         self.bot = bot
-        self.giveaway_mng.start()
+        self.semaphore = asyncio.Semaphore(int(get_key("Giveaways_MaxConcurrency", "8")))
+        self.wakeup = asyncio.Event()
+        self.worker_task = None
+
+    @discord.Cog.listener()
+    async def on_ready(self):
+        if self.worker_task is None or self.worker_task.done():
+            self.worker_task = asyncio.create_task(self.giveaway_mng())
 
     @giveaways_group.command(name="new", description="Create a new giveaway")
     @discord.default_permissions(manage_guild=True)
@@ -59,27 +132,30 @@ class Giveaways(discord.Cog):
         try:
             # Check if the parameters are correct
             if days + hours < 0 or days < 0 or hours < 0 or minutes < 0 or winners < 0:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "giveaways_error_negative_parameters"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "giveaways_error_negative_parameters"),
+                                  ephemeral=True)
                 return
 
             # Determine ending date
-            end_date = get_now_for_server(ctx.guild.id)
-            end_date = end_date + datetime.timedelta(days=days, hours=hours, minutes=minutes)
+            duration = datetime.timedelta(days=days, hours=hours, minutes=minutes)
+            end_date = await get_now_for_server(ctx.guild.id) + duration
+            end_time = datetime.datetime.now(datetime.UTC) + duration
 
             # Send message
-            msg1 = await ctx.channel.send(trl(0, ctx.guild.id, "giveaways_giveaway_text").format(item=item))
+            msg1 = await ctx.channel.send((await trl(0, ctx.guild.id, "giveaways_giveaway_text")).format(item=item))
             await msg1.add_reaction("🎉")
 
-            res = client['Giveaways'].insert_one(
-                {'ChannelID': str(ctx.channel.id), 'MessageID': str(msg1.id), 'Item': item,
-                 'EndDate': end_date.isoformat(), 'Winners': winners})
+            res = await client['Giveaways'].insert_one(
+                {'GuildID': str(ctx.guild.id), 'ChannelID': str(ctx.channel.id), 'MessageID': str(msg1.id),
+                 'Item': item, 'EndDate': end_date.isoformat(), 'EndTime': end_time, 'Winners': winners})
+            self.wakeup.set()
 
             # Send success message
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "giveaways_new_success", append_tip=True).format(
+            await ctx.respond((await trl(ctx.user.id, ctx.guild.id, "giveaways_new_success", append_tip=True)).format(
                 id=str(res.inserted_id)), ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, 'command_error_generic'), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, 'command_error_generic'), ephemeral=True)
 
     @giveaways_group.command(name="end", description="End a giveaway IRREVERSIBLY")
     @discord.default_permissions(manage_guild=True)
@@ -91,21 +167,24 @@ class Giveaways(discord.Cog):
     async def giveaway_end(self, ctx: discord.ApplicationContext, giveaway_id: str):
         try:
             if not ObjectId.is_valid(giveaway_id):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "giveaways_error_not_found"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "giveaways_error_not_found"), ephemeral=True)
                 return
 
-            res = client['Giveaways'].count_documents({'_id': ObjectId(giveaway_id)})
+            res = await client['Giveaways'].count_documents({'_id': ObjectId(giveaway_id)})
             if res == 0:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "giveaways_error_not_found"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "giveaways_error_not_found"), ephemeral=True)
                 return
 
-            await self.process_send_giveaway(giveaway_id)
+            if not await self.process_send_giveaway(giveaway_id):
+                # The channel is gone or the announcement failed, the giveaway is still there
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, 'command_error_generic'), ephemeral=True)
+                return
 
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "giveaways_giveaway_end_success", append_tip=True),
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "giveaways_giveaway_end_success", append_tip=True),
                               ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, 'command_error_generic'), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, 'command_error_generic'), ephemeral=True)
 
     @giveaways_group.command(name='list', description='List all giveaways')
     @discord.default_permissions(manage_guild=True)
@@ -114,32 +193,31 @@ class Giveaways(discord.Cog):
     @analytics("giveaway list")
     async def giveaway_list(self, ctx: discord.ApplicationContext):
         try:
-            res = client['Giveaways'].find({}).to_list()
+            res = await client['Giveaways'].find({}).to_list()
 
-            message = trl(ctx.user.id, ctx.guild.id, "giveaways_list_title")
+            message = await trl(ctx.user.id, ctx.guild.id, "giveaways_list_title")
 
             for i in res:
                 id = str(i['_id'])
                 item = i['Item']
                 winners = i['Winners']
-                time_remaining = datetime.datetime.fromisoformat(i['EndDate']) - get_now_for_server(ctx.guild.id)
-                time_remaining = time_remaining.total_seconds()
-                time_remaining = pretty_time_delta(time_remaining, user_id=ctx.user.id, server_id=ctx.guild.id)
+                time_remaining = await get_end_timestamp(i) - time.time()
+                time_remaining = await pretty_time_delta(time_remaining, user_id=ctx.user.id, server_id=ctx.guild.id)
 
-                message += trl(ctx.user.id, ctx.guild.id, "giveaways_list_line").format(id=id, item=item,
-                                                                                        winners=winners,
-                                                                                        time=time_remaining)
+                message += (await trl(ctx.user.id, ctx.guild.id, "giveaways_list_line")).format(id=id, item=item,
+                                                                                                winners=winners,
+                                                                                                time=time_remaining)
 
             if len(res) == 0:
-                message += trl(ctx.user.id, ctx.guild.id, "giveaways_list_empty")
+                message += await trl(ctx.user.id, ctx.guild.id, "giveaways_list_empty")
 
-            if get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
-                language = get_language(ctx.guild.id, ctx.user.id)
+            if await get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
+                language = await get_language(ctx.guild.id, ctx.user.id)
                 message = append_tip_to_message(ctx.guild.id, ctx.user.id, message, language)
             await ctx.respond(message, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic").format(e), ephemeral=True)
+            await ctx.respond((await trl(ctx.user.id, ctx.guild.id, "command_error_generic")).format(e), ephemeral=True)
 
     @discord.Cog.listener()
     async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User):
@@ -147,8 +225,7 @@ class Giveaways(discord.Cog):
             if user.bot:
                 return
 
-            client['Giveaways'].update_one({'MessageID': str(reaction.message.id)},
-                                           {'$push': {'Participants': str(user.id)}})
+            await add_participant(str(reaction.message.id), str(user.id))
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
@@ -158,61 +235,133 @@ class Giveaways(discord.Cog):
             if user.bot:
                 return
 
-            client['Giveaways'].update_one({'MessageID': str(reaction.message.id)},
-                                           {'$pull': {'Participants': str(user.id)}})
+            await remove_participant(str(reaction.message.id), str(user.id))
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
-    async def process_send_giveaway(self, giveaway_id: str):
+    async def process_send_giveaway(self, giveaway_id: str) -> bool:
+        """Draw the winners of a giveaway, announce them and delete the giveaway
+
+        Args:
+            giveaway_id (str): Giveaway ID
+
+        Returns:
+            bool: False if the giveaway couldn't be ended and should be tried again later
+        """
         try:
-            res = client['Giveaways'].find_one({'_id': ObjectId(giveaway_id)})
+            res = await client['Giveaways'].find_one({'_id': ObjectId(giveaway_id)})
             if not res:
-                return
-
-            # Fetch the channel and message
-            chan = await self.bot.fetch_channel(res['ChannelID'])
+                return True
 
-            users = res['Participants'] if 'Participants' in res else []
+            # The channel comes from the gateway cache, the bot can't announce anything in a channel it can't see
+            chan = self.bot.get_channel(int(res['ChannelID']))
+            if chan is None:
+                return False
 
             # Check if there are enough members to select winners
-            if len(users) < res['Winners']:
-                await chan.send(trl(0, chan.guild.id, "giveaways_warning_not_enough_participants"))
-                winners = users
-            else:
-                # Determine winners
-                winners = random.sample(users, res['Winners'])
+            if res.get('ParticipantCount', 0) < res['Winners']:
+                await chan.send(await trl(0, chan.guild.id, "giveaways_warning_not_enough_participants"))
+
+            # Determine winners
+            participants = client['GiveawayParticipants'].find({'GiveawayID': res['_id']}, projection={'UserID': True})
+            winners = await reservoir_sample((i['UserID'] async for i in participants), res['Winners'])
 
             # Get channel and send message
             if len(winners) == 1:
-                msg2 = trl(0, chan.guild.id, "giveaways_winner").format(item=res['Item'], mention=f"<@{winners[0]}>")
+                msg2 = (await trl(0, chan.guild.id, "giveaways_winner")).format(item=res['Item'],
+                                                                                mention=f"<@{winners[0]}>")
                 await chan.send(msg2)
             else:
                 mentions = ", ".join([f"<@{j}>" for j in winners])
                 last_mention = mentions.rfind(", ")
                 last_mention = mentions[last_mention + 2:]
                 mentions = mentions[:last_mention]
-                msg2 = trl(0, chan.guild.id, "giveaways_winners").format(item=res['Item'], mentions=mentions,
-                                                                         last_mention=last_mention)
+                msg2 = (await trl(0, chan.guild.id, "giveaways_winners")).format(item=res['Item'], mentions=mentions,
+                                                                                 last_mention=last_mention)
                 await chan.send(msg2)
 
-            client['Giveaways'].delete_one({'_id': ObjectId(giveaway_id)})
+            await client['Giveaways'].delete_one({'_id': ObjectId(giveaway_id)})
+            await client['GiveawayParticipants'].delete_many({'GiveawayID': res['_id']})
+            return True
         except Exception as e:
             sentry_sdk.capture_exception(e)
+            return False
+
+    async def end_due_giveaway(self, giveaway: dict):
+        async with self.semaphore:
+            if not await self.process_send_giveaway(str(giveaway['_id'])):
+                await client['Giveaways'].update_one(
+                    {'_id': giveaway['_id']},
+                    {'$set': {'EndTime': datetime.datetime.now(datetime.UTC) + RETRY_INTERVAL}})
+
+    async def migrate_participants(self):
+        """Move participants of giveaways created before GiveawayParticipants existed out of the giveaway document"""
+        async for i in client['Giveaways'].find({'Participants': {'$exists': True}}):
+            participants = set(i['Participants'])
+            if participants:
+                await client['GiveawayParticipants'].bulk_write(
+                    [UpdateOne({'GiveawayID': i['_id'], 'UserID': user_id},
+                               {'$setOnInsert': {'EnteredAt': datetime.datetime.now(datetime.UTC)}}, upsert=True)
+                     for user_id in participants], ordered=False)
+            await client['Giveaways'].update_one({'_id': i['_id']}, {
+                '$set': {'ParticipantCount': await client['GiveawayParticipants'].count_documents(
+                    {'GiveawayID': i['_id']})},
+                '$unset': {'Participants': ''}})
+
+    async def migrate_end_times(self) -> int:
+        """Give giveaways created before EndTime existed a UTC end time, from their local EndDate
+
+        Returns:
+            int: Number of giveaways left for a later run, because their channel isn't available yet
+        """
+        skipped = 0
+        async for i in client['Giveaways'].find({'EndTime': {'$exists': False}}):
+            channel = self.bot.get_channel(int(i['ChannelID']))
+            if channel is None:
+                skipped += 1  # The server's timezone is needed for the end time
+                continue
+
+            end_time = datetime.datetime.fromisoformat(i['EndDate']) - datetime.timedelta(
+                hours=await get_timezone_offset(channel.guild.id))
+            await client['Giveaways'].update_one({'_id': i['_id']}, {'$set': {
+                'EndTime': end_time.replace(tzinfo=datetime.UTC), 'GuildID': str(channel.guild.id)}})
+
+        return skipped
 
-    @tasks.loop(minutes=1)
     async def giveaway_mng(self):
+        """Sleep until the earliest giveaway ends, then end every giveaway that's due"""
+        unmigrated = 0
         try:
-            res = client['Giveaways'].find({}).to_list()
-            for i in res:
-                channel_id = i['ChannelID']
-                channel = await self.bot.fetch_channel(channel_id)
-
-                time = datetime.datetime.now(datetime.UTC)
-                if channel is not None:
-                    time = get_now_for_server(channel.guild.id)
-                # Check if the giveaway ended
-                end_date = datetime.datetime.fromisoformat(i['EndDate'])
-                if time > end_date:
-                    await self.process_send_giveaway(str(i['_id']))
+            unmigrated = await self.migrate_end_times()
+            await self.migrate_participants()
         except Exception as e:
             sentry_sdk.capture_exception(e)
+
+        while True:
+            try:
+                self.wakeup.clear()
+                if unmigrated:
+                    unmigrated = await self.migrate_end_times()
+                now = datetime.datetime.now(datetime.UTC)
+                due = await client['Giveaways'].find({'EndTime': {'$lte': now}}, projection={'_id': True}).to_list()
+                await asyncio.gather(*[self.end_due_giveaway(i) for i in due])
+
+                upcoming = await client['Giveaways'].find_one({'EndTime': {'$exists': True}},
+                                                              projection={'EndTime': True},
+                                                              sort=[('EndTime', pymongo.ASCENDING)])
+                timeout = None
+                if upcoming is not None:
+                    timeout = max(upcoming['EndTime'].replace(tzinfo=datetime.UTC).timestamp() - time.time(), 0)
+                if unmigrated:
+                    # Try the giveaways whose channel wasn't available again later
+                    retry = RETRY_INTERVAL.total_seconds()
+                    timeout = retry if timeout is None else min(timeout, retry)
+            except Exception as e:
+                sentry_sdk.capture_exception(e)
+                timeout = RETRY_INTERVAL.total_seconds()
+
+            # Creating a giveaway wakes the worker up, the new one might end before the one it's waiting for
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -16,122 +16,188 @@
 #
 
 import datetime
+import math
 import re
+import time
 
 import discord
 import emoji
 import sentry_sdk
-from discord.ext import commands as commands_ext, pages
+from discord.ext import commands as commands_ext
+from pymongo import ReturnDocument
 
 from database import client
 from utils.analytics import analytics
-from utils.languages import get_translation_for_key_localized as trl, get_language
+from utils.config import get_key
+from utils.languages import LocaleContext, get_translation_for_key_localized as trl, get_language
 from utils.logging_util import log_into_logs
+from utils.message_dispatch import message_dispatcher, MessageContext
 from utils.per_user_settings import get_per_user_setting, set_per_user_setting
-from utils.settings import get_setting, set_setting
+from utils.settings import get_setting, set_setting, get_settings
 from utils.tips import append_tip_to_message
 from utils.tzutil import get_now_for_server
 
+MULTIPLIER_CACHE_TTL = int(get_key("Settings_CacheTTL", "300"))  # Same expiry as the settings cache, 0 = never
 
-def db_calculate_multiplier(guild_id: int):
-    multiplier = int(get_setting(guild_id, 'leveling_xp_multiplier', '1'))
+multiplier_cache = {}  # GuildID -> (load time, multipliers)
+multiplier_generations = {}  # GuildID -> number of writes, so a load racing a write doesn't cache stale data
 
-    multipliers = db_multiplier_getall(guild_id)
-    for m in multipliers:
-        start_month, start_day = map(int, m['StartDate'].split('-'))
-        end_month, end_day = map(int, m['EndDate'].split('-'))
 
-        now = get_now_for_server(guild_id)
-        start_date = datetime.datetime(now.year, start_month, start_day)
-        end_date = datetime.datetime(now.year, end_month, end_day, hour=23, minute=59, second=59)
+class LevelingConfig:
+    """Leveling settings of a guild at one point in time, enough to convert between XP and levels without the
+    database.
 
-        if end_date < start_date:
-            end_date = end_date.replace(year=end_date.year + 1)
+    Every level costs the same amount of XP, `xp_per_level` times the total multiplier (the server multiplier times
+    every currently active event multiplier).
+    """
+
+    def __init__(self, xp_per_level: int, base_multiplier: int, event_multipliers: list[int]):
+        self.xp_per_level = xp_per_level
+        self.base_multiplier = base_multiplier
+        self.event_multipliers = tuple(event_multipliers)
+
+        self.multiplier = base_multiplier
+        for m in self.event_multipliers:
+            self.multiplier *= m
+
+        self.xp_needed = self.multiplier * xp_per_level
+
+
+def is_multiplier_active(multiplier: dict, now: datetime.datetime) -> bool:
+    start_month, start_day = map(int, multiplier['StartDate'].split('-'))
+    end_month, end_day = map(int, multiplier['EndDate'].split('-'))
+
+    start_date = datetime.datetime(now.year, start_month, start_day)
+    end_date = datetime.datetime(now.year, end_month, end_day, hour=23, minute=59, second=59)
+
+    if end_date < start_date:
+        end_date = end_date.replace(year=end_date.year + 1)
+
+    return start_date <= now <= end_date
+
+
+async def get_leveling_config(guild_id: int) -> LevelingConfig:
+    xp_per_level = int(await get_setting(guild_id, 'leveling_xp_per_level', '500'))
+    base_multiplier = int(await get_setting(guild_id, 'leveling_xp_multiplier', '1'))
+
+    multipliers = await db_multiplier_getall(guild_id)
+    if not multipliers:
+        return LevelingConfig(xp_per_level, base_multiplier, [])
 
-        if start_date <= now <= end_date:
-            multiplier *= m['Multiplier']
+    now = await get_now_for_server(guild_id)
+    return LevelingConfig(xp_per_level, base_multiplier,
+                          [m['Multiplier'] for m in multipliers if is_multiplier_active(m, now)])
 
-    return multiplier
 
+async def db_calculate_multiplier(guild_id: int):
+    return (await get_leveling_config(guild_id)).multiplier
 
-def db_get_user_xp(guild_id: int, user_id: int):
-    data = client['Leveling'].find_one({'GuildID': str(guild_id), 'UserID': str(user_id)})
+
+async def db_get_user_xp(guild_id: int, user_id: int):
+    data = await client['Leveling'].find_one({'GuildID': str(guild_id), 'UserID': str(user_id)})
     return data['XP'] if data else 1
 
 
-def db_add_user_xp(guild_id: int, user_id: int, xp: int):
-    data = client['Leveling'].find_one({'GuildID': str(guild_id), 'UserID': str(user_id)})
-    if data:
-        current_xp = data['XP']
-        multiplier = db_calculate_multiplier(guild_id)
-        client['Leveling'].update_one({'GuildID': str(guild_id), 'UserID': str(user_id)}, {'$inc': {'XP': xp}},
-                                      upsert=True)
-    else:
-        client['Leveling'].insert_one({'GuildID': str(guild_id), 'UserID': str(user_id), 'XP': xp})
+async def db_add_user_xp(guild_id: int, user_id: int, xp: int) -> tuple[int, int]:
+    """Add XP to a user, creating their leveling entry if they don't have one
+
+    Args:
+        guild_id (int): Guild ID
+        user_id (int): User ID
+        xp (int): XP to add
+
+    Returns:
+        tuple[int, int]: XP before and after adding
+    """
+    data = await client['Leveling'].find_one_and_update({'GuildID': str(guild_id), 'UserID': str(user_id)},
+                                                        {'$inc': {'XP': xp}}, upsert=True,
+                                                        return_document=ReturnDocument.BEFORE)
+    old_xp = data['XP'] if data else 0
+    return old_xp, old_xp + xp
+
 
+def get_level_for_xp(config: LevelingConfig, xp: int) -> int:
+    if config.xp_needed <= 0:
+        return 0  # Every level would be free, treat it as leveling being disabled
 
-def get_level_for_xp(guild_id: int, xp: int):
-    level = 0
-    xp_needed = db_calculate_multiplier(guild_id) * int(get_setting(guild_id, 'leveling_xp_per_level', '500'))
-    while xp >= xp_needed:
-        level += 1
-        xp -= xp_needed
-        xp_needed = db_calculate_multiplier(guild_id) * int(get_setting(guild_id, 'leveling_xp_per_level', '500'))
+    return max(xp // config.xp_needed, 0)
 
-    return level
 
+def get_xp_for_level(config: LevelingConfig, level: int) -> int:
+    return max(level, 0) * config.xp_needed
 
-def get_xp_for_level(guild_id: int, level: int):
-    xp = 0
-    xp_needed = db_calculate_multiplier(guild_id) * int(get_setting(guild_id, 'leveling_xp_per_level', '500'))
-    for _ in range(level):
-        xp += xp_needed
-        xp_needed = db_calculate_multiplier(guild_id) * int(get_setting(guild_id, 'leveling_xp_per_level', '500'))
 
-    return xp
+def invalidate_multipliers(guild_id: int):
+    """Drop the cached multipliers of a guild, call after every change to its LevelingMultiplier documents"""
+    multiplier_generations[str(guild_id)] = multiplier_generations.get(str(guild_id), 0) + 1
+    multiplier_cache.pop(str(guild_id), None)
 
 
-def db_multiplier_add(guild_id: int, name: str, multiplier: int, start_date_month: int, start_date_day: int,
-                      end_date_month: int, end_date_day: int):
-    client['LevelingMultiplier'].insert_one({'GuildID': str(guild_id), 'Name': name, 'Multiplier': multiplier,
-                                             'StartDate': '{:02d}-{:02d}'.format(start_date_month, start_date_day),
-                                             'EndDate': '{:02d}-{:02d}'.format(end_date_month, end_date_day)})
+async def db_multiplier_add(guild_id: int, name: str, multiplier: int, start_date_month: int, start_date_day: int,
+                            end_date_month: int, end_date_day: int):
+    await client['LevelingMultiplier'].insert_one({'GuildID': str(guild_id), 'Name': name, 'Multiplier': multiplier,
+                                                   'StartDate': '{:02d}-{:02d}'.format(start_date_month,
+                                                                                       start_date_day),
+                                                   'EndDate': '{:02d}-{:02d}'.format(end_date_month, end_date_day)})
+    invalidate_multipliers(guild_id)
 
 
-def db_multiplier_exists(guild_id: int, name: str):
-    data = client['LevelingMultiplier'].count_documents({'GuildID': str(guild_id), 'Name': name})
+async def db_multiplier_exists(guild_id: int, name: str):
+    data = await client['LevelingMultiplier'].count_documents({'GuildID': str(guild_id), 'Name': name})
     return data > 0
 
 
-def db_multiplier_change_name(guild_id: int, old_name: str, new_name: str):
-    client['LevelingMultiplier'].update_one({'GuildID': str(guild_id), 'Name': old_name}, {'$set': {'Name': new_name}})
+async def db_multiplier_change_name(guild_id: int, old_name: str, new_name: str):
+    await client['LevelingMultiplier'].update_one({'GuildID': str(guild_id), 'Name': old_name},
+                                                  {'$set': {'Name': new_name}})
+    invalidate_multipliers(guild_id)
+
 
+async def db_multiplier_change_multiplier(guild_id: int, name: str, multiplier: int):
+    await client['LevelingMultiplier'].update_one({'GuildID': str(guild_id), 'Name': name},
+                                                  {'$set': {'Multiplier': multiplier}})
+    invalidate_multipliers(guild_id)
 
-def db_multiplier_change_multiplier(guild_id: int, name: str, multiplier: int):
-    client['LevelingMultiplier'].update_one({'GuildID': str(guild_id), 'Name': name},
-                                            {'$set': {'Multiplier': multiplier}})
 
+async def db_multiplier_change_start_date(guild_id: int, name: str, start_date: datetime.datetime):
+    await client['LevelingMultiplier'].update_one({'GuildID': str(guild_id), 'Name': name},
+                                                  {'$set': {'StartDate': start_date}})
+    invalidate_multipliers(guild_id)
 
-def db_multiplier_change_start_date(guild_id: int, name: str, start_date: datetime.datetime):
-    client['LevelingMultiplier'].update_one({'GuildID': str(guild_id), 'Name': name},
-                                            {'$set': {'StartDate': start_date}})
 
+async def db_multiplier_change_end_date(guild_id: int, name: str, end_date: datetime.datetime):
+    await client['LevelingMultiplier'].update_one({'GuildID': str(guild_id), 'Name': name},
+                                                  {'$set': {'EndDate': end_date}})
+    invalidate_multipliers(guild_id)
 
-def db_multiplier_change_end_date(guild_id: int, name: str, end_date: datetime.datetime):
-    client['LevelingMultiplier'].update_one({'GuildID': str(guild_id), 'Name': name}, {'$set': {'EndDate': end_date}})
 
+async def db_multiplier_remove(guild_id: int, name: str):
+    await client['LevelingMultiplier'].delete_one({'GuildID': str(guild_id), 'Name': name})
+    invalidate_multipliers(guild_id)
 
-def db_multiplier_remove(guild_id: int, name: str):
-    client['LevelingMultiplier'].delete_one({'GuildID': str(guild_id), 'Name': name})
 
+async def db_multiplier_getall(guild_id: int) -> list[dict]:
+    """Get every multiplier of a guild. The list is cached because leveling needs it for every message.
 
-def db_multiplier_getall(guild_id: int):
-    data = client['LevelingMultiplier'].find({'GuildID': str(guild_id)}).to_list()
+    Args:
+        guild_id: The guild
+
+    Returns:
+        The LevelingMultiplier documents of the guild, shared with the cache so don't modify them
+    """
+    cached = multiplier_cache.get(str(guild_id))
+    if cached is not None and (not MULTIPLIER_CACHE_TTL or time.monotonic() - cached[0] <= MULTIPLIER_CACHE_TTL):
+        return cached[1]
+
+    generation = multiplier_generations.get(str(guild_id), 0)
+    data = await client['LevelingMultiplier'].find({'GuildID': str(guild_id)}).to_list()
+    if multiplier_generations.get(str(guild_id), 0) == generation:
+        multiplier_cache[str(guild_id)] = (time.monotonic(), data)
     return data
 
 
-def db_multiplier_get(guild_id: int, name: str):
-    data = client['LevelingMultiplier'].find_one({'GuildID': str(guild_id), 'Name': name})
+async def db_multiplier_get(guild_id: int, name: str):
+    data = await client['LevelingMultiplier'].find_one({'GuildID': str(guild_id), 'Name': name})
     return data
 
 
@@ -175,59 +241,192 @@ def validate_day(month: int, day: int, year: int) -> bool:
     return True
 
 
-async def update_roles_for_member(guild: discord.Guild, member: discord.Member):
-    xp = db_get_user_xp(guild.id, member.id)
-    level = get_level_for_xp(guild.id, xp)
+async def get_level_rewards(guild_id: int) -> dict[int, int]:
+    """Get the reward roles of a guild
+
+    Args:
+        guild_id (int): Guild ID
+
+    Returns:
+        dict[int, int]: Level -> role ID
+    """
+    settings = await get_settings(guild_id)
+    rewards = settings.get('leveling_rewards')
+    if rewards is None:
+        # Rewards used to be stored as one setting per level, move them into a single map
+        rewards = {key.removeprefix('leveling_reward_'): value for key, value in settings.items()
+                   if re.fullmatch(r'leveling_reward_\d+', key) and value != '0'}
+        await set_setting(guild_id, 'leveling_rewards', rewards)
+
+    return {int(level): int(role_id) for level, role_id in rewards.items()}
+
+
+async def set_level_reward(guild_id: int, level: int, role_id: int | None):
+    rewards = {str(k): str(v) for k, v in (await get_level_rewards(guild_id)).items()}
+    if role_id is not None:
+        rewards[str(level)] = str(role_id)
+    else:
+        rewards.pop(str(level), None)
+
+    await set_setting(guild_id, 'leveling_rewards', rewards)
+
+
+async def update_roles_for_member(guild: discord.Guild, member: discord.Member, level: int):
+    rewards = await get_level_rewards(guild.id)
+    if not rewards:
+        return
+
+    roles = {role for role in member.roles if not role.is_default()}
+    desired = set(roles)
+    for reward_level, role_id in rewards.items():
+        role = guild.get_role(role_id)
+        if role is None or role >= guild.me.top_role:
+            continue  # Deleted, or the bot isn't allowed to give it
+
+        if reward_level <= level:
+            desired.add(role)
+        else:
+            desired.discard(role)
+
+    if desired != roles:
+        await member.edit(roles=list(desired))
+
+
+LEADERBOARD_PAGE_SIZE = 10
+
+
+async def db_get_leaderboard_page(guild_id: int, page: int) -> list[dict]:
+    return await client['Leveling'].find({'GuildID': str(guild_id)}, sort=[('XP', -1), ('UserID', 1)],
+                                         skip=page * LEADERBOARD_PAGE_SIZE, limit=LEADERBOARD_PAGE_SIZE).to_list()
+
+
+async def db_count_leaderboard(guild_id: int) -> int:
+    return await client['Leveling'].count_documents({'GuildID': str(guild_id)})
 
-    for i in range(1, level + 1):  # Add missing roles
-        role_id = get_setting(guild.id, f'leveling_reward_{i}', '0')
-        if role_id != '0':
-            role = guild.get_role(int(role_id))
-            if role.position > guild.me.top_role.position:
-                return
 
-            if role is not None and role not in member.roles:
-                await member.add_roles(role)
+async def db_get_leaderboard_rank(guild_id: int, user_id: int) -> int | None:
+    data = await client['Leveling'].find_one({'GuildID': str(guild_id), 'UserID': str(user_id)})
+    if data is None:
+        return None
 
-    for i in range(level + 1, 100):  # Remove excess roles
-        role_id = get_setting(guild.id, f'leveling_reward_{i}', '0')
-        if role_id != '0':
-            role = guild.get_role(int(role_id))
-            if role.position > guild.me.top_role.position:
+    # Same order as the pages: more XP first, members with the same XP by UserID
+    ahead = await client['Leveling'].count_documents({'GuildID': str(guild_id), 'XP': {'$gt': data['XP']}})
+    tied_ahead = await client['Leveling'].count_documents({'GuildID': str(guild_id), 'XP': data['XP'],
+                                                           'UserID': {'$lt': data['UserID']}})
+    return ahead + tied_ahead + 1
+
+
+class LeaderboardView(discord.ui.View):
+    """Leaderboard that loads one page at a time, only when it's shown"""
+
+    def __init__(self, guild: discord.Guild, user_id: int, config: LevelingConfig, member_count: int,
+                 my_rank_label: str):
+        super().__init__(timeout=180)
+        self.guild = guild
+        self.user_id = user_id
+        self.config = config
+        self.page = 0
+        self.page_count = max(math.ceil(member_count / LEADERBOARD_PAGE_SIZE), 1)
+
+        self.previous_btn = discord.ui.Button(emoji="⬅️", style=discord.ButtonStyle.secondary)
+        self.previous_btn.callback = self.previous
+        self.add_item(self.previous_btn)
+
+        self.page_btn = discord.ui.Button(style=discord.ButtonStyle.secondary, disabled=True)
+        self.add_item(self.page_btn)
+
+        self.next_btn = discord.ui.Button(emoji="➡️", style=discord.ButtonStyle.secondary)
+        self.next_btn.callback = self.next
+        self.add_item(self.next_btn)
+
+        self.my_rank_btn = discord.ui.Button(label=my_rank_label, style=discord.ButtonStyle.primary)
+        self.my_rank_btn.callback = self.my_rank
+        self.add_item(self.my_rank_btn)
+
+        self.update_buttons()
+
+    def update_buttons(self):
+        self.previous_btn.disabled = self.page == 0
+        self.next_btn.disabled = self.page >= self.page_count - 1
+        self.page_btn.label = f"{self.page + 1}/{self.page_count}"
+
+    async def message_content(self) -> str:
+        leaderboard_message = await trl(self.user_id, self.guild.id, "leveling_leaderboard_title")
+        row = await trl(self.user_id, self.guild.id, "leveling_leaderboard_row")
+
+        users = await db_get_leaderboard_page(self.guild.id, self.page)
+        for position, user in enumerate(users, start=self.page * LEADERBOARD_PAGE_SIZE + 1):
+            leaderboard_message += row.format(position=position, user=f"<@{user['UserID']}>",
+                                              level=get_level_for_xp(self.config, user['XP']), xp=user['XP'])
+
+        if await get_per_user_setting(self.user_id, 'tips_enabled', 'true') == 'true':
+            language = await get_language(self.guild.id, self.user_id)
+            leaderboard_message = append_tip_to_message(self.guild.id, self.user_id, leaderboard_message, language)
+
+        return leaderboard_message
+
+    async def show_page(self, interaction: discord.Interaction, page: int):
+        self.page = min(max(page, 0), self.page_count - 1)
+        self.update_buttons()
+        await interaction.response.edit_message(content=await self.message_content(), view=self)
+
+    async def previous(self, interaction: discord.Interaction):
+        try:
+            await self.show_page(interaction, self.page - 1)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            await interaction.response.send_message(await trl(self.user_id, self.guild.id, "command_error_generic"),
+                                                    ephemeral=True)
+
+    async def next(self, interaction: discord.Interaction):
+        try:
+            await self.show_page(interaction, self.page + 1)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            await interaction.response.send_message(await trl(self.user_id, self.guild.id, "command_error_generic"),
+                                                    ephemeral=True)
+
+    async def my_rank(self, interaction: discord.Interaction):
+        try:
+            rank = await db_get_leaderboard_rank(self.guild.id, self.user_id)
+            if rank is None:
+                await interaction.response.send_message(
+                    await trl(self.user_id, self.guild.id, "leveling_leaderboard_not_ranked"), ephemeral=True)
                 return
 
-            if role is not None and role in member.roles:
-                await member.remove_roles(role)
+            # The leaderboard might have grown since it was opened
+            self.page_count = max(self.page_count, math.ceil(rank / LEADERBOARD_PAGE_SIZE))
+            await self.show_page(interaction, (rank - 1) // LEADERBOARD_PAGE_SIZE)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            await interaction.response.send_message(await trl(self.user_id, self.guild.id, "command_error_generic"),
+                                                    ephemeral=True)
 
 
 class Leveling(discord.Cog):
     def __init__(self, bot: discord.Bot) -> None:
         self.bot = bot
         super().__init__()
+        message_dispatcher.register("leveling", self.handle_message)
 
-    @discord.Cog.listener()
-    async def on_message(self, msg: discord.Message):
-        try:
-            if msg.author.bot:
-                return
-
-            before_level = get_level_for_xp(msg.guild.id, db_get_user_xp(msg.guild.id, msg.author.id))
-            db_add_user_xp(msg.guild.id, msg.author.id, 3)
-            after_level = get_level_for_xp(msg.guild.id, db_get_user_xp(msg.guild.id, msg.author.id))
+    async def handle_message(self, ctx: MessageContext):
+        msg = ctx.message
+        config = await get_leveling_config(msg.guild.id)
+        before_xp, after_xp = await db_add_user_xp(msg.guild.id, msg.author.id, 3)
+        before_level = get_level_for_xp(config, before_xp)
+        after_level = get_level_for_xp(config, after_xp)
 
-            if not msg.channel.permissions_for(msg.guild.me).send_messages:
-                return
+        if not ctx.permissions.send_messages:
+            return
 
-            if msg.guild.me.guild_permissions.manage_roles:
-                await update_roles_for_member(msg.guild, msg.author)
+        if msg.guild.me.guild_permissions.manage_roles:
+            await update_roles_for_member(msg.guild, msg.author, after_level)
 
-            if before_level != after_level and msg.channel.can_send():
-                msg2 = await msg.channel.send(
-                    trl(msg.author.id, msg.guild.id, "leveling_level_up").format(mention=msg.author.mention,
-                                                                                 level=str(after_level)))
-                await msg2.delete(delay=5)
-        except Exception as e:
-            sentry_sdk.capture_exception(e)
+        if before_level != after_level and msg.channel.can_send():
+            msg2 = await msg.channel.send(
+                (await ctx.locale()).trl("leveling_level_up").format(mention=msg.author.mention,
+                                                                     level=str(after_level)))
+            await msg2.delete(delay=5)
 
     @discord.slash_command(name='level', description='Get the level of a user')
     @commands_ext.guild_only()
@@ -236,69 +435,51 @@ class Leveling(discord.Cog):
         try:
             user = user or ctx.user
 
-            level_xp = db_get_user_xp(ctx.guild.id, user.id)
-            level = get_level_for_xp(ctx.guild.id, level_xp)
-            multiplier = db_calculate_multiplier(ctx.guild.id)
-            next_level_xp = get_xp_for_level(ctx.guild.id, level + 1)
-            multiplier_list = db_multiplier_getall(ctx.guild.id)
+            locale = await LocaleContext.resolve(ctx.user.id, ctx.guild.id)
+            config = await get_leveling_config(ctx.guild.id)
+            level_xp = await db_get_user_xp(ctx.guild.id, user.id)
+            level = get_level_for_xp(config, level_xp)
+            multiplier = config.multiplier
+            next_level_xp = get_xp_for_level(config, level + 1)
+            multiplier_list = await db_multiplier_getall(ctx.guild.id)
 
             msg = ""
+            now = locale.now()
             for i in multiplier_list:
-                start_month, start_day = map(int, i['StartDate'].split('-'))
-                end_month, end_day = map(int, i['EndDate'].split('-'))
-
-                now = get_now_for_server(ctx.guild.id)
-                start_date = datetime.datetime(now.year, start_month, start_day)
-                end_date = datetime.datetime(now.year, end_month, end_day, hour=23, minute=59, second=59)
-
-                if end_date < start_date:
-                    end_date = end_date.replace(year=end_date.year + 1)
-
-                # continue if the multiplier is not active
-                if start_date > now or end_date < now:
+                if not is_multiplier_active(i, now):
                     continue
 
-                msg += trl(ctx.user.id, ctx.guild.id, "leveling_level_multiplier_row").format(name=i['Name'],
-                                                                                              multiplier=i[
-                                                                                                  'Multiplier'],
-                                                                                              start=i['StartDate'],
-                                                                                              end=i['EndDate'])
+                msg += locale.trl("leveling_level_multiplier_row").format(
+                    name=i['Name'], multiplier=i['Multiplier'], start=i['StartDate'], end=i['EndDate'])
 
             if user == ctx.user:
-                icon = get_per_user_setting(ctx.user.id, 'leveling_icon', '')
-                response = trl(ctx.user.id, ctx.guild.id, "leveling_level_info_self").format(icon=icon, level=level,
-                                                                                             level_xp=level_xp,
-                                                                                             next_level_xp=next_level_xp,
-                                                                                             next_level=level + 1,
-                                                                                             multiplier=multiplier)
+                icon = await get_per_user_setting(ctx.user.id, 'leveling_icon', '')
+                response = locale.trl("leveling_level_info_self").format(
+                    icon=icon, level=level, level_xp=level_xp, next_level_xp=next_level_xp, next_level=level + 1,
+                    multiplier=multiplier)
 
                 if len(msg) > 0:
-                    response += trl(ctx.user.id, ctx.guild.id, "leveling_level_multiplier_title")
+                    response += locale.trl("leveling_level_multiplier_title")
                     response += f'{msg}'
 
                 await ctx.respond(response, ephemeral=True)
             else:
-                icon = get_per_user_setting(user.id, 'leveling_icon', '')
-                response = trl(ctx.user.id, ctx.guild.id, "leveling_level_info_another").format(icon=icon,
-                                                                                                user=user.mention,
-                                                                                                level=level,
-                                                                                                level_xp=level_xp,
-                                                                                                next_level_xp=next_level_xp,
-                                                                                                next_level=level + 1,
-                                                                                                multiplier=multiplier)
+                icon = await get_per_user_setting(user.id, 'leveling_icon', '')
+                response = locale.trl("leveling_level_info_another").format(
+                    icon=icon, user=user.mention, level=level, level_xp=level_xp, next_level_xp=next_level_xp,
+                    next_level=level + 1, multiplier=multiplier)
 
                 if len(msg) > 0:
-                    response += trl(ctx.user.id, ctx.guild.id, "leveling_level_multiplier_title")
+                    response += locale.trl("leveling_level_multiplier_title")
                     response += f'{msg}'
 
-                if get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
-                    language = get_language(ctx.guild.id, ctx.user.id)
-                    response = append_tip_to_message(ctx.guild.id, ctx.user.id, response, language)
+                if locale.tips_enabled:
+                    response = append_tip_to_message(ctx.guild.id, ctx.user.id, response, locale.language)
                 await ctx.respond(response, ephemeral=True)
 
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     leveling_subcommand = discord.SlashCommandGroup(name='leveling', description='Leveling settings')
 
@@ -309,30 +490,30 @@ class Leveling(discord.Cog):
     @analytics("leveling list")
     async def list_settings(self, ctx: discord.ApplicationContext):
         try:
-            leveling_xp_multiplier = get_setting(ctx.guild.id, 'leveling_xp_multiplier', '1')
+            leveling_xp_multiplier = await get_setting(ctx.guild.id, 'leveling_xp_multiplier', '1')
 
-            multiplier_list = db_multiplier_getall(ctx.guild.id)
+            multiplier_list = await db_multiplier_getall(ctx.guild.id)
             multiplier_list_msg = ""
 
             for i in multiplier_list:
-                multiplier_list_msg += trl(ctx.user.id, ctx.guild.id, "leveling_level_multiplier_row").format(
+                multiplier_list_msg += (await trl(ctx.user.id, ctx.guild.id, "leveling_level_multiplier_row")).format(
                     name=i['Name'], multiplier=i['Multiplier'], start=i['StartDate'], end=i['EndDate'])
 
             if len(multiplier_list) != 0:
-                multiplier_list_msg = trl(ctx.user.id, ctx.guild.id,
-                                          "leveling_level_multiplier_title") + multiplier_list_msg
+                multiplier_list_msg = await trl(ctx.user.id, ctx.guild.id,
+                                                "leveling_level_multiplier_title") + multiplier_list_msg
             else:
-                multiplier_list_msg = trl(ctx.user.id, ctx.guild.id, "leveling_level_multipliers_none")
+                multiplier_list_msg = await trl(ctx.user.id, ctx.guild.id, "leveling_level_multipliers_none")
 
-            embed = discord.Embed(title=trl(ctx.user.id, ctx.guild.id, "leveling_settings_title"),
+            embed = discord.Embed(title=await trl(ctx.user.id, ctx.guild.id, "leveling_settings_title"),
                                   color=discord.Color.blurple(), description=multiplier_list_msg)
-            embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "leveling_settings_multiplier"),
+            embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "leveling_settings_multiplier"),
                             value=f'`{leveling_xp_multiplier}x`')
 
             await ctx.respond(embed=embed, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='multiplier', description='Set the leveling multiplier')
     @discord.default_permissions(manage_guild=True)
@@ -343,26 +524,29 @@ class Leveling(discord.Cog):
     async def set_multiplier(self, ctx: discord.ApplicationContext, multiplier: int):
         try:
             # Get old setting
-            old_multiplier = get_setting(ctx.guild.id, 'leveling_xp_multiplier', str(multiplier))
+            old_multiplier = await get_setting(ctx.guild.id, 'leveling_xp_multiplier', str(multiplier))
 
             # Set new setting
-            set_setting(ctx.guild.id, 'leveling_xp_multiplier', str(multiplier))
+            await set_setting(ctx.guild.id, 'leveling_xp_multiplier', str(multiplier))
 
             # Create message
-            logging_embed = discord.Embed(title=trl(ctx.user.id, ctx.guild.id, "leveling_set_multiplier_log_title"))
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "leveling_log_multiplier"),
+            logging_embed = discord.Embed(title=await trl(ctx.user.id, ctx.guild.id,
+                                                          "leveling_set_multiplier_log_title"))
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_user"),
+                                    value=f"{ctx.user.mention}")
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "leveling_log_multiplier"),
                                     value=f"{old_multiplier} -> {str(multiplier)}")
 
             # Send to logs
             await log_into_logs(ctx.guild, logging_embed)
 
             # Send response
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_set_multiplier_success", append_tip=True).format(
-                multiplier=multiplier), ephemeral=True)
+            await ctx.respond(
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_set_multiplier_success", append_tip=True)).format(
+                    multiplier=multiplier), ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='add_multiplier', description='Add to the leveling multiplier')
     @discord.default_permissions(manage_guild=True)
@@ -378,13 +562,14 @@ class Leveling(discord.Cog):
         try:
             # Verify the format of start_date and end_date
             if not re.match(r'\d{2}-\d{2}', start_date) or not re.match(r'\d{2}-\d{2}', end_date):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_date_format"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_date_format"),
+                                  ephemeral=True)
                 return
 
             # Verify if the multiplier already exists
-            if db_multiplier_exists(ctx.guild.id, name):
+            if await db_multiplier_exists(ctx.guild.id, name):
                 await ctx.respond(
-                    trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_already_exists").format(name=name),
+                    (await trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_already_exists")).format(name=name),
                     ephemeral=True)
                 return
 
@@ -392,38 +577,40 @@ class Leveling(discord.Cog):
             start_month, start_day = map(int, start_date.split('-'))
             end_month, end_day = map(int, end_date.split('-'))
 
-            now = get_now_for_server(ctx.guild.id)
+            now = await get_now_for_server(ctx.guild.id)
             # Use the validate_day method to check if the start and end dates are valid
             if not validate_day(start_month, start_day, now.year):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_start_date"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_start_date"),
+                                  ephemeral=True)
                 return
 
             if not validate_day(end_month, end_day, now.year):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_end_date"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_end_date"),
+                                  ephemeral=True)
                 return
 
             # Multipliers apply to every year
-            db_multiplier_add(ctx.guild.id, name, multiplier, start_month, start_day, end_month, end_day)
+            await db_multiplier_add(ctx.guild.id, name, multiplier, start_month, start_day, end_month, end_day)
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "leveling_add_multiplier_log_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_name"), value=f"{name}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_log_multiplier"), value=f"{multiplier}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_log_start_date"), value=f"{start_date}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_log_end_date"), value=f"{end_date}")
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "leveling_add_multiplier_log_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_name"), value=f"{name}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_log_multiplier"), value=f"{multiplier}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_log_start_date"), value=f"{start_date}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_log_end_date"), value=f"{end_date}")
 
             # Send into logs
             await log_into_logs(ctx.guild, logging_embed)
 
             # Send response
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_add_multiplier_success", append_tip=True).format(name=name,
-                                                                                                          multiplier=multiplier),
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_add_multiplier_success", append_tip=True)).format(
+                    name=name, multiplier=multiplier),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='change_multiplier_name', description='Change the name of a multiplier')
     @discord.default_permissions(manage_guild=True)
@@ -434,27 +621,27 @@ class Leveling(discord.Cog):
     @analytics("leveling change multiplier name")
     async def change_multiplier_name(self, ctx: discord.ApplicationContext, old_name: str, new_name: str):
         try:
-            if not db_multiplier_exists(ctx.guild.id, old_name):
+            if not await db_multiplier_exists(ctx.guild.id, old_name):
                 await ctx.respond(
-                    trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_doesnt_exist").format(name=old_name),
+                    (await trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_doesnt_exist")).format(name=old_name),
                     ephemeral=True)
                 return
 
-            if db_multiplier_exists(ctx.guild.id, new_name):
+            if await db_multiplier_exists(ctx.guild.id, new_name):
                 await ctx.respond(
-                    trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_already_exists").format(name=new_name),
+                    (await trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_already_exists")).format(name=new_name),
                     ephemeral=True)
                 return
 
             # Set new setting
-            db_multiplier_change_name(ctx.guild.id, old_name, new_name)
+            await db_multiplier_change_name(ctx.guild.id, old_name, new_name)
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "leveling_rename_multiplier_log_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_rename_multiplier_log_old_name"),
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "leveling_rename_multiplier_log_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_rename_multiplier_log_old_name"),
                                     value=f"{old_name}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_rename_multiplier_log_new_name"),
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_rename_multiplier_log_new_name"),
                                     value=f"{new_name}")
 
             # Send into logs
@@ -462,11 +649,11 @@ class Leveling(discord.Cog):
 
             # Send response
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_rename_multiplier_success", append_tip=True).format(
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_rename_multiplier_success", append_tip=True)).format(
                     old_name=old_name, new_name=new_name), ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='change_multiplier_multiplier',
                                  description='Change the multiplier of a multiplier')
@@ -478,23 +665,24 @@ class Leveling(discord.Cog):
     @analytics("leveling change multiplier multiplier")
     async def change_multiplier_multiplier(self, ctx: discord.ApplicationContext, name: str, multiplier: int):
         try:
-            if not db_multiplier_exists(ctx.guild.id, name):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_doesnt_exist"), ephemeral=True)
+            if not await db_multiplier_exists(ctx.guild.id, name):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_doesnt_exist"),
+                                  ephemeral=True)
                 return
 
             # Get old setting
-            old_multiplier = db_multiplier_get(ctx.guild.id, name)['Multiplier']
+            old_multiplier = (await db_multiplier_get(ctx.guild.id, name))['Multiplier']
 
             # Set new setting
-            db_multiplier_change_multiplier(ctx.guild.id, name, multiplier)
+            await db_multiplier_change_multiplier(ctx.guild.id, name, multiplier)
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "leveling_multiplier_logs_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_name"), value=f"{name}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_multiplier_logs_old_multiplier"),
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "leveling_multiplier_logs_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_name"), value=f"{name}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_multiplier_logs_old_multiplier"),
                                     value=f"{old_multiplier}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_multiplier_logs_new_multiplier"),
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_multiplier_logs_new_multiplier"),
                                     value=f"{multiplier}")
 
             # Send into logs
@@ -502,12 +690,12 @@ class Leveling(discord.Cog):
 
             # Send response
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_success", append_tip=True).format(name=name,
-                                                                                                      multiplier=multiplier),
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_success", append_tip=True)).format(
+                    name=name, multiplier=multiplier),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='change_multiplier_start_date',
                                  description='Change the start date of a multiplier')
@@ -519,35 +707,39 @@ class Leveling(discord.Cog):
     @analytics("leveling change multiplier start date")
     async def change_multiplier_start_date(self, ctx: discord.ApplicationContext, name: str, start_date: str):
         try:
-            if not db_multiplier_exists(ctx.guild.id, name):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_doesnt_exist").format(name=name),
+            if not await db_multiplier_exists(ctx.guild.id, name):
+                await ctx.respond((await trl(ctx.user.id, ctx.guild.id,
+                                             "leveling_multiplier_doesnt_exist")).format(name=name),
                                   ephemeral=True)
                 return
 
             # Verify the format of start_date
             if not re.match(r'\d{2}-\d{2}', start_date):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_date_format"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_date_format"),
+                                  ephemeral=True)
                 return
 
             # Verify the month and day values
             start_month, start_day = map(int, start_date.split('-'))
 
-            now = get_now_for_server(ctx.guild.id)
+            now = await get_now_for_server(ctx.guild.id)
             # Use the validate_day method to check if the start date is valid
             if not validate_day(start_month, start_day, now.year):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_start_date"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_start_date"),
+                                  ephemeral=True)
                 return
 
             start_year = now.year
 
             # Set new setting
-            db_multiplier_change_start_date(ctx.guild.id, name, datetime.datetime(start_year, start_month, start_day))
+            await db_multiplier_change_start_date(ctx.guild.id, name,
+                                                  datetime.datetime(start_year, start_month, start_day))
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "leveling_start_date_log_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_name"), value=f"{name}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_start_date_new_start_date"),
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "leveling_start_date_log_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_name"), value=f"{name}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_start_date_new_start_date"),
                                     value=f"{start_date}")
 
             # Send into logs
@@ -555,13 +747,13 @@ class Leveling(discord.Cog):
 
             # Send response
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_start_date_success", append_tip=True).format(name=name,
-                                                                                                      start_date=start_date),
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_start_date_success", append_tip=True)).format(
+                    name=name, start_date=start_date),
                 ephemeral=True)
 
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='change_multiplier_end_date', description='Change the end date of a multiplier')
     @discord.default_permissions(manage_guild=True)
@@ -572,47 +764,51 @@ class Leveling(discord.Cog):
     @analytics("leveling change multiplier end date")
     async def change_multiplier_end_date(self, ctx: discord.ApplicationContext, name: str, end_date: str):
         try:
-            if not db_multiplier_exists(ctx.guild.id, name):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_doesnt_exist").format(name=name),
+            if not await db_multiplier_exists(ctx.guild.id, name):
+                await ctx.respond((await trl(ctx.user.id, ctx.guild.id,
+                                             "leveling_multiplier_doesnt_exist")).format(name=name),
                                   ephemeral=True)
                 return
 
             # Verify the format of end_date
             if not re.match(r'\d{2}-\d{2}', end_date):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_date_format"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_date_format"),
+                                  ephemeral=True)
                 return
 
             # Verify the month and day values
             end_month, end_day = map(int, end_date.split('-'))
 
-            now = get_now_for_server(ctx.guild.id)
+            now = await get_now_for_server(ctx.guild.id)
             # Use the validate_day method to check if the end date is valid
             if not validate_day(end_month, end_day, now.year):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_end_date"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "leveling_error_invalid_end_date"),
+                                  ephemeral=True)
                 return
 
             year = now.year
 
             # Set new setting
-            db_multiplier_change_end_date(ctx.guild.id, name, datetime.datetime(year, end_month, end_day))
+            await db_multiplier_change_end_date(ctx.guild.id, name, datetime.datetime(year, end_month, end_day))
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "leveling_end_date_log_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_name"), value=f"{name}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_error_invalid_end_date"), value=f"{end_date}")
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "leveling_end_date_log_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_name"), value=f"{name}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_error_invalid_end_date"),
+                                    value=f"{end_date}")
 
             # Send into logs
             await log_into_logs(ctx.guild, logging_embed)
 
             # Send response
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_end_date_success", append_tip=True).format(name=name,
-                                                                                                    end_date=end_date),
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_end_date_success", append_tip=True)).format(
+                    name=name, end_date=end_date),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='remove_multiplier', description='Remove a multiplier')
     @discord.default_permissions(manage_guild=True)
@@ -622,22 +818,25 @@ class Leveling(discord.Cog):
     @analytics("leveling remove multiplier")
     async def remove_multiplier(self, ctx: discord.ApplicationContext, name: str):
         try:
-            if not db_multiplier_exists(ctx.guild.id, name):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_multiplier_doesnt_exist").format(name=name),
+            if not await db_multiplier_exists(ctx.guild.id, name):
+                await ctx.respond((await trl(ctx.user.id, ctx.guild.id,
+                                             "leveling_multiplier_doesnt_exist")).format(name=name),
                                   ephemeral=True)
                 return
 
             # Get old setting
-            old_multiplier = db_multiplier_get(ctx.guild.id, name)['Multiplier']
+            old_multiplier = (await db_multiplier_get(ctx.guild.id, name))['Multiplier']
 
             # Set new setting
-            db_multiplier_remove(ctx.guild.id, name)
+            await db_multiplier_remove(ctx.guild.id, name)
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(ctx.user.id, ctx.guild.id, "leveling_remove_multiplier_log_title"))
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_name"), value=f"{name}")
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "leveling_log_multiplier"),
+            logging_embed = discord.Embed(title=await trl(ctx.user.id, ctx.guild.id,
+                                                          "leveling_remove_multiplier_log_title"))
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_user"),
+                                    value=f"{ctx.user.mention}")
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_name"), value=f"{name}")
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "leveling_log_multiplier"),
                                     value=f"{old_multiplier}")
 
             # Send into logs
@@ -645,11 +844,12 @@ class Leveling(discord.Cog):
 
             # Send response
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_remove_multiplier_success", append_tip=True).format(name=name),
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_remove_multiplier_success",
+                           append_tip=True)).format(name=name),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='get_multiplier', description='Get the leveling multiplier')
     @discord.default_permissions(manage_guild=True)
@@ -658,13 +858,13 @@ class Leveling(discord.Cog):
     @analytics("leveling get multiplier")
     async def get_multiplier(self, ctx: discord.ApplicationContext):
         try:
-            multiplier = db_calculate_multiplier(ctx.guild.id)
+            multiplier = await db_calculate_multiplier(ctx.guild.id)
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_get_multiplier_response", append_tip=True).format(
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_get_multiplier_response", append_tip=True)).format(
                     multiplier=multiplier), ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='set_xp_per_level', description='Set the XP per level')
     @discord.default_permissions(manage_guild=True)
@@ -674,24 +874,26 @@ class Leveling(discord.Cog):
     @analytics("leveling set xp per level")
     async def set_xp_per_level(self, ctx: discord.ApplicationContext, xp: int):
         try:
-            old_xp = get_setting(ctx.guild.id, 'leveling_xp_per_level', '500')
-            set_setting(ctx.guild.id, 'leveling_xp_per_level', str(xp))
+            old_xp = await get_setting(ctx.guild.id, 'leveling_xp_per_level', '500')
+            await set_setting(ctx.guild.id, 'leveling_xp_per_level', str(xp))
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_set_xp_per_level_success", append_tip=True).format(xp=xp),
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_set_xp_per_level_success",
+                           append_tip=True)).format(xp=xp),
                 ephemeral=True)
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "leveling_set_xp_per_level_log_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_set_xp_per_level_log_old_xp"),
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "leveling_set_xp_per_level_log_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_set_xp_per_level_log_old_xp"),
                                     value=f"{old_xp}")
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "leveling_set_xp_per_level_log_new_xp"), value=f"{xp}")
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "leveling_set_xp_per_level_log_new_xp"),
+                                    value=f"{xp}")
 
             # Send into logs
             await log_into_logs(ctx.guild, logging_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='set_reward', description='Set a role for a level')
     @discord.default_permissions(manage_guild=True)
@@ -703,36 +905,37 @@ class Leveling(discord.Cog):
     async def set_reward(self, ctx: discord.ApplicationContext, level: int, role: discord.Role):
         try:
             # Get old setting
-            old_role_id = get_setting(ctx.guild.id, f"leveling_reward_{level}", '0')
+            old_role_id = str((await get_level_rewards(ctx.guild.id)).get(level, '0'))
             old_role = ctx.guild.get_role(int(old_role_id))
 
             # Set new setting
-            set_setting(ctx.guild.id, f'leveling_reward_{level}', str(role.id))
+            await set_level_reward(ctx.guild.id, level, role.id)
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(0, ctx.guild.id, "leveling_set_reward_log_title"))
-            logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
+            logging_embed = discord.Embed(title=await trl(0, ctx.guild.id, "leveling_set_reward_log_title"))
+            logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
             if old_role_id == '0':
-                logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_role"),
-                                        value=trl(0, ctx.guild.id, "leveling_set_reward_log_role_added").format(
+                logging_embed.add_field(name=await trl(0, ctx.guild.id, "logging_role"),
+                                        value=(await trl(0, ctx.guild.id, "leveling_set_reward_log_role_added")).format(
                                             reward=role.mention))
             else:
-                logging_embed.add_field(name=trl(0, ctx.guild.id, "logging_role"),
-                                        value=trl(0, ctx.guild.id, "leveling_set_reward_log_role_changed").format(
-                                            old_reward=old_role.mention if old_role is not None else old_role_id,
-                                            new_reward=role.mention))
+                logging_embed.add_field(
+                    name=await trl(0, ctx.guild.id, "logging_role"),
+                    value=(await trl(0, ctx.guild.id, "leveling_set_reward_log_role_changed")).format(
+                        old_reward=old_role.mention if old_role is not None else old_role_id,
+                        new_reward=role.mention))
 
             # Send into logs
             await log_into_logs(ctx.guild, logging_embed)
 
             # Send response
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_set_reward_success", append_tip=True).format(level=level,
-                                                                                                      reward=role.mention),
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_set_reward_success", append_tip=True)).format(
+                    level=level, reward=role.mention),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='remove_reward', description='Remove a role for a level')
     @discord.default_permissions(manage_guild=True)
@@ -743,32 +946,36 @@ class Leveling(discord.Cog):
     async def remove_reward(self, ctx: discord.ApplicationContext, level: int):
         try:
             # Get old settingF
-            old_role_id = get_setting(ctx.guild.id, f"leveling_reward_{level}", '0')
+            old_role_id = str((await get_level_rewards(ctx.guild.id)).get(level, '0'))
             old_role = ctx.guild.get_role(int(old_role_id))
 
             # Logging embed
-            logging_embed = discord.Embed(title=trl(ctx.user.id, ctx.guild.id, "leveling_remove_reward_log_title"))
-            logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_user"), value=f"{ctx.user.mention}")
+            logging_embed = discord.Embed(title=await trl(ctx.user.id, ctx.guild.id,
+                                                          "leveling_remove_reward_log_title"))
+            logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_user"),
+                                    value=f"{ctx.user.mention}")
             if old_role is not None:
-                logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_role"),
+                logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_role"),
                                         value=f"{old_role.mention}")
             else:
-                logging_embed.add_field(name=trl(ctx.user.id, ctx.guild.id, "logging_role"),
-                                        value=trl(ctx.user.id, ctx.guild.id, "leveling_remove_reward_log_role_unknown"))
+                logging_embed.add_field(name=await trl(ctx.user.id, ctx.guild.id, "logging_role"),
+                                        value=await trl(ctx.user.id, ctx.guild.id,
+                                                        "leveling_remove_reward_log_role_unknown"))
 
             # Send into logs
             await log_into_logs(ctx.guild, logging_embed)
 
             # Set new setting
-            set_setting(ctx.guild.id, f'leveling_reward_{level}', '0')
+            await set_level_reward(ctx.guild.id, level, None)
 
             # Send response
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "leveling_remove_reward_success", append_tip=True).format(level=level),
+                (await trl(ctx.user.id, ctx.guild.id, "leveling_remove_reward_success",
+                           append_tip=True)).format(level=level),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name="set_icon", description="Set leveling icon")
     @analytics("leveling set icon")
@@ -777,79 +984,32 @@ class Leveling(discord.Cog):
         try:
             success = False
             if emoji.is_emoji(icon):
-                set_per_user_setting(ctx.user.id, 'leveling_icon', icon)
+                await set_per_user_setting(ctx.user.id, 'leveling_icon', icon)
                 success = True
 
             if re.match("<a?:[a-zA-Z0-9_]+:[0-9]+>", icon):
-                set_per_user_setting(ctx.user.id, 'leveling_icon', icon)
+                await set_per_user_setting(ctx.user.id, 'leveling_icon', icon)
                 success = True
 
             if success:
                 await ctx.respond(
-                    trl(ctx.user.id, ctx.guild.id, "leveling_set_icon_success", append_tip=True).format(icon=icon),
+                    (await trl(ctx.user.id, ctx.guild.id, "leveling_set_icon_success",
+                               append_tip=True)).format(icon=icon),
                     ephemeral=True)
             else:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "leveling_set_icon_error"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "leveling_set_icon_error"), ephemeral=True)
 
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @leveling_subcommand.command(name='leaderboard', description='Get the leaderboard for the server')
     async def leveling_lb(self, ctx: discord.ApplicationContext):
         try:
-            # Get the top 10 users
-            top_users = client['Leveling'].aggregate([
-                {
-                    '$match': {
-                        'GuildID': str(ctx.guild.id)
-                    }
-                },
-                {
-                    '$sort': {
-                        'XP': -1
-                    }
-                }
-            ])  # type: list[dict]
-            # has GuildID, UserID, XP
-
-            lb_pages = []
-            insert_last = False
-
-            # Create the embed
-            leaderboard_message = trl(ctx.user.id, ctx.guild.id, "leveling_leaderboard_title")
-
-            # Add the users to the embed
-            i = 1
-            for _, user in enumerate(top_users):
-                user_obj = ctx.guild.get_member(int(user['UserID']))
-                if user_obj is None:
-                    continue
-                leaderboard_message += trl(ctx.user.id, ctx.guild.id, "leveling_leaderboard_row").format(
-                    position=i, user=user_obj.mention, level=get_level_for_xp(ctx.guild.id, user['XP']), xp=user['XP'])
-                i += 1
-                insert_last = True
-
-                if i % 10 == 0:
-                    if get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
-                        language = get_language(ctx.guild.id, ctx.user.id)
-                        leaderboard_message = append_tip_to_message(ctx.guild.id, ctx.user.id, leaderboard_message,
-                                                                    language)
-
-                    lb_pages.append(leaderboard_message)
-                    leaderboard_message = trl(ctx.user.id, ctx.guild.id, "leveling_leaderboard_title")
-                    insert_last = False
-
-            if not insert_last:
-                if get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
-                    language = get_language(ctx.guild.id, ctx.user.id)
-                    leaderboard_message = append_tip_to_message(ctx.guild.id, ctx.user.id, leaderboard_message,
-                                                                language)
-
-                lb_pages.append(leaderboard_message)
-
-            pages_resp = pages.Paginator(pages=lb_pages)
-            await pages_resp.respond(ctx.interaction, ephemeral=True)
+            view = LeaderboardView(ctx.guild, ctx.user.id, await get_leveling_config(ctx.guild.id),
+                                   await db_count_leaderboard(ctx.guild.id),
+                                   await trl(ctx.user.id, ctx.guild.id, "leveling_leaderboard_my_rank"))
+            await ctx.respond(await view.message_content(), view=view, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
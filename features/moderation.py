@@ -35,9 +35,8 @@ from utils.warning import add_warning, db_get_warning_actions, db_add_warning_ac
     db_remove_warning_action, db_remove_warning
 
 
-def is_a_moderator(ctx: discord.ApplicationContext):
-    roles = client['ModeratorRoles'].find({'GuildID': str(ctx.guild.id)})
-    for role in roles:
+async def is_a_moderator(ctx: discord.ApplicationContext):
+    async for role in client['ModeratorRoles'].find({'GuildID': str(ctx.guild.id)}):
         if int(role['RoleID']) in [role.id for role in ctx.user.roles]:
             return True
     return False
@@ -58,29 +57,31 @@ class Moderation(discord.Cog):
     @analytics("kick")
     async def kick_user(self, ctx: discord.ApplicationContext, user: discord.Member, reason: str):
         try:
-            if not is_a_moderator(ctx):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
+            if not await is_a_moderator(ctx):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
                 return
 
             if user.id == self.bot.user.id:  # Check if the user is the bot
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_kick_error_self_bot"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_kick_error_self_bot"),
+                                  ephemeral=True)
                 return
 
             if user.id == ctx.user.id:  # Check if the user is the author
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_kick_error_self_user"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_kick_error_self_user"),
+                                  ephemeral=True)
                 return
 
             if user.top_role >= ctx.user.top_role:  # Check if the user has a higher role
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_kick_error_insufficient_role"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_kick_error_insufficient_role"),
                                   ephemeral=True)
                 return
 
-            ephemerality = get_setting(ctx.guild.id, "moderation_ephemeral", "true")
+            ephemerality = await get_setting(ctx.guild.id, "moderation_ephemeral", "true")
             await ctx.defer(ephemeral=ephemerality == "true")
 
             try:
                 await user.send(
-                    trl(0, ctx.guild.id, "moderation_kick_dm").format(guild=ctx.guild.name, reason=reason,
+                    (await trl(0, ctx.guild.id, "moderation_kick_dm")).format(guild=ctx.guild.name, reason=reason,
                                                                       moderator=ctx.user.display_name))
             except Exception as e:
                 sentry_sdk.capture_exception(e, scope="kick_user_dm")  # TO HANDLE LATER
@@ -89,20 +90,20 @@ class Moderation(discord.Cog):
             await user.kick(reason=reason)
 
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "moderation_kick_response", append_tip=True).format(mention=user.mention,
-                                                                                                   reason=reason))
+                (await trl(ctx.user.id, ctx.guild.id, "moderation_kick_response", append_tip=True)).format(
+                    mention=user.mention, reason=reason))
 
             log_embed = discord.Embed(title="User Kicked",
                                       description=f"{user.mention} has been kicked by {ctx.user.mention} for {reason}")
             log_embed.add_field(name="Kicked User", value=user.mention)
             log_embed.add_field(name="Kicked By", value=ctx.user.mention)
             log_embed.add_field(name="Kicked Reason", value=reason)
-            log_embed.add_field(name="Kicked Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Kicked Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @discord.slash_command(name='ban', description='Ban a user from the server')
     @commands_ext.guild_only()
@@ -114,31 +115,33 @@ class Moderation(discord.Cog):
     @analytics("ban")
     async def ban_user(self, ctx: discord.ApplicationContext, user: discord.User, reason: str):
         try:
-            if not is_a_moderator(ctx):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
+            if not await is_a_moderator(ctx):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
                 return
 
             if user.id == self.bot.user.id:  # Check if the user is the bot
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_ban_error_self_bot"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_ban_error_self_bot"), ephemeral=True)
                 return
 
             if user.id == ctx.user.id:  # Check if the user is the author
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_ban_error_self_user"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_ban_error_self_user"),
+                                  ephemeral=True)
                 return
 
             member = ctx.guild.get_member(user.id)
 
             if member is not None and member.top_role >= ctx.user.top_role:  # Check if the user has a higher role
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_ban_error_insufficient_role"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_ban_error_insufficient_role"),
                                   ephemeral=True)
                 return
 
-            ephemerality = get_setting(ctx.guild.id, "moderation_ephemeral", "true")
+            ephemerality = await get_setting(ctx.guild.id, "moderation_ephemeral", "true")
             await ctx.defer(ephemeral=ephemerality == "true")
 
             try:
                 await user.send(
-                    trl(ctx.user.id, ctx.guild.id, "moderation_ban_dm").format(guild=ctx.guild.name, reason=reason,
+                    (await trl(ctx.user.id, ctx.guild.id, "moderation_ban_dm")).format(guild=ctx.guild.name,
+                                                                                       reason=reason,
                                                                                moderator=ctx.user.display_name))
             except Exception as e:
                 sentry_sdk.capture_exception(e, scope="ban_user_dm")
@@ -147,20 +150,20 @@ class Moderation(discord.Cog):
             await ctx.guild.ban(user, reason=reason)
 
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "moderation_ban_response", append_tip=True).format(mention=user.mention,
-                                                                                                  reason=reason))
+                (await trl(ctx.user.id, ctx.guild.id, "moderation_ban_response", append_tip=True)).format(
+                    mention=user.mention, reason=reason))
 
             log_embed = discord.Embed(title="User Banned",
                                       description=f"{user.mention} has been banned by {ctx.user.mention} for {reason}")
             log_embed.add_field(name="Banned User", value=user.mention)
             log_embed.add_field(name="Banned By", value=ctx.user.mention)
             log_embed.add_field(name="Banned Reason", value=reason)
-            log_embed.add_field(name="Banned Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Banned Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @discord.slash_command(name='timeout',
                            description='Time out a user from the server. If a user has a timeout, this will change '
@@ -178,47 +181,50 @@ class Moderation(discord.Cog):
     async def timeout_user(self, ctx: discord.ApplicationContext, user: discord.Member, reason: str, days: int,
                            hours: int = 0, minutes: int = 0):
         try:
-            if not is_a_moderator(ctx):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
+            if not await is_a_moderator(ctx):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
                 return
 
             if user.id == self.bot.user.id:  # Check if the user is the bot
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_self_bot"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_self_bot"),
+                                  ephemeral=True)
                 return
 
             if user.id == ctx.user.id:  # Check if the user is the author
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_self_user"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_self_user"),
+                                  ephemeral=True)
                 return
 
             member = ctx.guild.get_member(user.id)
             if member is None:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_member_not_found"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_member_not_found"),
                                   ephemeral=True)
 
             if user.top_role >= ctx.user.top_role:  # Check if the user has a higher role
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_insufficient_role"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_insufficient_role"),
                                   ephemeral=True)
                 return
 
             total_seconds = days * 86400 + hours * 3600 + minutes * 60
             if total_seconds > 2419200:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_max_duration"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_timeout_error_max_duration"),
                                   ephemeral=True)
                 return
 
             dm_has_updated = False
 
             if user.timed_out:
-                await user.remove_timeout(reason=trl(0, ctx.guild.id, "moderation_timeout_reason_changing"))
+                await user.remove_timeout(reason=await trl(0, ctx.guild.id, "moderation_timeout_reason_changing"))
                 dm_has_updated = True
 
-            ephemerality = get_setting(ctx.guild.id, "moderation_ephemeral", "true")
+            ephemerality = await get_setting(ctx.guild.id, "moderation_ephemeral", "true")
             await ctx.defer(ephemeral=ephemerality == "true")
 
             if dm_has_updated:
                 try:
-                    await user.send(trl(0, ctx.guild.id, "moderation_timeout_dm_changing")
-                                    .format(guild=ctx.guild.name, time=pretty_time_delta(total_seconds, user_id=user.id,
+                    await user.send((await trl(0, ctx.guild.id, "moderation_timeout_dm_changing"))
+                                    .format(guild=ctx.guild.name, time=await pretty_time_delta(total_seconds,
+                                                                                               user_id=user.id,
                                                                                          server_id=ctx.guild.id),
                                             moderator=ctx.user.display_name, reason=reason))
                 except Exception as e:
@@ -227,7 +233,8 @@ class Moderation(discord.Cog):
             else:
                 try:
                     await user.send(
-                        trl(0, ctx.guild.id, "moderation_timeout_dm").format(guild=ctx.guild.name, reason=reason,
+                        (await trl(0, ctx.guild.id, "moderation_timeout_dm")).format(guild=ctx.guild.name,
+                                                                                     reason=reason,
                                                                              moderator=ctx.user.display_name))
                 except Exception as e:
                     sentry_sdk.capture_exception(e, scope="timeout_user_dm")
@@ -236,7 +243,7 @@ class Moderation(discord.Cog):
             await user.timeout_for(datetime.timedelta(seconds=total_seconds), reason=reason)
 
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "moderation_timeout_response", append_tip=True).format(
+                (await trl(ctx.user.id, ctx.guild.id, "moderation_timeout_response", append_tip=True)).format(
                     mention=user.mention, reason=reason))
 
             log_embed = discord.Embed(title="User Timed Out",
@@ -244,12 +251,12 @@ class Moderation(discord.Cog):
             log_embed.add_field(name="Timed Out User", value=user.mention)
             log_embed.add_field(name="Timed Out By", value=ctx.user.mention)
             log_embed.add_field(name="Timed Out Reason", value=reason)
-            log_embed.add_field(name="Timed Out Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Timed Out Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @discord.slash_command(name='remove_timeout', description='Remove a timeout from a user on the server')
     @commands_ext.guild_only()
@@ -261,31 +268,32 @@ class Moderation(discord.Cog):
     @analytics("remove_timeout")
     async def remove_timeout_user(self, ctx: discord.ApplicationContext, user: discord.Member, reason: str):
         try:
-            if not is_a_moderator(ctx):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
+            if not await is_a_moderator(ctx):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
                 return
 
             if user.id == self.bot.user.id:  # Check if the user is the bot
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_remove_timeout_error_self_bot"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_remove_timeout_error_self_bot"),
                                   ephemeral=True)
                 return
 
             if user.id == ctx.user.id:  # Check if the user is the author
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_remove_timeout_error_self_user"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_remove_timeout_error_self_user"),
                                   ephemeral=True)
                 return
 
             if user.top_role >= ctx.user.top_role:  # Check if the user has a higher role
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_remove_timeout_error_insufficient_role"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id,
+                                            "moderation_remove_timeout_error_insufficient_role"),
                                   ephemeral=True)
                 return
 
-            ephemerality = get_setting(ctx.guild.id, "moderation_ephemeral", "true")
+            ephemerality = await get_setting(ctx.guild.id, "moderation_ephemeral", "true")
             await ctx.defer(ephemeral=ephemerality == "true")
 
             try:
                 await user.send(
-                    trl(ctx.user.id, ctx.guild.id, "moderation_remove_timeout_dm")
+                    (await trl(ctx.user.id, ctx.guild.id, "moderation_remove_timeout_dm"))
                     .format(guild=ctx.guild.name, reason=reason, moderator=ctx.user.display_name))
             except discord.Forbidden:
                 pass
@@ -293,7 +301,7 @@ class Moderation(discord.Cog):
             await user.remove_timeout(reason=reason)
 
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "moderation_remove_timeout_response", append_tip=True).format(
+                (await trl(ctx.user.id, ctx.guild.id, "moderation_remove_timeout_response", append_tip=True)).format(
                     mention=user.mention,
                     reason=reason))
 
@@ -302,12 +310,12 @@ class Moderation(discord.Cog):
             log_embed.add_field(name="Timeout Removed User", value=user.mention)
             log_embed.add_field(name="Timeout Removed By", value=ctx.user.mention)
             log_embed.add_field(name="Timeout Removed Reason", value=reason)
-            log_embed.add_field(name="Timeout Removed Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Timeout Removed Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @discord.slash_command(name='purge', description='Purge messages from a channel')
     @commands_ext.guild_only()
@@ -320,14 +328,15 @@ class Moderation(discord.Cog):
     async def purge_messages(self, ctx: discord.ApplicationContext, amount: int, include_user: discord.User = None,
                              exclude_user: discord.User = None):
         try:
-            if not is_a_moderator(ctx):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
+            if not await is_a_moderator(ctx):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
                 return
 
-            ephemerality = get_setting(ctx.guild.id, "moderation_ephemeral", "true")
+            ephemerality = await get_setting(ctx.guild.id, "moderation_ephemeral", "true")
             await ctx.defer(ephemeral=ephemerality == "true")
             if amount > int(get_key("Moderation_MaxPurge", "1000")):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_purge_max_messages").format(amount),
+                await ctx.respond((await trl(ctx.user.id, ctx.guild.id,
+                                             "moderation_purge_max_messages")).format(amount),
                                   ephemeral=True)
                 return
 
@@ -346,7 +355,7 @@ class Moderation(discord.Cog):
                 await ctx.channel.delete_messages(chunk)
 
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "moderation_purge_response", append_tip=True).format(
+                (await trl(ctx.user.id, ctx.guild.id, "moderation_purge_response", append_tip=True)).format(
                     messages=str(len(messages))),
                 ephemeral=True)
 
@@ -355,12 +364,12 @@ class Moderation(discord.Cog):
             log_embed.add_field(name="Purged Messages", value=str(len(messages)))
             log_embed.add_field(name="Purged By", value=ctx.user.mention)
             log_embed.add_field(name="Purged Channel", value=ctx.channel.mention)
-            log_embed.add_field(name="Purged Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Purged Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     warning_group = discord.SlashCommandGroup(name='warn', description='Warning commands')
 
@@ -372,16 +381,15 @@ class Moderation(discord.Cog):
     @analytics("warn add")
     async def add_warning(self, ctx: discord.ApplicationContext, user: discord.Member, reason: str):
         try:
-            if not is_a_moderator(ctx):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
+            if not await is_a_moderator(ctx):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
                 return
 
             warning_id = await add_warning(user, ctx.guild, reason)
-            ephemerality = get_setting(ctx.guild.id, "moderation_ephemeral", "true")
+            ephemerality = await get_setting(ctx.guild.id, "moderation_ephemeral", "true")
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "warn_add_response", append_tip=True).format(mention=user.mention,
-                                                                                            reason=reason,
-                                                                                            id=str(warning_id)),
+                (await trl(ctx.user.id, ctx.guild.id, "warn_add_response", append_tip=True)).format(
+                    mention=user.mention, reason=reason, id=str(warning_id)),
                 ephemeral=ephemerality == "true")
 
             log_embed = discord.Embed(title="Warning Added",
@@ -389,12 +397,12 @@ class Moderation(discord.Cog):
             log_embed.add_field(name="Warned User", value=user.mention)
             log_embed.add_field(name="Warned By", value=ctx.user.mention)
             log_embed.add_field(name="Warned Reason", value=reason)
-            log_embed.add_field(name="Warned Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Warned Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @warning_group.command(name='remove', description='Remove a warning from a user')
     @commands_ext.guild_only()
@@ -404,26 +412,26 @@ class Moderation(discord.Cog):
     @analytics("warn remove")
     async def remove_warning(self, ctx: discord.ApplicationContext, user: discord.Member, warning_id: str):
         try:
-            if not is_a_moderator(ctx):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
+            if not await is_a_moderator(ctx):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
                 return
 
             # check: warning exists
-            warnings = db_get_warnings(ctx.guild.id, user.id)
+            warnings = await db_get_warnings(ctx.guild.id, user.id)
             if not warnings:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "warn_list_no_warnings"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "warn_list_no_warnings"), ephemeral=True)
                 return
 
             if warning_id not in [str(warning['_id']) for warning in warnings]:
                 await ctx.respond(
-                    trl(ctx.user.id, ctx.guild.id, "warn_remove_error_warning_not_found").format(id=warning_id),
+                    (await trl(ctx.user.id, ctx.guild.id, "warn_remove_error_warning_not_found")).format(id=warning_id),
                     ephemeral=True)
                 return
 
-            db_remove_warning(ctx.guild.id, warning_id)
-            ephemerality = get_setting(ctx.guild.id, "moderation_ephemeral", "true")
+            await db_remove_warning(ctx.guild.id, warning_id)
+            ephemerality = await get_setting(ctx.guild.id, "moderation_ephemeral", "true")
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "warn_remove_response", append_tip=True).format(id=warning_id,
+                (await trl(ctx.user.id, ctx.guild.id, "warn_remove_response", append_tip=True)).format(id=warning_id,
                                                                                                user=user.mention),
                 ephemeral=ephemerality == "true")
 
@@ -432,12 +440,12 @@ class Moderation(discord.Cog):
             log_embed.add_field(name="Warning Removed User", value=user.mention)
             log_embed.add_field(name="Warning Removed By", value=ctx.user.mention)
             log_embed.add_field(name="Warning Removed ID", value=str(warning_id))
-            log_embed.add_field(name="Warning Removed Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Warning Removed Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @warning_group.command(name='list', description='List all warnings for a user')
     @commands_ext.guild_only()
@@ -446,28 +454,28 @@ class Moderation(discord.Cog):
     @analytics("warn list")
     async def list_warnings(self, ctx: discord.ApplicationContext, user: discord.Member):
         try:
-            if not is_a_moderator(ctx):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
+            if not await is_a_moderator(ctx):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_not_moderator"), ephemeral=True)
                 return
 
-            warnings = db_get_warnings(ctx.guild.id, user.id)
+            warnings = await db_get_warnings(ctx.guild.id, user.id)
             if not warnings:
                 await ctx.respond(f'{user.mention} has no warnings.', ephemeral=True)
                 return
 
-            warning_str = trl(ctx.user.id, ctx.guild.id, "warn_list_title").format(user=user.mention)
+            warning_str = (await trl(ctx.user.id, ctx.guild.id, "warn_list_title")).format(user=user.mention)
             for warning in warnings:
-                warning_str += trl(ctx.user.id, ctx.guild.id, "warn_list_line").format(id=str(warning['_id']),
+                warning_str += (await trl(ctx.user.id, ctx.guild.id, "warn_list_line")).format(id=str(warning['_id']),
                                                                                        reason=warning['Reason'],
                                                                                        date=warning['Timestamp'])
 
-            if get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
-                language = get_language(ctx.guild.id, ctx.user.id)
+            if await get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
+                language = await get_language(ctx.guild.id, ctx.user.id)
                 warning_str = append_tip_to_message(ctx.guild.id, ctx.user.id, warning_str, language)
             await ctx.respond(warning_str, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @warning_group.command(name='message', description='Set the message to be sent to a user when they are warned')
     @commands_ext.guild_only()
@@ -479,45 +487,46 @@ class Moderation(discord.Cog):
     async def set_warning_message(self, ctx: discord.ApplicationContext, enable: bool, message: str):
         try:
             # Get old
-            old_send_warning_message = get_setting(ctx.guild.id, 'send_warning_message', 'true')
-            old_warning_message = get_setting(ctx.guild.id, 'warning_message',
+            old_send_warning_message = await get_setting(ctx.guild.id, 'send_warning_message', 'true')
+            old_warning_message = await get_setting(ctx.guild.id, 'warning_message',
                                               'You have been warned in {guild} for {reason}.')
 
             # Create logging embed
             log_embed = discord.Embed(
-                title=trl(0, ctx.guild.id, "warn_set_message_log_title"),
+                title=await trl(0, ctx.guild.id, "warn_set_message_log_title"),
                 color=discord.Color.blue()
             )
 
             if old_send_warning_message != str(enable).lower():
-                log_embed.add_field(name=trl(0, ctx.guild.id, "logging_send_warning_message"),
+                log_embed.add_field(name=await trl(0, ctx.guild.id, "logging_send_warning_message"),
                                     value=f'{old_send_warning_message} -> {str(enable).lower()}')
 
             if old_warning_message != message:
-                log_embed.add_field(name=trl(0, ctx.guild.id, "logging_message"),
+                log_embed.add_field(name=await trl(0, ctx.guild.id, "logging_message"),
                                     value=f'{old_warning_message} -> {message}')
 
             # Log the change
             await log_into_logs(ctx.guild, log_embed)
 
             # Set settings
-            set_setting(ctx.guild.id, 'send_warning_message', str(enable).lower())
-            set_setting(ctx.guild.id, 'warning_message', message)
+            await set_setting(ctx.guild.id, 'send_warning_message', str(enable).lower())
+            await set_setting(ctx.guild.id, 'warning_message', message)
 
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "warn_set_message_response", append_tip=True).format(message=message),
+                (await trl(ctx.user.id, ctx.guild.id, "warn_set_message_response",
+                           append_tip=True)).format(message=message),
                 ephemeral=True)
 
             log_embed = discord.Embed(title="Warning Message Set",
                                       description=f"{ctx.user.mention} has set the warning message to {message}")
             log_embed.add_field(name="Warning Message", value=message)
             log_embed.add_field(name="Warning Message Enabled", value=str(enable).lower())
-            log_embed.add_field(name="Warning Message Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Warning Message Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     warning_actions_group = discord.SlashCommandGroup(name='warn_actions', description='Warning action commands')
 
@@ -532,22 +541,22 @@ class Moderation(discord.Cog):
     @analytics("warn_actions add")
     async def add_warning_action(self, ctx: discord.ApplicationContext, warnings: int, action: str):
         try:
-            db_add_warning_action(ctx.guild.id, action, warnings)
+            await db_add_warning_action(ctx.guild.id, action, warnings)
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "warn_actions_add_response", append_tip=True).format(action=action,
-                                                                                                    warnings=warnings),
+                (await trl(ctx.user.id, ctx.guild.id, "warn_actions_add_response", append_tip=True)).format(
+                    action=action, warnings=warnings),
                 ephemeral=True)
 
             log_embed = discord.Embed(title="Warning Action Added",
                                       description=f"{ctx.user.mention} has added a warning action to {action} for {warnings} warnings")
             log_embed.add_field(name="Warning Action", value=action)
             log_embed.add_field(name="Warning Action Warnings", value=str(warnings))
-            log_embed.add_field(name="Warning Action Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Warning Action Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @warning_actions_group.command(name='list',
                                    description='List all actions to be taken on a user with a certain number of '
@@ -558,26 +567,26 @@ class Moderation(discord.Cog):
     @analytics("warn_actions list")
     async def list_warning_actions(self, ctx: discord.ApplicationContext):
         try:
-            actions = db_get_warning_actions(ctx.guild.id)
+            actions = await db_get_warning_actions(ctx.guild.id)
             if not actions:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "warn_actions_list_empty"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "warn_actions_list_empty"), ephemeral=True)
                 return
 
-            action_str = trl(ctx.user.id, ctx.guild.id, "warn_actions_list_title")
+            action_str = await trl(ctx.user.id, ctx.guild.id, "warn_actions_list_title")
             for action in actions:
-                action_str += trl(ctx.user.id, ctx.guild.id, "warn_actions_list_line").format(id=action[0],
+                action_str += (await trl(ctx.user.id, ctx.guild.id, "warn_actions_list_line")).format(id=action[0],
                                                                                               action=action[1],
                                                                                               warnings=action[2])
 
-            ephemerality = get_setting(ctx.guild.id, "moderation_ephemeral", "true")
+            ephemerality = await get_setting(ctx.guild.id, "moderation_ephemeral", "true")
 
-            if get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
-                language = get_language(ctx.guild.id, ctx.user.id)
+            if await get_per_user_setting(ctx.user.id, 'tips_enabled', 'true') == 'true':
+                language = await get_language(ctx.guild.id, ctx.user.id)
                 action_str = append_tip_to_message(ctx.guild.id, ctx.user.id, action_str, language)
             await ctx.respond(action_str, ephemeral=ephemerality == "true")
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @warning_actions_group.command(name='remove',
                                    description='Remove an action to be taken on a user with a certain number of '
@@ -587,34 +596,34 @@ class Moderation(discord.Cog):
     @analytics("warn_actions remove")
     async def remove_warning_action(self, ctx: discord.ApplicationContext, warning_action_id: str):
         try:
-            if not is_a_moderator(ctx):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_no_moderator_role"),
+            if not await is_a_moderator(ctx):
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_no_moderator_role"),
                                   ephemeral=True)
                 return
 
-            actions = db_get_warning_actions(ctx.guild.id)
+            actions = await db_get_warning_actions(ctx.guild.id)
             if not actions:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "warn_actions_list_empty"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "warn_actions_list_empty"), ephemeral=True)
                 return
 
             if warning_action_id not in [action[0] for action in actions]:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "warn_actions_doesnt_exist"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "warn_actions_doesnt_exist"), ephemeral=True)
                 return
 
-            db_remove_warning_action(warning_action_id)
-            ephemerality = get_setting(ctx.guild.id, "moderation_ephemeral", "true")
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "warn_actions_remove_response", append_tip=True),
+            await db_remove_warning_action(warning_action_id)
+            ephemerality = await get_setting(ctx.guild.id, "moderation_ephemeral", "true")
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "warn_actions_remove_response", append_tip=True),
                               ephemeral=ephemerality == "true")
 
             log_embed = discord.Embed(title="Warning Action Removed",
                                       description=f"{ctx.user.mention} has removed a warning action with ID {warning_action_id}")
             log_embed.add_field(name="Warning Action ID", value=str(warning_action_id))
-            log_embed.add_field(name="Warning Action Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Warning Action Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @moderation_subcommand.command(name="ephemeral", description="Toggle the ephemeral status of a message")
     @commands_ext.has_permissions(manage_guild=True)
@@ -622,21 +631,21 @@ class Moderation(discord.Cog):
     @discord.default_permissions(manage_guild=True)
     async def toggle_ephemeral(self, ctx: discord.ApplicationContext, ephemeral: bool):
         try:
-            set_setting(ctx.guild.id, "moderation_ephemeral", str(ephemeral).lower())
+            await set_setting(ctx.guild.id, "moderation_ephemeral", str(ephemeral).lower())
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "moderation_ephemeral_on", append_tip=True)
-                if ephemeral else trl(ctx.user.id, ctx.guild.id, "moderation_ephemeral_off", append_tip=True),
+                await trl(ctx.user.id, ctx.guild.id, "moderation_ephemeral_on", append_tip=True)
+                if ephemeral else await trl(ctx.user.id, ctx.guild.id, "moderation_ephemeral_off", append_tip=True),
                 ephemeral=True)
 
             log_embed = discord.Embed(title="Ephemeral Toggled",
                                       description=f"{ctx.user.mention} has toggled the ephemeral status to {ephemeral}")
             log_embed.add_field(name="Ephemeral Status", value=str(ephemeral))
-            log_embed.add_field(name="Ephemeral Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Ephemeral Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @moderation_subcommand.command(name='add_moderator_role', description='Add a moderator role to the server')
     @commands_ext.has_permissions(manage_guild=True)
@@ -644,15 +653,17 @@ class Moderation(discord.Cog):
     @discord.default_permissions(manage_guild=True)
     async def add_moderator_role(self, ctx: discord.ApplicationContext, role: discord.Role):
         try:
-            if client['ModeratorRoles'].count_documents({'GuildID': str(ctx.guild.id), 'RoleID': str(role.id)}) > 0:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_moderator_role_already_exists").format(
+            if await client['ModeratorRoles'].count_documents({'GuildID': str(ctx.guild.id),
+                                                               'RoleID': str(role.id)}) > 0:
+                await ctx.respond((await trl(ctx.user.id, ctx.guild.id, "moderation_moderator_role_already_exists")).format(
                     role=role.mention), ephemeral=True)
                 return
 
-            client['ModeratorRoles'].insert_one({'GuildID': str(ctx.guild.id), 'RoleID': str(role.id)})
+            await client['ModeratorRoles'].insert_one({'GuildID': str(ctx.guild.id), 'RoleID': str(role.id)})
 
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "moderation_add_moderator_role_response").format(role=role.mention),
+                (await trl(ctx.user.id, ctx.guild.id,
+                           "moderation_add_moderator_role_response")).format(role=role.mention),
                 ephemeral=True)
 
             log_embed = discord.Embed(title="Moderator Role Added",
@@ -662,7 +673,7 @@ class Moderation(discord.Cog):
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @moderation_subcommand.command(name='remove_moderator_role', description='Remove a moderator role from the server')
     @commands_ext.has_permissions(manage_guild=True)
@@ -670,13 +681,14 @@ class Moderation(discord.Cog):
     @discord.default_permissions(manage_guild=True)
     async def remove_moderator_role(self, ctx: discord.ApplicationContext, role: discord.Role):
         try:
-            if client['ModeratorRoles'].delete_one(
-                    {'GuildID': str(ctx.guild.id), 'RoleID': str(role.id)}).deleted_count > 0:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_remove_moderator_role_response").format(
+            if (await client['ModeratorRoles'].delete_one(
+                    {'GuildID': str(ctx.guild.id), 'RoleID': str(role.id)})).deleted_count > 0:
+                await ctx.respond((await trl(ctx.user.id, ctx.guild.id, "moderation_remove_moderator_role_response")).format(
                     role=role.mention), ephemeral=True)
             else:
                 await ctx.respond(
-                    trl(ctx.user.id, ctx.guild.id, "moderation_moderator_role_doesnt_exist").format(role=role.mention),
+                    (await trl(ctx.user.id, ctx.guild.id,
+                               "moderation_moderator_role_doesnt_exist")).format(role=role.mention),
                     ephemeral=True)
 
             log_embed = discord.Embed(title="Moderator Role Removed",
@@ -686,7 +698,7 @@ class Moderation(discord.Cog):
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @moderation_subcommand.command(name='list_moderator_roles', description='List all moderator roles on the server')
     @commands_ext.has_permissions(manage_guild=True)
@@ -694,18 +706,18 @@ class Moderation(discord.Cog):
     @discord.default_permissions(manage_guild=True)
     async def list_moderator_roles(self, ctx: discord.ApplicationContext):
         try:
-            roles = client['ModeratorRoles'].find({'GuildID': str(ctx.guild.id)})
+            roles = await client['ModeratorRoles'].find({'GuildID': str(ctx.guild.id)}).to_list()
 
             if not roles:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "moderation_no_moderator_roles"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "moderation_no_moderator_roles"), ephemeral=True)
                 return
 
-            message = trl(ctx.user.id, ctx.guild.id, "moderation_moderator_roles_title")
+            message = await trl(ctx.user.id, ctx.guild.id, "moderation_moderator_roles_title")
 
-            role_mentions = [trl(ctx.user.id, ctx.guild.id, "moderation_moderator_roles_line").format(
+            role_mentions = [(await trl(ctx.user.id, ctx.guild.id, "moderation_moderator_roles_line")).format(
                 role=ctx.guild.get_role(int(role['RoleID'])).mention) for role in roles]
             message += "\n".join(role_mentions)
             await ctx.respond(message, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
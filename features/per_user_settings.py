@@ -49,19 +49,20 @@ class PerUserSettings(discord.Cog):
     @analytics("user_settings chat_streaks_alerts")
     async def chat_streaks_alerts(self, ctx: discord.ApplicationContext, state: str):
         try:
-            set_per_user_setting(ctx.user.id, 'chat_streaks_alerts', state)
+            await set_per_user_setting(ctx.user.id, 'chat_streaks_alerts', state)
             if state == 'enabled':
-                state = trl(ctx.user.id, ctx.guild.id, "per_user_chat_streak_state_enabled")
+                state = await trl(ctx.user.id, ctx.guild.id, "per_user_chat_streak_state_enabled")
             elif state == 'only when lost':
-                state = trl(ctx.user.id, ctx.guild.id, "per_user_chat_streak_state_only_when_lost")
+                state = await trl(ctx.user.id, ctx.guild.id, "per_user_chat_streak_state_only_when_lost")
             else:
-                state = trl(ctx.user.id, ctx.guild.id, "per_user_chat_streak_state_disabled")
+                state = await trl(ctx.user.id, ctx.guild.id, "per_user_chat_streak_state_disabled")
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "per_user_chat_streak_response", append_tip=True).format(state=state),
+                (await trl(ctx.user.id, ctx.guild.id, "per_user_chat_streak_response",
+                           append_tip=True)).format(state=state),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @user_settings_group.command(name='langauge',
                                  description='Set your personal language, applies across servers for you')
@@ -71,12 +72,12 @@ class PerUserSettings(discord.Cog):
         try:
             lang_code = language_name_to_code(lang)
 
-            set_per_user_setting(ctx.user.id, 'language', lang_code)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "per_user_language_set", append_tip=True).format(
+            await set_per_user_setting(ctx.user.id, 'language', lang_code)
+            await ctx.respond((await trl(ctx.user.id, ctx.guild.id, "per_user_language_set", append_tip=True)).format(
                 lang=get_language_name(lang_code, completeness=False)), ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @user_settings_group.command(name='birthday', description='Set your birthday for Birthday Announcements.')
     @discord.option(name='birthday', description='Your birthday in the format YYYY-MM-DD')
@@ -85,24 +86,25 @@ class PerUserSettings(discord.Cog):
         try:
             now = datetime.datetime.now()
             if now.year - 100 < year < now.year - 13:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, 'birthday_invalid_year'), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, 'birthday_invalid_year'), ephemeral=True)
                 return
 
             if 1 <= month <= 12:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, 'birthday_invalid_month'), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, 'birthday_invalid_month'), ephemeral=True)
                 return
 
             if 1 <= day <= days_in_month(month, year):
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, 'birthday_invalid_day'), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, 'birthday_invalid_day'), ephemeral=True)
                 return
 
-            client['UserBirthday'].update_one({'UserID': str(ctx.author.id)},
-                                              {'$set': {'Birth.Year': year, 'Birth.Month': month, 'Birth.Day': day}},
-                                              upsert=True)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, 'birthday_set'), ephemeral=True)
+            await client['UserBirthday'].update_one({'UserID': str(ctx.author.id)},
+                                                    {'$set': {'Birth.Year': year, 'Birth.Month': month,
+                                                              'Birth.Day': day}},
+                                                    upsert=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, 'birthday_set'), ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @user_settings_group.command(name="birthday_settings", description="Personalize your birthday settings")
     @discord.option(name="send_dm", type=bool, description="Whether to allow this bot to send DMs to you")
@@ -110,17 +112,18 @@ class PerUserSettings(discord.Cog):
     async def set_birthday_settings(self, ctx: discord.ApplicationContext, send_dm: bool | None = None):
         try:
             if send_dm is not None:
-                set_per_user_setting(ctx.user.id, 'birthday_send_dm', str(send_dm).lower())
+                await set_per_user_setting(ctx.user.id, 'birthday_send_dm', str(send_dm).lower())
 
-            send_dm = get_per_user_setting(ctx.user.id, 'birthday_send_dm', "false")
+            send_dm = await get_per_user_setting(ctx.user.id, 'birthday_send_dm', "false")
 
-            send_dm = trl(ctx.user.id, ctx.guild.id, "per_user_birthday_send_dm_enabled", append_tip=True) \
-                if send_dm else trl(ctx.user.id, ctx.guild.id, "per_user_birthday_send_dm_disabled", append_tip=True)
+            send_dm = await trl(ctx.user.id, ctx.guild.id, "per_user_birthday_send_dm_enabled", append_tip=True) \
+                if send_dm else await trl(ctx.user.id, ctx.guild.id, "per_user_birthday_send_dm_disabled",
+                                          append_tip=True)
 
             await ctx.respond(f"{send_dm}", ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @user_settings_group.command(name="birthday_announcements",
                                  description="Whether to announce birthdays in the server you're currently in")
@@ -128,39 +131,41 @@ class PerUserSettings(discord.Cog):
     @analytics("user_settings birthday_announcements")
     async def set_birthday_announcement(self, ctx: discord.ApplicationContext, state: bool):
         try:
-            set_per_user_setting(ctx.user.id, f'birthday_announcements_{str(ctx.guild.id)}', str(state).lower())
+            await set_per_user_setting(ctx.user.id, f'birthday_announcements_{str(ctx.guild.id)}', str(state).lower())
             if state:
-                state_str = trl(ctx.user.id, ctx.guild.id, "per_user_birthday_announcements_enabled", append_tip=True)
+                state_str = await trl(ctx.user.id, ctx.guild.id, "per_user_birthday_announcements_enabled",
+                                      append_tip=True)
             else:
-                state_str = trl(ctx.user.id, ctx.guild.id, "per_user_birthday_announcements_disabled", append_tip=True)
+                state_str = await trl(ctx.user.id, ctx.guild.id, "per_user_birthday_announcements_disabled",
+                                      append_tip=True)
             await ctx.respond(state_str, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @user_settings_group.command(name='clear_birthday', description='Clear all data about your birthday from the bot')
     @analytics("user_settings clear_birthday")
     async def clear_birthday(self, ctx: discord.ApplicationContext):
         try:
-            set_per_user_setting(ctx.user.id, 'birthday_date', None)
-            set_per_user_setting(ctx.user.id, 'birthday_year', None)
-            set_per_user_setting(ctx.user.id, 'birthday_send_dm', None)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "per_user_birthday_cleared", append_tip=True),
+            await set_per_user_setting(ctx.user.id, 'birthday_date', None)
+            await set_per_user_setting(ctx.user.id, 'birthday_year', None)
+            await set_per_user_setting(ctx.user.id, 'birthday_send_dm', None)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "per_user_birthday_cleared", append_tip=True),
                               ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @user_settings_group.command(name='tips', description='Enable or disable tips')
     @analytics('user_settings tips')
     async def set_tips(self, ctx: discord.ApplicationContext, state: bool):
         try:
-            set_per_user_setting(ctx.user.id, 'tips_enabled', str(state).lower())
+            await set_per_user_setting(ctx.user.id, 'tips_enabled', str(state).lower())
             if state:
-                state_str = trl(ctx.user.id, ctx.guild.id, "per_user_tips_enabled", append_tip=True)
+                state_str = await trl(ctx.user.id, ctx.guild.id, "per_user_tips_enabled", append_tip=True)
             else:
-                state_str = trl(ctx.user.id, ctx.guild.id, "per_user_tips_disabled", append_tip=True)
+                state_str = await trl(ctx.user.id, ctx.guild.id, "per_user_tips_disabled", append_tip=True)
             await ctx.respond(state_str, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
@@ -104,12 +104,13 @@ class ReactionRoles(discord.Cog):
 
             await interaction.channel.send(content=message, view=view)
             await interaction.response.send_message(
-                trl(interaction.user.id, interaction.guild.id, "reaction_roles_created_response", append_tip=True),
+                await trl(interaction.user.id, interaction.guild.id, "reaction_roles_created_response",
+                          append_tip=True),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
             await interaction.response.send_message(
-                trl(interaction.user.id, interaction.guild.id, "command_error_generic"), ephemeral=True)
+                await trl(interaction.user.id, interaction.guild.id, "command_error_generic"), ephemeral=True)
 
     @reaction_roles_subcommand.command(name="edit", description="Edit a reaction role")
     @discord.default_permissions(manage_roles=True)
@@ -128,7 +129,7 @@ class ReactionRoles(discord.Cog):
         try:
             if not message.isdigit():
                 await interaction.response.send_message(
-                    trl(interaction.user.id, interaction.guild.id, "reaction_roles_edit_id_must_be_a_number"),
+                    await trl(interaction.user.id, interaction.guild.id, "reaction_roles_edit_id_must_be_a_number"),
                     ephemeral=True)
                 return
 
@@ -147,7 +148,8 @@ class ReactionRoles(discord.Cog):
             msg = await interaction.channel.fetch_message(int(message))
             if msg is None:
                 await interaction.response.send_message(
-                    trl(interaction.user.id, interaction.guild.id, "reaction_roles_edit_msg_not_found"), ephemeral=True)
+                    await trl(interaction.user.id, interaction.guild.id,
+                              "reaction_roles_edit_msg_not_found"), ephemeral=True)
                 return
 
             if not content:
@@ -156,12 +158,12 @@ class ReactionRoles(discord.Cog):
                 await msg.edit(content=content, view=view)
 
             await interaction.response.send_message(
-                trl(interaction.user.id, interaction.guild.id, "reaction_roles_edited_response", append_tip=True),
+                await trl(interaction.user.id, interaction.guild.id, "reaction_roles_edited_response", append_tip=True),
                 ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
             await interaction.response.send_message(
-                trl(interaction.user.id, interaction.guild.id, "command_error_generic"), ephemeral=True)
+                await trl(interaction.user.id, interaction.guild.id, "command_error_generic"), ephemeral=True)
 
     @discord.Cog.listener()
     async def on_interaction(self, interaction: discord.Interaction) -> None:
@@ -171,7 +173,7 @@ class ReactionRoles(discord.Cog):
 
             if not interaction.guild.me.guild_permissions.manage_roles:
                 await interaction.response.send_message(
-                    trl(interaction.user.id, interaction.guild.id, "reaction_roles_no_perm"), ephemeral=True)
+                    await trl(interaction.user.id, interaction.guild.id, "reaction_roles_no_perm"), ephemeral=True)
                 return
 
             split = interaction.custom_id.split('-')
@@ -190,21 +192,22 @@ class ReactionRoles(discord.Cog):
 
             if role.position >= interaction.guild.me.top_role.position:
                 await interaction.response.send_message(
-                    trl(interaction.user.id, interaction.guild.id, "reaction_roles_cant_assign_role"), ephemeral=True)
+                    await trl(interaction.user.id, interaction.guild.id,
+                              "reaction_roles_cant_assign_role"), ephemeral=True)
                 return
 
             if split[0] == "rrn":
                 if role in interaction.user.roles:
                     await interaction.response.send_message(
-                        trl(interaction.user.id, interaction.guild.id, "reaction_roles_role_removed",
-                            append_tip=True).format(
+                        (await trl(interaction.user.id, interaction.guild.id, "reaction_roles_role_removed",
+                                   append_tip=True)).format(
                             mention=role.mention), ephemeral=True)
                     await interaction.user.remove_roles(role, reason="Reaction role")
                     return
                 if role not in interaction.user.roles:
                     await interaction.response.send_message(
-                        trl(interaction.user.id, interaction.guild.id, "reaction_roles_role_added",
-                            append_tip=True).format(
+                        (await trl(interaction.user.id, interaction.guild.id, "reaction_roles_role_added",
+                                   append_tip=True)).format(
                             mention=role.mention), ephemeral=True)
                     await interaction.user.add_roles(role, reason="Reaction role")
                     return
@@ -212,12 +215,13 @@ class ReactionRoles(discord.Cog):
             if split[0] == "rra":
                 if role in interaction.user.roles:
                     await interaction.response.send_message(
-                        trl(interaction.user.id, interaction.guild.id, "reaction_roles_already_have"), ephemeral=True)
+                        await trl(interaction.user.id, interaction.guild.id,
+                                  "reaction_roles_already_have"), ephemeral=True)
                     return
                 if role not in interaction.user.roles:
                     await interaction.response.send_message(
-                        trl(interaction.user.id, interaction.guild.id, "reaction_roles_role_added",
-                            append_tip=True).format(
+                        (await trl(interaction.user.id, interaction.guild.id, "reaction_roles_role_added",
+                                   append_tip=True)).format(
                             mention=role.mention), ephemeral=True)
                     await interaction.user.add_roles(role, reason="Reaction role")
                     return
@@ -225,12 +229,13 @@ class ReactionRoles(discord.Cog):
             if split[0] == "rrr":
                 if role not in interaction.user.roles:
                     await interaction.response.send_message(
-                        trl(interaction.user.id, interaction.guild.id, "reaction_roles_already_dont"), ephemeral=True)
+                        await trl(interaction.user.id, interaction.guild.id,
+                                  "reaction_roles_already_dont"), ephemeral=True)
                     return
                 if role in interaction.user.roles:
                     await interaction.response.send_message(
-                        trl(interaction.user.id, interaction.guild.id, "reaction_roles_role_removed",
-                            append_tip=True).format(
+                        (await trl(interaction.user.id, interaction.guild.id, "reaction_roles_role_removed",
+                                   append_tip=True)).format(
                             mention=role.mention), ephemeral=True)
                     await interaction.user.remove_roles(role, reason="Reaction role")
                     return
@@ -238,13 +243,13 @@ class ReactionRoles(discord.Cog):
             if split[0] == "rrs":
                 if role in interaction.user.roles:
                     await interaction.response.send_message(
-                        trl(interaction.user.id, interaction.guild.id, "reaction_roles_already_selected").format(
+                        (await trl(interaction.user.id, interaction.guild.id, "reaction_roles_already_selected")).format(
                             mention=role.mention), ephemeral=True)
                     return
 
                 roles = get_roles(interaction.message)
                 await interaction.response.send_message(
-                    trl(interaction.user.id, interaction.guild.id, "reaction_roles_selected", append_tip=True).format(
+                    (await trl(interaction.user.id, interaction.guild.id, "reaction_roles_selected", append_tip=True)).format(
                         mention=role.mention),
                     ephemeral=True)
                 await interaction.user.remove_roles(*roles, reason="Reaction role")
@@ -30,8 +30,7 @@ class RolesOnJoin(discord.Cog):
     @discord.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         try:
-            roles = client['RolesOnJoin'].find({'GuildID': str(member.guild.id)})
-            for row in roles:
+            async for row in client['RolesOnJoin'].find({'GuildID': str(member.guild.id)}):
                 role = member.guild.get_role(row['RoleID'])
                 # check role position
                 if role.position > member.guild.me.top_role.position:
@@ -43,7 +42,7 @@ class RolesOnJoin(discord.Cog):
                         pass
                 else:
                     # remove
-                    client['RolesOnJoin'].delete_one({'GuildID': str(member.guild.id)})
+                    await client['RolesOnJoin'].delete_one({'GuildID': str(member.guild.id)})
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
@@ -55,43 +54,43 @@ class RolesOnJoin(discord.Cog):
         try:
             # check role position
             if role.position > ctx.me.top_role.position:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_above_bot"), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_above_bot"), ephemeral=True)
                 return
 
-            if client['RolesOnJoin'].count_documents({'GuildID': str(ctx.guild.id), 'RoleID': str(role.id)}) == 0:
-                client['RolesOnJoin'].insert_one({'GuildID': str(ctx.guild.id), 'RoleID': str(role.id)})
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_added", append_tip=True),
+            if await client['RolesOnJoin'].count_documents({'GuildID': str(ctx.guild.id), 'RoleID': str(role.id)}) == 0:
+                await client['RolesOnJoin'].insert_one({'GuildID': str(ctx.guild.id), 'RoleID': str(role.id)})
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_added", append_tip=True),
                                   ephemeral=True)
             else:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_already_in_join_roles"),
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_already_in_join_roles"),
                                   ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @roles_on_join_commands.command(name="remove", description="Remove a role on join")
     @analytics("roles_on_join remove")
     async def remove_role_on_join(self, ctx: discord.ApplicationContext, role: discord.Role):
         try:
-            if client['RolesOnJoin'].count_documents({'GuildID': str(ctx.guild.id)}) == 0:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_not_in_join_roles"),
+            if await client['RolesOnJoin'].count_documents({'GuildID': str(ctx.guild.id)}) == 0:
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_not_in_join_roles"),
                                   ephemeral=True)
             else:
-                client['RolesOnJoin'].delete_one({'GuildID': str(ctx.guild.id)})
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_removed", append_tip=True),
+                await client['RolesOnJoin'].delete_one({'GuildID': str(ctx.guild.id)})
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "roles_on_join_role_removed", append_tip=True),
                                   ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @roles_on_join_commands.command(name="list", description="List roles on join")
     @analytics("roles_on_join list")
     async def list_roles_on_join(self, ctx: discord.ApplicationContext):
         try:
-            res = client['RolesOnJoin'].find({'GuildID': str(ctx.guild.id)}).to_list()
+            res = await client['RolesOnJoin'].find({'GuildID': str(ctx.guild.id)}).to_list()
             if not res:
                 await ctx.respond(
-                    trl(ctx.user.id, ctx.guild.id, "roles_on_join_list_no_roles_on_join", append_tip=True),
+                    await trl(ctx.user.id, ctx.guild.id, "roles_on_join_list_no_roles_on_join", append_tip=True),
                     ephemeral=True)
                 return
 
@@ -100,7 +99,7 @@ class RolesOnJoin(discord.Cog):
             for doc in res:
                 role = ctx.guild.get_role(doc['RoleID'])
                 if role is None:
-                    client['RolesOnJoin'].delete_one({'GuildID': str(ctx.guild.id), 'RoleID': doc['RoleID']})
+                    await client['RolesOnJoin'].delete_one({'GuildID': str(ctx.guild.id), 'RoleID': doc['RoleID']})
                     continue
                 msg = f"{msg}\n{role.mention}"
 
@@ -108,4 +107,4 @@ class RolesOnJoin(discord.Cog):
             await ctx.respond(embed=embed, ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
@@ -80,7 +80,7 @@ class RoleplayCommands(discord.Cog):
         """Hug a member"""
         try:
 
-            if get_setting(ctx.guild.id, "roleplay_enabled", "true") == "false":
+            if await get_setting(ctx.guild.id, "roleplay_enabled", "true") == "false":
                 await ctx.respond(content="Roleplay commands are disabled for this server", ephemeral=True)
                 return
 
@@ -99,7 +99,7 @@ class RoleplayCommands(discord.Cog):
         """Kiss a member"""
         try:
 
-            if get_setting(ctx.guild.id, "roleplay_enabled", "true") == "false":
+            if await get_setting(ctx.guild.id, "roleplay_enabled", "true") == "false":
                 await ctx.respond(content="Roleplay commands are disabled for this server", ephemeral=True)
                 return
 
@@ -117,7 +117,7 @@ class RoleplayCommands(discord.Cog):
     async def bite(self, ctx, member: discord.Member):
         """Bite a member"""
         try:
-            if get_setting(ctx.guild.id, "roleplay_enabled", "true") == "false":
+            if await get_setting(ctx.guild.id, "roleplay_enabled", "true") == "false":
                 await ctx.respond(content="Roleplay commands are disabled for this server", ephemeral=True)
                 return
 
@@ -135,7 +135,7 @@ class RoleplayCommands(discord.Cog):
     async def unbite(self, ctx, member: discord.Member):
         """Unbite a member"""
         try:
-            if get_setting(ctx.guild.id, "roleplay_enabled", "true") == "false":
+            if await get_setting(ctx.guild.id, "roleplay_enabled", "true") == "false":
                 await ctx.respond(content="Roleplay commands are disabled for this server", ephemeral=True)
                 return
 
@@ -152,7 +152,7 @@ class RoleplayCommands(discord.Cog):
     async def rp_enable(self, ctx, enable: bool):
         """Enable or disable roleplay commands"""
         try:
-            set_setting(ctx.guild.id, "roleplay_enabled", str(enable).lower())
+            await set_setting(ctx.guild.id, "roleplay_enabled", str(enable).lower())
             await ctx.respond(content=f"Roleplay commands have been {'enabled' if enable else 'disabled'}",
                               ephemeral=True)
         except Exception as e:
@@ -167,7 +167,7 @@ class RoleplayCommands(discord.Cog):
     async def rp_list(self, ctx):
         """List all settings for roleplay"""
         try:
-            rp_enabled = get_setting(ctx.guild.id, "roleplay_enabled")
+            rp_enabled = await get_setting(ctx.guild.id, "roleplay_enabled")
             embed = discord.Embed(title="Roleplay settings")
             embed.add_field(name="Enabled", value='Yes' if rp_enabled else 'No', inline=False)
             await ctx.respond(embed=embed, ephemeral=True)
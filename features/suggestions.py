@@ -4,7 +4,8 @@ from discord.ext import commands
 
 from database import client
 from utils.languages import get_translation_for_key_localized as trl
-from utils.settings import get_setting, set_setting
+from utils.message_dispatch import message_dispatcher, MessageContext
+from utils.settings import set_setting
 
 
 #      Akabot is a general purpose bot with a ton of features.
@@ -28,28 +29,23 @@ from utils.settings import get_setting, set_setting
 class Suggestions(discord.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
+        message_dispatcher.register("suggestions", self.handle_message)
 
-    @discord.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        try:
-            if message.author.bot:
-                return
-
-            if client['SuggestionChannels'].count_documents({'ChannelID': str(message.channel.id)}) > 0:
-                emojis = get_setting(message.guild.id, 'suggestion_emoji', '👍👎')
-                if emojis == '👍👎':
-                    await message.add_reaction('👍')
-                    await message.add_reaction('👎')
-                elif emojis == '✅❌':
-                    await message.add_reaction('✅')
-                    await message.add_reaction('❌')
+    async def handle_message(self, ctx: MessageContext):
+        message = ctx.message
+        if await client['SuggestionChannels'].count_documents({'ChannelID': str(message.channel.id)}) > 0:
+            emojis = ctx.get_setting('suggestion_emoji', '👍👎')
+            if emojis == '👍👎':
+                await message.add_reaction('👍')
+                await message.add_reaction('👎')
+            elif emojis == '✅❌':
+                await message.add_reaction('✅')
+                await message.add_reaction('❌')
 
-                if get_setting(message.guild.id, "suggestion_reminder_enabled", "false") == "true":
-                    to_send = get_setting(message.guild.id, "suggestion_reminder_message", "")
-                    sent = await message.reply(to_send)
-                    await sent.delete(delay=5)
-        except Exception as e:
-            sentry_sdk.capture_exception(e)
+            if ctx.get_setting("suggestion_reminder_enabled", "false") == "true":
+                to_send = ctx.get_setting("suggestion_reminder_message", "")
+                sent = await message.reply(to_send)
+                await sent.delete(delay=5)
 
     suggestions_group = discord.SlashCommandGroup(name='suggestions', description='Suggestion commands')
 
@@ -59,15 +55,17 @@ class Suggestions(discord.Cog):
     @commands.has_permissions(manage_guild=True)
     async def cmd_add_channel(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
         try:
-            if client['SuggestionChannels'].count_documents({'ChannelID': str(ctx.guild.id)}) == 0:
-                client['SuggestionChannels'].insert_one({'GuildID': str(ctx.guild.id), 'ChannelID': str(channel.id)})
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, 'suggestions_channel_added', append_tip=True).format(
+            if await client['SuggestionChannels'].count_documents({'ChannelID': str(ctx.guild.id)}) == 0:
+                await client['SuggestionChannels'].insert_one({'GuildID': str(ctx.guild.id),
+                                                               'ChannelID': str(channel.id)})
+                await ctx.respond((await trl(ctx.user.id, ctx.guild.id, 'suggestions_channel_added', append_tip=True)).format(
                     channel=channel.mention), ephemeral=True)
             else:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, 'suggestions_channel_already_exists'), ephemeral=True)
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, 'suggestions_channel_already_exists'),
+                                  ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @suggestions_group.command(name='remove_channel', description='Remove a suggestion channel')
     @discord.default_permissions(manage_guild=True)
@@ -75,15 +73,15 @@ class Suggestions(discord.Cog):
     @commands.has_permissions(manage_guild=True)
     async def cmd_remove_channel(self, ctx: discord.ApplicationContext, channel: discord.TextChannel):
         try:
-            if client['SuggestionChannels'].count_documents({'ChannelID': str(ctx.guild.id)}) == 0:
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "suggestions_channel_not_found"), ephemeral=True)
+            if await client['SuggestionChannels'].count_documents({'ChannelID': str(ctx.guild.id)}) == 0:
+                await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "suggestions_channel_not_found"), ephemeral=True)
             else:
-                client['SuggestionChannels'].delete_one({'ChannelID': str(ctx.guild.id)})
-                await ctx.respond(trl(ctx.user.id, ctx.guild.id, "suggestions_channel_removed", append_tip=True).format(
+                await client['SuggestionChannels'].delete_one({'ChannelID': str(ctx.guild.id)})
+                await ctx.respond((await trl(ctx.user.id, ctx.guild.id, "suggestions_channel_removed", append_tip=True)).format(
                     channel=channel.mention), ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @suggestions_group.command(name='emoji', description='Choose emoji')
     @discord.default_permissions(manage_guild=True)
@@ -92,12 +90,12 @@ class Suggestions(discord.Cog):
     @discord.option(name='emoji', description='The emoji to use', choices=['👎👍', '✅❌'])
     async def cmd_choose_emoji(self, ctx: discord.ApplicationContext, emoji: str):
         try:
-            set_setting(ctx.guild.id, 'suggestion_emoji', emoji)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "suggestions_emoji_set").format(emoji=emoji),
+            await set_setting(ctx.guild.id, 'suggestion_emoji', emoji)
+            await ctx.respond((await trl(ctx.user.id, ctx.guild.id, "suggestions_emoji_set")).format(emoji=emoji),
                               ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @suggestions_group.command(name='message_reminder', description="Message reminder for people posting suggestions")
     @discord.default_permissions(manage_guild=True)
@@ -107,11 +105,11 @@ class Suggestions(discord.Cog):
         try:
             if len(message) < 1:
                 await ctx.respond("Invalid message input.", ephemeral=True)
-            set_setting(ctx.guild.id, 'suggestion_reminder_enabled', str(enabled).lower())
-            set_setting(ctx.guild.id, 'suggestion_reminder_message', message)
+            await set_setting(ctx.guild.id, 'suggestion_reminder_enabled', str(enabled).lower())
+            await set_setting(ctx.guild.id, 'suggestion_reminder_message', message)
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, 'suggestions_message_reminder_set', append_tip=True).format(
+                (await trl(ctx.user.id, ctx.guild.id, 'suggestions_message_reminder_set', append_tip=True)).format(
                     enabled=enabled, message=message), ephemeral=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
@@ -23,100 +23,125 @@ from discord.ext import commands, tasks
 from database import client
 from utils.languages import get_translation_for_key_localized as trl
 from utils.logging_util import log_into_logs
+from utils.message_dispatch import message_dispatcher, MessageContext
 from utils.settings import set_setting, get_setting
 from utils.tzutil import get_now_for_server
+from utils.write_behind import write_behind
 
+# IDs of every ticket channel, so activity in other channels doesn't queue database writes
+ticket_channels: set[int] = set()
 
-def db_add_ticket_channel(guild_id: int, ticket_category: int, user_id: int):
-    client['TicketChannels'].insert_one(
+
+async def load_ticket_channels():
+    """Fill `ticket_channels` from the database"""
+    channel_ids = await client['TicketChannels'].distinct('TicketChannelID')
+    ticket_channels.clear()
+    ticket_channels.update(int(i) for i in channel_ids)
+
+
+async def db_add_ticket_channel(guild_id: int, ticket_category: int, user_id: int):
+    await client['TicketChannels'].insert_one(
         {'GuildID': str(guild_id), 'TicketChannelID': str(ticket_category), 'UserID': str(user_id),
-         'MTime': get_now_for_server(guild_id), 'ATime': 'None'})
+         'MTime': await get_now_for_server(guild_id), 'ATime': 'None'})
+    ticket_channels.add(int(ticket_category))
 
 
-def db_is_ticket_channel(guild_id: int, ticket_channel_id: int):
-    count = client['TicketChannels'].count_documents(
+async def db_is_ticket_channel(guild_id: int, ticket_channel_id: int):
+    count = await client['TicketChannels'].count_documents(
         {'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})
     return count > 0
 
 
-def db_get_ticket_creator(guild_id: int, ticket_channel_id: int) -> int:
-    user_id = client['TicketChannels'].find_one({'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})[
-        'UserID']
+async def db_get_ticket_creator(guild_id: int, ticket_channel_id: int) -> int:
+    data = await client['TicketChannels'].find_one(
+        {'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})
+    user_id = data['UserID']
     return int(user_id)
 
 
-def db_remove_ticket_channel(guild_id: int, ticket_channel_id: int):
-    client['TicketChannels'].delete_one({'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})
+async def db_remove_ticket_channel(guild_id: int, ticket_channel_id: int):
+    await client['TicketChannels'].delete_one({'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})
+    ticket_channels.discard(int(ticket_channel_id))
 
 
-def db_update_mtime(guild_id: int, ticket_channel_id: int):
-    client['TicketChannels'].update_one({'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)},
-                                        {'$set': {'MTime': get_now_for_server(guild_id)}})
+async def update_mtime_later(guild_id: int, ticket_channel_id: int, skip_archived: bool):
+    """Update the modification time of a ticket through the write-behind buffer. Channels that aren't tickets are
+    skipped without touching the database, archived tickets (with `skip_archived`) don't match the filter."""
+    if int(ticket_channel_id) not in ticket_channels:
+        return
 
+    query = {'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)}
+    if skip_archived:
+        query['ATime'] = "None"
+    write_behind.set('TicketChannels', query, {'MTime': await get_now_for_server(guild_id)})
 
-def check_ticket_archive_time(guild_id: int, ticket_channel_id: int) -> bool:
-    archive_time = get_setting(guild_id, "ticket_archive_time", "0")  # hours
+
+async def check_ticket_archive_time(guild_id: int, ticket_channel_id: int) -> bool:
+    archive_time = await get_setting(guild_id, "ticket_archive_time", "0")  # hours
     if archive_time == "0":
         return False
 
-    mtime = client['TicketChannels'].find_one({'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})[
-        'MTime']
+    data = await client['TicketChannels'].find_one(
+        {'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})
+    mtime = data['MTime']
 
     if mtime is None:
         return False
 
-    if (get_now_for_server(guild_id) - mtime).total_seconds() / 3600 >= int(archive_time):
+    if (await get_now_for_server(guild_id) - mtime).total_seconds() / 3600 >= int(archive_time):
         return True
 
     return False
 
 
-def db_is_archived(guild_id: int, ticket_channel_id: int) -> bool:
-    atime = client['TicketChannels'].find_one({'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})[
-        'ATime']
+async def db_is_archived(guild_id: int, ticket_channel_id: int) -> bool:
+    data = await client['TicketChannels'].find_one(
+        {'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})
+    atime = data['ATime']
     return atime != "None"
 
 
-def check_ticket_hide_time(guild_id: int, ticket_channel_id: int) -> bool:
-    if not db_is_archived(guild_id, ticket_channel_id):
+async def check_ticket_hide_time(guild_id: int, ticket_channel_id: int) -> bool:
+    if not await db_is_archived(guild_id, ticket_channel_id):
         return False
 
-    hide_time = get_setting(guild_id, "ticket_hide_time", "0")  # hours, hide time from archive
+    hide_time = await get_setting(guild_id, "ticket_hide_time", "0")  # hours, hide time from archive
     if hide_time == "0":
         return False
 
-    atime = client['TicketChannels'].find_one({'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})[
-        'ATime']
+    data = await client['TicketChannels'].find_one(
+        {'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)})
+    atime = data['ATime']
 
     if atime == 'None':
         return False
 
-    if (get_now_for_server(guild_id) - atime).total_seconds() / 3600 >= int(hide_time):
+    if (await get_now_for_server(guild_id) - atime).total_seconds() / 3600 >= int(hide_time):
         return True
 
     return False
 
 
-def db_archive_ticket(guild_id: int, ticket_channel_id: int):
-    client['TicketChannels'].update_one({'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)},
-                                        {'$set': {'ATime': get_now_for_server(guild_id)}})
+async def db_archive_ticket(guild_id: int, ticket_channel_id: int):
+    await client['TicketChannels'].update_one({'GuildID': str(guild_id), 'TicketChannelID': str(ticket_channel_id)},
+                                              {'$set': {'ATime': await get_now_for_server(guild_id)}})
 
 
-def db_list_archived_tickets():
+async def db_list_archived_tickets():
     """
     Get all archived tickets.
     :return: List of tuples with guild_id and ticket_channel_id.
     """
-    tickets = client['TicketChannels'].find({'ATime': {'$not': {'$eq': 'None'}}})
+    tickets = await client['TicketChannels'].find({'ATime': {'$not': {'$eq': 'None'}}}).to_list()
     return tickets
 
 
-def db_list_not_archived_tickets():
+async def db_list_not_archived_tickets():
     """
     Get all not archived tickets.
     :return: List of tuples with guild_id and ticket_channel_id.
     """
-    tickets = client['TicketChannels'].find({'ATime': 'None'})
+    tickets = await client['TicketChannels'].find({'ATime': 'None'}).to_list()
     return tickets
 
 
@@ -134,25 +159,27 @@ class TicketMessageView(discord.ui.View):
     async def close_ticket(self, interaction: discord.Interaction):
         self.disable_all_items()
 
-        if not db_is_ticket_channel(interaction.guild.id, interaction.channel.id):
+        if not await db_is_ticket_channel(interaction.guild.id, interaction.channel.id):
             await interaction.response.send_message("This is not a ticket channel.", ephemeral=True)
             return
 
         # Remove permissions from the ticket creator appropriately
-        hide_time = get_setting(interaction.guild.id, "ticket_hide_time", "0")
+        hide_time = await get_setting(interaction.guild.id, "ticket_hide_time", "0")
         print('[Tickets] Auto hide time is', hide_time)
         if int(hide_time) > 0:
             print('[Tickets] Taking away send permissions')
-            member = interaction.guild.get_member(db_get_ticket_creator(interaction.guild.id, interaction.channel.id))
+            member = interaction.guild.get_member(await db_get_ticket_creator(interaction.guild.id,
+                                                                              interaction.channel.id))
             await interaction.channel.set_permissions(member, view_channel=True, read_messages=True,
                                                       send_messages=False)
-            db_archive_ticket(interaction.guild.id, interaction.channel.id)
+            await db_archive_ticket(interaction.guild.id, interaction.channel.id)
         else:
             print('[Tickets] Taking away ALL permissions')
-            member = interaction.guild.get_member(db_get_ticket_creator(interaction.guild.id, interaction.channel.id))
+            member = interaction.guild.get_member(await db_get_ticket_creator(interaction.guild.id,
+                                                                              interaction.channel.id))
             await interaction.channel.set_permissions(member, view_channel=False, read_messages=False,
                                                       send_messages=False)
-            db_remove_ticket_channel(interaction.guild.id, interaction.channel.id)
+            await db_remove_ticket_channel(interaction.guild.id, interaction.channel.id)
 
         # Send closed message
         await interaction.channel.send("Ticket closed by " + interaction.user.mention)
@@ -171,7 +198,7 @@ class TicketCreateView(discord.ui.View):
         self.button.callback = self.create_ticket
 
     async def create_ticket(self, interaction: discord.Interaction):
-        category = interaction.guild.get_channel(int(get_setting(interaction.guild.id, "ticket_category", "0")))
+        category = interaction.guild.get_channel(int(await get_setting(interaction.guild.id, "ticket_category", "0")))
         if category is None:
             await interaction.response.send_message(
                 "A ticket category has to be set in order to create a ticket. Please ping the admins of the server to fix this.",
@@ -190,7 +217,7 @@ class TicketCreateView(discord.ui.View):
             "Ticket created by " + interaction.user.mention + "\n\nYou can use the buttons below to manage the ticket.",
             view=TicketMessageView())
 
-        db_add_ticket_channel(interaction.guild.id, channel.id, interaction.user.id)
+        await db_add_ticket_channel(interaction.guild.id, channel.id, interaction.user.id)
 
         await interaction.response.send_message("Ticket created! " + channel.mention, ephemeral=True)
 
@@ -200,7 +227,8 @@ class TicketCreateView(discord.ui.View):
         log_embed.add_field(name="Ticket Creator", value=interaction.user.mention)
         log_embed.add_field(name="Ticket Channel", value=channel.mention)
         log_embed.add_field(name="Ticket Category", value=category.name)
-        log_embed.add_field(name="Ticket Creation Time", value=get_now_for_server(interaction.guild.id).isoformat())
+        log_embed.add_field(name="Ticket Creation Time",
+                            value=(await get_now_for_server(interaction.guild.id)).isoformat())
 
         await log_into_logs(interaction.guild, log_embed)
 
@@ -208,41 +236,31 @@ class TicketCreateView(discord.ui.View):
 class Tickets(discord.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
+        message_dispatcher.register("tickets", self.handle_message,
+                                    lambda message, settings: message.channel.id in ticket_channels)
 
     tickets_commands = discord.SlashCommandGroup(name="tickets", description="Manage tickets")
 
     @discord.Cog.listener()
     async def on_ready(self):
-        self.handle_hiding.start()
-        self.handle_auto_archive.start()
-
-    @discord.Cog.listener()
-    async def on_message(self, message: discord.Message):
         try:
-
-            if message.author.bot:
-                return
-
-            if not db_is_ticket_channel(message.guild.id, message.channel.id):
-                return
-
-            if db_is_archived(message.guild.id, message.channel.id):
-                return
-
-            db_update_mtime(message.guild.id, message.channel.id)
+            await load_ticket_channels()
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
+        self.handle_hiding.start()
+        self.handle_auto_archive.start()
+
+    async def handle_message(self, ctx: MessageContext):
+        await update_mtime_later(ctx.guild.id, ctx.message.channel.id, skip_archived=True)
+
     @discord.Cog.listener()
     async def on_message_edit(self, before: discord.Message, after: discord.Message):
         try:
             if after.author.bot:
                 return
 
-            if not db_is_ticket_channel(after.guild.id, after.channel.id):
-                return
-
-            db_update_mtime(after.guild.id, after.channel.id)
+            await update_mtime_later(after.guild.id, after.channel.id, skip_archived=False)
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
@@ -252,13 +270,7 @@ class Tickets(discord.Cog):
             if user.bot:
                 return
 
-            if not db_is_ticket_channel(reaction.message.guild.id, reaction.message.channel.id):
-                return
-
-            if db_is_archived(reaction.message.guild.id, reaction.message.channel.id):
-                return
-
-            db_update_mtime(reaction.message.guild.id, reaction.message.channel.id)
+            await update_mtime_later(reaction.message.guild.id, reaction.message.channel.id, skip_archived=True)
         except Exception as e:
             sentry_sdk.capture_exception(e)
 
@@ -267,11 +279,11 @@ class Tickets(discord.Cog):
     @commands.has_permissions(manage_guild=True)
     async def send_message(self, ctx: discord.ApplicationContext, message: str, button_label: str):
         try:
-            if get_setting(ctx.guild.id, "ticket_category", "0") == "0":
+            if await get_setting(ctx.guild.id, "ticket_category", "0") == "0":
                 await ctx.respond("Please set a ticket category first!", ephemeral=True)
                 return
 
-            if not ctx.guild.get_channel(int(get_setting(ctx.guild.id, "ticket_category", "0"))):
+            if not ctx.guild.get_channel(int(await get_setting(ctx.guild.id, "ticket_category", "0"))):
                 await ctx.respond("The ticket category has been deleted. Please set a new one.", ephemeral=True)
                 return
 
@@ -290,12 +302,12 @@ class Tickets(discord.Cog):
             log_embed.add_field(name="Ticket Message", value=message)
             log_embed.add_field(name="Ticket Message Button Label", value=button_label)
             log_embed.add_field(name="Ticket Message Channel", value=ctx.channel.mention)
-            log_embed.add_field(name="Ticket Message Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Ticket Message Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @tickets_commands.command(name="set_category",
                               description="Set the category where tickets will be created. Permissions will be copied "
@@ -304,19 +316,19 @@ class Tickets(discord.Cog):
     @commands.has_permissions(manage_guild=True)
     async def set_category(self, ctx: discord.ApplicationContext, category: discord.CategoryChannel):
         try:
-            set_setting(ctx.guild.id, "ticket_category", str(category.id))
+            await set_setting(ctx.guild.id, "ticket_category", str(category.id))
             await ctx.respond("Category set!", ephemeral=True)
 
             log_embed = discord.Embed(title="Ticket Category Set",
                                       description=f"Ticket category set by {ctx.user.mention} to {category.name}")
             log_embed.add_field(name="Ticket Category", value=category.name)
             log_embed.add_field(name="Ticket Category ID", value=category.id)
-            log_embed.add_field(name="Ticket Category Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Ticket Category Time", value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @tickets_commands.command(name="set_hide_time",
                               description="Set the time that the ticket will be available for the creator after it's "
@@ -325,18 +337,19 @@ class Tickets(discord.Cog):
     @commands.has_permissions(manage_guild=True)
     async def set_hide_time(self, ctx: discord.ApplicationContext, hours: int):
         try:
-            set_setting(ctx.guild.id, "ticket_hide_time", str(hours))
+            await set_setting(ctx.guild.id, "ticket_hide_time", str(hours))
             await ctx.respond("Hide time set!", ephemeral=True)
 
             log_embed = discord.Embed(title="Ticket Hide Time Set",
                                       description=f"Ticket hide time set by {ctx.user.mention} to {hours} hours")
             log_embed.add_field(name="Ticket Hide Time", value=hours)
-            log_embed.add_field(name="Ticket Hide Time Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Ticket Hide Time Time",
+                                value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @tickets_commands.command(name="set_archive_time",
                               description="Set the time that the ticket will be archived after no activity.")
@@ -344,37 +357,39 @@ class Tickets(discord.Cog):
     @commands.has_permissions(manage_guild=True)
     async def set_auto_archive_time(self, ctx: discord.ApplicationContext, hours: int):
         try:
-            set_setting(ctx.guild.id, "ticket_archive_time", str(hours))
+            await set_setting(ctx.guild.id, "ticket_archive_time", str(hours))
             await ctx.respond("Auto archive time set!", ephemeral=True)
 
             log_embed = discord.Embed(title="Ticket Archive Time Set",
                                       description=f"Ticket archive time set by {ctx.user.mention} to {hours} hours")
             log_embed.add_field(name="Ticket Archive Time", value=hours)
-            log_embed.add_field(name="Ticket Archive Time Time", value=get_now_for_server(ctx.guild.id).isoformat())
+            log_embed.add_field(name="Ticket Archive Time Time",
+                                value=(await get_now_for_server(ctx.guild.id)).isoformat())
 
             await log_into_logs(ctx.guild, log_embed)
         except Exception as e:
             sentry_sdk.capture_exception(e)
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+            await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
 
     @tasks.loop(seconds=60)
     async def handle_hiding(self):
         try:
-            for i in db_list_archived_tickets():
+            for i in await db_list_archived_tickets():
                 guild = self.bot.get_guild(int(i['GuildID']))
                 channel = guild.get_channel(int(i['TicketChannelID']))
 
                 if guild is None or channel is None:
                     return  # Skip if the guild or channel is not found
 
-                if check_ticket_hide_time(i['GuildID'], i['TicketChannelID']):
-                    member = guild.get_member(db_get_ticket_creator(i['GuildID'], i['TicketChannelID']))
+                if await check_ticket_hide_time(i['GuildID'], i['TicketChannelID']):
+                    member = guild.get_member(await db_get_ticket_creator(i['GuildID'], i['TicketChannelID']))
                     await channel.set_permissions(member, read_messages=False, send_messages=False)
-                    db_remove_ticket_channel(i['GuildID'], i['TicketChannelID'])
+                    await db_remove_ticket_channel(i['GuildID'], i['TicketChannelID'])
 
                     log_embed = discord.Embed(title="Ticket Hidden",
                                               description=f"Ticket hidden by the system in {channel.mention} because the hide time is up.")
-                    log_embed.add_field(name="Ticket Hidden Time", value=get_now_for_server(guild.id).isoformat())
+                    log_embed.add_field(name="Ticket Hidden Time",
+                                        value=(await get_now_for_server(guild.id)).isoformat())
                     log_embed.add_field(name="Ticket Hidden Message", value=channel.jump_url)
 
                     await log_into_logs(guild, log_embed)
@@ -385,27 +400,27 @@ class Tickets(discord.Cog):
     async def handle_auto_archive(self):
         try:
             # Ticket archiving after certain time of no changes
-            for i in db_list_not_archived_tickets():
-                if check_ticket_archive_time(i['GuildID'], i['TicketChannelID']):
-                    db_archive_ticket(i['GuildID'], i['TicketChannelID'])
+            for i in await db_list_not_archived_tickets():
+                if await check_ticket_archive_time(i['GuildID'], i['TicketChannelID']):
+                    await db_archive_ticket(i['GuildID'], i['TicketChannelID'])
 
                     guild = self.bot.get_guild(int(i['GuildID']))
                     channel = guild.get_channel(int(i['TicketChannelID']))
 
                     # Remove permissions from the ticket creator appropriately
-                    atime = get_setting(guild.id, "ticket_hide_time", "0")
+                    atime = await get_setting(guild.id, "ticket_hide_time", "0")
                     if int(atime) > 0:
                         member = guild.get_member(
-                            db_get_ticket_creator(guild.id, channel.id))
+                            await db_get_ticket_creator(guild.id, channel.id))
                         await channel.set_permissions(member, view_channel=True, read_messages=True,
                                                       send_messages=False)
-                        db_archive_ticket(guild.id, channel.id)
+                        await db_archive_ticket(guild.id, channel.id)
                     else:
                         member = guild.get_member(
-                            db_get_ticket_creator(guild.id, channel.id))
+                            await db_get_ticket_creator(guild.id, channel.id))
                         await channel.set_permissions(member, view_channel=False, read_messages=False,
                                                       send_messages=False)
-                        db_remove_ticket_channel(guild.id, channel.id)
+                        await db_remove_ticket_channel(guild.id, channel.id)
 
                     # Send closed message
                     await channel.send(
@@ -414,7 +429,7 @@ class Tickets(discord.Cog):
                     log_embed = discord.Embed(title="Ticket Closed Automatically",
                                               description=f"Ticket closed automatically by the system in {channel.mention} because there was no activity for a certain amount of time.")
                     log_embed.add_field(name="Ticket Closed Automatically Time",
-                                        value=get_now_for_server(guild.id).isoformat())
+                                        value=(await get_now_for_server(guild.id)).isoformat())
                     log_embed.add_field(name="Ticket Closed Automatically Message", value=channel.jump_url)
 
                     await log_into_logs(guild, log_embed)
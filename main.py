@@ -29,6 +29,7 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import asyncio
 import logging
 
 import discord
@@ -49,7 +50,13 @@ from features import welcoming, leveling, antiraid, chat_streaks, chat_revive, c
     send_server_count, suggestions, temporary_vc, rp, statistics_channels
 from utils.config import get_key
 from utils.db_converter import update
+from utils.db_indexes import create_indexes
 from utils.languages import get_translation_for_key_localized as trl
+from utils.logging_util import log_queue
+from utils.message_dispatch import message_dispatcher
+from utils.settings import settings_cache
+from utils.translation_catalog import catalog, catalog_reload_interval
+from utils.write_behind import write_behind
 
 log_level = get_key("Log_Level", "info")
 if log_level == "debug":
@@ -84,18 +91,37 @@ intents = discord.Intents.default()
 intents.members = True
 
 update()
+create_indexes()
 
-bot = discord.Bot(intents=intents)
+
+class Akabot(discord.Bot):
+    async def close(self) -> None:
+        # Send out anything still buffered before the connection goes away
+        await log_queue.flush_all()
+        await write_behind.close()
+        await super().close()
+
+
+bot = Akabot(intents=intents)
 
 
 @bot.event
 async def on_ready():
+    if get_key("Settings_ChangeStream", "false") == "true":
+        settings_cache.start_change_stream(asyncio.get_running_loop())
+    catalog.start(catalog_reload_interval)
+
     bot.add_view(verification.VerificationView())
     bot.add_view(tickets.TicketCreateView(""))
     bot.add_view(tickets.TicketMessageView())
     await bot.change_presence(activity=discord.Activity(type=discord.ActivityType.playing, name=f"v{BOT_VERSION}"))
 
 
+@bot.event
+async def on_message(message: discord.Message):
+    await message_dispatcher.dispatch(message)
+
+
 @bot.event
 async def on_application_command_error(ctx: discord.ApplicationContext, error):
     if isinstance(error, discord_commands_ext.CommandOnCooldown):
@@ -103,25 +129,26 @@ async def on_application_command_error(ctx: discord.ApplicationContext, error):
         seconds = int(error.retry_after % 60)
         if minutes > 0:
             await ctx.respond(
-                trl(ctx.user.id, ctx.guild.id, "cooldown_2").format(minutes=str(minutes), seconds=str(seconds)),
+                (await trl(ctx.user.id, ctx.guild.id, "cooldown_2")).format(minutes=str(minutes), seconds=str(seconds)),
                 ephemeral=True)
         else:
-            await ctx.respond(trl(ctx.user.id, ctx.guild.id, "cooldown_1").format(seconds=str(seconds)), ephemeral=True)
+            await ctx.respond((await trl(ctx.user.id, ctx.guild.id, "cooldown_1")).format(
+                seconds=str(seconds)), ephemeral=True)
         return
 
     if isinstance(error, discord_commands_ext.MissingPermissions):
         await ctx.respond(
-            trl(ctx.user.id, ctx.guild.id, "command_no_permission").format(
+            (await trl(ctx.user.id, ctx.guild.id, "command_no_permission")).format(
                 permissions=', '.join(error.missing_permissions)),
             ephemeral=True)
         return
 
     if isinstance(error, discord_commands_ext.NoPrivateMessage):
-        await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_no_private"), ephemeral=True)
+        await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_no_private"), ephemeral=True)
         return
 
     if isinstance(error, discord_commands_ext.BotMissingPermissions):
-        await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_bot_no_perm").format(
+        await ctx.respond((await trl(ctx.user.id, ctx.guild.id, "command_bot_no_perm")).format(
             permissions=', '.join(error.missing_permissions)),
             ephemeral=True)
         return
@@ -129,7 +156,7 @@ async def on_application_command_error(ctx: discord.ApplicationContext, error):
     sentry_sdk.capture_exception(error)
     try:
         # respond
-        await ctx.respond(trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
+        await ctx.respond(await trl(ctx.user.id, ctx.guild.id, "command_error_generic"), ephemeral=True)
     except Exception:
         logging.error("Failed to respond to message")
     raise error
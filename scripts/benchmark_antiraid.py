@@ -0,0 +1,102 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+# Replays simulated chat traffic (10k messages per second spread over 5k guilds) through the antiraid message
+# counters, the same count-then-add pattern AntiRaid.on_message uses, with a simulated clock. Reports how many
+# messages per second the counters can handle, and how many keys and how much memory they hold.
+# Run from the scripts directory, like the other scripts.
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.chdir("..")
+sys.path.insert(0, ".")
+
+from utils.violation_counters import ViolationCounters
+
+MESSAGES_PER_SECOND = 10_000
+GUILDS = 5_000
+USERS_PER_GUILD = 50
+SECONDS = 30
+THRESHOLD = 5
+THRESHOLD_PER = 5
+
+
+class OldViolationCounters:
+    """The counters as they were before, one list shared by every guild"""
+
+    def __init__(self, clock):
+        self.past_actions = []
+        self.clock = clock
+
+    def add_action(self, action: str, user_id: int, expires: int):
+        self.past_actions.append({'action': action, 'user': user_id, 'expires': expires + self.clock()})
+
+    def count_actions(self, action: str, user_id: int):
+        self.past_actions = [action for action in self.past_actions if action['expires'] > self.clock()]
+        return len([a for a in self.past_actions if a['action'] == action and a['user'] == user_id])
+
+
+def traffic(seconds: float):
+    rng = random.Random(0)
+    for i in range(int(seconds * MESSAGES_PER_SECOND)):
+        guild_id = rng.randrange(GUILDS)
+        yield i / MESSAGES_PER_SECOND, guild_id, guild_id * USERS_PER_GUILD + rng.randrange(USERS_PER_GUILD)
+
+
+if __name__ == '__main__':
+    now = 0.0
+
+    def clock():
+        return now
+
+    counters = ViolationCounters(clock=clock)
+    peak_keys = 0
+    start = time.perf_counter()
+    for now, guild_id, user_id in traffic(SECONDS):
+        if counters.count_actions(guild_id, user_id, 'message') <= THRESHOLD:
+            counters.add_action(guild_id, user_id, 'message', THRESHOLD_PER)
+        peak_keys = max(peak_keys, len(counters))
+    elapsed = time.perf_counter() - start
+
+    print(f"New counters: {SECONDS * MESSAGES_PER_SECOND / elapsed:,.0f} messages/s "
+          f"(needed {MESSAGES_PER_SECOND:,}), {SECONDS} simulated seconds in {elapsed:.2f} s")
+    print(f"  keys: {len(counters):,} at the end, {peak_keys:,} at most")
+
+    # Memory is measured separately, tracing allocations slows everything down
+    del counters
+    tracemalloc.start()
+    counters = ViolationCounters(clock=clock)
+    for now, guild_id, user_id in traffic(THRESHOLD_PER * 2):
+        if counters.count_actions(guild_id, user_id, 'message') <= THRESHOLD:
+            counters.add_action(guild_id, user_id, 'message', THRESHOLD_PER)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  peak memory: {peak_memory / 1024 / 1024:.1f} MiB")
+
+    # The old counters rescan everything on every message, only replay one simulated second
+    now = 0.0
+    old_counters = OldViolationCounters(clock)
+    start = time.perf_counter()
+    for now, guild_id, user_id in traffic(1):
+        if old_counters.count_actions('message', user_id) <= THRESHOLD:
+            old_counters.add_action('message', user_id, THRESHOLD_PER)
+    elapsed = time.perf_counter() - start
+    print(f"Old counters: {MESSAGES_PER_SECOND / elapsed:,.0f} messages/s over 1 simulated second")
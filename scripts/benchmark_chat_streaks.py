@@ -0,0 +1,72 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+# Fills the chat streaks "counted today" sets with 1M active members spread over 10k servers, then replays repeat
+# messages through the same is_counted check ChatStreaks.handle_message does. Reports the lookup rate and the memory
+# the sets use, both measured and as estimated by CountedToday.memory_usage (shown in /dev_commands cache_stats).
+# Run from the scripts directory, like the other scripts.
+
+import datetime
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.chdir("..")
+sys.path.insert(0, ".")
+
+from utils.counted_today import CountedToday
+
+MEMBERS = 1_000_000
+GUILDS = 10_000
+MESSAGES = 1_000_000
+MIDNIGHT = datetime.datetime(2025, 1, 1)
+
+
+def members():
+    rng = random.Random(0)
+    for i in range(MEMBERS):
+        # Realistic snowflakes, so IDs are as large as the real ones
+        yield rng.randrange(GUILDS), (1 << 60) + rng.getrandbits(50)
+
+
+if __name__ == '__main__':
+    tracemalloc.start()
+    counted = CountedToday(max_members=MEMBERS)
+    population = []
+    for guild_id, member_id in members():
+        counted.add(guild_id, member_id, MIDNIGHT)
+        population.append((guild_id, member_id))
+    del population[MESSAGES:]
+    current_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # The measured memory also includes the list of members to replay, subtract it
+    population_memory = sys.getsizeof(population) + len(population) * (sys.getsizeof((0, 0)) + 32)
+    print(f"{counted.members:,} members in {len(counted.guilds):,} servers")
+    print(f"  memory: {(current_memory - population_memory) / 1024 / 1024:.1f} MiB measured, "
+          f"{counted.memory_usage() / 1024 / 1024:.1f} MiB estimated")
+
+    rng = random.Random(1)
+    messages = [population[rng.randrange(len(population))] for _ in range(MESSAGES)]
+    start = time.perf_counter()
+    for guild_id, member_id in messages:
+        counted.is_counted(guild_id, member_id, MIDNIGHT)
+    elapsed = time.perf_counter() - start
+    print(f"Repeat messages: {MESSAGES / elapsed:,.0f} lookups/s, {counted.stats()['hit_ratio']:.0%} skipped the "
+          f"database")
@@ -0,0 +1,63 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+# Compares translation lookups reading the language files on every call (how trl() used to work) against the
+# preloaded translation catalog. Language resolution is the same for both and isn't measured.
+# Run from the scripts directory, like the other scripts.
+
+import json
+import os
+import random
+import sys
+import timeit
+
+# The catalog loads lang/ relative to the working directory, same as the bot
+os.chdir("..")
+sys.path.insert(0, ".")
+
+from utils.translation_catalog import TranslationCatalog, catalog
+
+
+def file_lookup(language: str, key: str) -> str:
+    with open(f"lang/{language}.json", encoding='utf8') as f:
+        translations: dict = json.load(f)
+
+    with open('lang/en.json', encoding='utf8') as f:
+        en_translations: dict = json.load(f)
+
+    return translations.get(key, "") or en_translations.get(key, "") or f"lang.en.{key}"
+
+
+if __name__ == '__main__':
+    languages = sorted(catalog.languages)
+    keys = list(catalog.current.english)
+
+    random.seed(0)
+    lookups = [(random.choice(languages), random.choice(keys)) for _ in range(1000)]
+
+    mismatches = [i for i in lookups if file_lookup(*i) != catalog.get(*i)]
+    if mismatches:
+        print("Catalog returns different translations for:", mismatches)
+        sys.exit(1)
+
+    load_time = timeit.timeit(lambda: TranslationCatalog.load(), number=5) / 5
+    print(f"Catalog load: {load_time * 1000:.1f} ms for {len(languages)} languages")
+
+    for name, lookup, rounds in (("Files", file_lookup, 1), ("Catalog", catalog.get, 1000)):
+        elapsed = timeit.timeit(lambda: [lookup(*i) for i in lookups], number=rounds)
+        per_second = len(lookups) * rounds / elapsed
+        print(f"{name}: {per_second:,.0f} lookups/s ({elapsed / (len(lookups) * rounds) * 1e6:.2f} us per lookup)")
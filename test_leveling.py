@@ -0,0 +1,151 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import asyncio
+import random
+
+import features.leveling
+from features.leveling import LevelingConfig, get_level_for_xp, get_xp_for_level, db_get_leaderboard_page, \
+    db_get_leaderboard_rank, LEADERBOARD_PAGE_SIZE
+
+
+# The loops get_level_for_xp and get_xp_for_level used before the level math was closed-form
+
+def loop_level_for_xp(xp_needed: int, xp: int) -> int:
+    level = 0
+    while xp >= xp_needed:
+        level += 1
+        xp -= xp_needed
+
+    return level
+
+
+def loop_xp_for_level(xp_needed: int, level: int) -> int:
+    xp = 0
+    for _ in range(level):
+        xp += xp_needed
+
+    return xp
+
+
+def random_config(rng: random.Random) -> LevelingConfig:
+    return LevelingConfig(rng.randint(1, 5000), rng.randint(1, 10),
+                          [rng.randint(1, 5) for _ in range(rng.randint(0, 3))])
+
+
+def test_level_for_xp_matches_loop():
+    rng = random.Random(0)
+    for _ in range(5000):
+        config = random_config(rng)
+        xp = rng.randint(-1000, config.xp_needed * 200)
+        assert get_level_for_xp(config, xp) == loop_level_for_xp(config.xp_needed, xp), (vars(config), xp)
+
+
+def test_xp_for_level_matches_loop():
+    rng = random.Random(1)
+    for _ in range(5000):
+        config = random_config(rng)
+        level = rng.randint(-5, 200)
+        assert get_xp_for_level(config, level) == loop_xp_for_level(config.xp_needed, level), (vars(config), level)
+
+
+def test_level_boundaries():
+    rng = random.Random(2)
+    for _ in range(5000):
+        config = random_config(rng)
+        level = rng.randint(0, 1000)
+        xp = get_xp_for_level(config, level)
+        assert get_level_for_xp(config, xp) == level
+        assert get_level_for_xp(config, xp - 1) == max(level - 1, 0)
+        assert get_level_for_xp(config, get_xp_for_level(config, level + 1) - 1) == level
+
+
+def test_multiplier():
+    assert LevelingConfig(500, 1, []).xp_needed == 500
+    assert LevelingConfig(500, 2, []).xp_needed == 1000
+    assert LevelingConfig(500, 2, [3, 4]).multiplier == 24
+    assert LevelingConfig(500, 2, [3, 4]).xp_needed == 12000
+
+
+def test_free_levels():
+    # A zero multiplier or XP per level made the old loop never finish, these count as level 0 now
+    assert get_level_for_xp(LevelingConfig(0, 1, []), 100) == 0
+    assert get_level_for_xp(LevelingConfig(500, 0, []), 100) == 0
+    assert get_xp_for_level(LevelingConfig(500, 0, []), 10) == 0
+
+
+class FakeCursor:
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+
+    async def to_list(self) -> list[dict]:
+        return self.documents
+
+
+class FakeLeveling:
+    """Just enough of the Leveling collection for the leaderboard queries"""
+
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+
+    @staticmethod
+    def matches(document: dict, query: dict) -> bool:
+        for key, value in query.items():
+            if isinstance(value, dict):
+                if '$gt' in value and not document[key] > value['$gt']:
+                    return False
+                if '$lt' in value and not document[key] < value['$lt']:
+                    return False
+            elif document[key] != value:
+                return False
+        return True
+
+    async def find_one(self, query: dict) -> dict | None:
+        return next((i for i in self.documents if self.matches(i, query)), None)
+
+    async def count_documents(self, query: dict) -> int:
+        return sum(self.matches(i, query) for i in self.documents)
+
+    def find(self, query: dict, sort: list, skip: int, limit: int) -> FakeCursor:
+        assert sort == [('XP', -1), ('UserID', 1)]
+        documents = sorted((i for i in self.documents if self.matches(i, query)), key=lambda i: (-i['XP'], i['UserID']))
+        return FakeCursor(documents[skip:skip + limit])
+
+
+def test_leaderboard_rank_with_tied_xp(monkeypatch):
+    # Many members share the same XP, the rank has to point at the page the member is actually shown on
+    rng = random.Random(3)
+    documents = [{'GuildID': '1', 'UserID': str(rng.randint(10 ** 17, 10 ** 18)), 'XP': rng.choice([0, 0, 0, 3, 6, 9])}
+                 for _ in range(100)]
+    monkeypatch.setattr(features.leveling, 'client', {'Leveling': FakeLeveling(documents)})
+
+    async def check():
+        for document in documents:
+            rank = await db_get_leaderboard_rank(1, int(document['UserID']))
+            page = await db_get_leaderboard_page(1, (rank - 1) // LEADERBOARD_PAGE_SIZE)
+            assert page[(rank - 1) % LEADERBOARD_PAGE_SIZE]['UserID'] == document['UserID']
+
+    asyncio.run(check())
+
+
+if __name__ == '__main__':
+    test_level_for_xp_matches_loop()
+    test_xp_for_level_matches_loop()
+    test_level_boundaries()
+    test_multiplier()
+    test_free_levels()
+    print("All leveling tests passed")
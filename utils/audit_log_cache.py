@@ -0,0 +1,129 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import asyncio
+import collections
+import time
+
+import discord
+
+
+class AuditLogCache:
+    """Recent audit log entries, fed by the audit log gateway event, so logging handlers can find out who did
+    something without fetching the audit log over REST.
+
+    Entries are keyed by (guild, action, target ID) and also by (guild, action, None), which holds the latest entry of
+    that action for handlers that don't know the target. They expire after `ttl` seconds. The gateway doesn't
+    guarantee the audit log entry arrives before the event it belongs to, so a lookup waits up to `wait` seconds for
+    it before falling back to REST.
+    """
+
+    def __init__(self, ttl: float = 30, wait: float = 2, max_entries: int = 10_000):
+        self.ttl = ttl
+        self.wait = wait
+        self.max_entries = max_entries
+        self.entries = collections.OrderedDict()  # key -> (time added, user, reason)
+        self.waiters = collections.defaultdict(list)  # key -> futures waiting for an entry
+        self.hits = 0
+        self.misses = 0
+
+    def add(self, entry: discord.RawAuditLogEntryEvent, user: discord.abc.User | None):
+        """Add an entry received from the gateway
+
+        Args:
+            entry (discord.RawAuditLogEntryEvent): The entry
+            user (discord.abc.User | None): User who made the action, None if they aren't cached
+        """
+        if user is None:
+            return  # Can't tell who did it without REST anyway
+
+        now = time.monotonic()
+        for key in ((entry.guild_id, entry.action_type, entry.target_id), (entry.guild_id, entry.action_type, None)):
+            self.entries.pop(key, None)
+            self.entries[key] = (now, user, entry.reason)
+
+            for future in self.waiters.pop(key, []):
+                if not future.done():
+                    future.set_result((user, entry.reason))
+
+        while self.entries:
+            key, (added, _, _) = next(iter(self.entries.items()))
+            if len(self.entries) <= self.max_entries and now - added <= self.ttl:
+                break
+            del self.entries[key]
+
+    def get(self, guild_id: int, action: discord.AuditLogAction, target_id: int | None) -> tuple | None:
+        cached = self.entries.get((guild_id, action, target_id))
+        if cached is None or time.monotonic() - cached[0] > self.ttl:
+            return None
+        return cached[1], cached[2]
+
+    async def find(self, guild: discord.Guild, action: discord.AuditLogAction,
+                   target_id: int | None = None) -> tuple[discord.abc.User | None, str | None]:
+        """Find who made an action and why
+
+        Args:
+            guild (discord.Guild): Guild the action was made in
+            action (discord.AuditLogAction): Action
+            target_id (int | None, optional): ID of the changed object. None for the latest entry of that action.
+
+        Returns:
+            tuple: User who made the action and the reason, both None if the bot can't see the audit log
+        """
+        if not guild.me.guild_permissions.view_audit_log:
+            return None, None
+
+        key = (guild.id, action, target_id)
+        found = self.get(*key)
+        if found is None and self.wait > 0:
+            future = asyncio.get_running_loop().create_future()
+            self.waiters[key].append(future)
+            try:
+                found = await asyncio.wait_for(future, self.wait)
+            except asyncio.TimeoutError:
+                waiters = self.waiters.get(key, [])
+                if future in waiters:
+                    waiters.remove(future)
+                if not waiters:
+                    self.waiters.pop(key, None)
+
+        if found is not None:
+            self.hits += 1
+            return found
+
+        self.misses += 1
+        async for entry in guild.audit_logs(limit=1, action=action):
+            if target_id is None or getattr(entry.target, 'id', None) == target_id:
+                return entry.user, entry.reason
+
+        return None, None
+
+    async def find_moderator(self, guild: discord.Guild, action: discord.AuditLogAction,
+                             target_id: int | None = None) -> discord.abc.User | None:
+        return (await self.find(guild, action, target_id))[0]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'cached_entries': len(self.entries)
+        }
+
+
+audit_log_cache = AuditLogCache()
@@ -0,0 +1,111 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import collections
+import datetime
+import sys
+
+from utils.config import get_key
+
+
+class CountedToday:
+    """Members whose message was already counted for the current day of their server.
+
+    Every guild has a set of member IDs and the local midnight it belongs to. Asking with a different midnight means
+    the server's day changed, so the set is started over; there's no timer to reset it. At most `max_members` member
+    IDs are kept across all guilds: when there are more, the least recently active guilds are forgotten, which only
+    means their members' next message goes through the database again.
+    """
+
+    def __init__(self, max_members: int = 1_000_000):
+        self.max_members = max_members
+        self.guilds: collections.OrderedDict[int, tuple[datetime.datetime, set[int]]] = collections.OrderedDict()
+        self.members = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _get_members(self, guild_id: int, midnight: datetime.datetime) -> set[int]:
+        entry = self.guilds.get(guild_id)
+        if entry is None or entry[0] != midnight:
+            if entry is not None:
+                self.members -= len(entry[1])
+            entry = (midnight, set())
+            self.guilds[guild_id] = entry
+        self.guilds.move_to_end(guild_id)
+        return entry[1]
+
+    def is_counted(self, guild_id: int, member_id: int, midnight: datetime.datetime) -> bool:
+        """Check if a member was already counted today
+
+        Args:
+            guild_id (int): Guild ID
+            member_id (int): Member ID
+            midnight (datetime): The server's current local midnight
+
+        Returns:
+            bool: Whether the member was counted since `midnight`
+        """
+        if member_id in self._get_members(guild_id, midnight):
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        return False
+
+    def add(self, guild_id: int, member_id: int, midnight: datetime.datetime):
+        """Remember that a member was counted today
+
+        Args:
+            guild_id (int): Guild ID
+            member_id (int): Member ID
+            midnight (datetime): The server's current local midnight
+        """
+        members = self._get_members(guild_id, midnight)
+        if member_id in members:
+            return
+
+        members.add(member_id)
+        self.members += 1
+        while self.members > self.max_members:
+            _, (_, forgotten) = self.guilds.popitem(last=False)
+            self.members -= len(forgotten)
+
+    def discard(self, guild_id: int, member_id: int):
+        """Forget a member, so their next message is counted again"""
+        entry = self.guilds.get(guild_id)
+        if entry is not None and member_id in entry[1]:
+            entry[1].discard(member_id)
+            self.members -= 1
+
+    def memory_usage(self) -> int:
+        """Estimate the memory used by the member IDs, in bytes"""
+        # Snowflakes are larger than 2^30, so every ID is a 32 byte int object
+        return sum(sys.getsizeof(members) + len(members) * 32 for _, members in self.guilds.values())
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'guilds': len(self.guilds),
+            'members': self.members,
+            'memory': self.memory_usage()
+        }
+
+
+counted_today = CountedToday(int(get_key("ChatStreaks_MaxCounted", "1000000")))
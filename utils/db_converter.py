@@ -18,7 +18,7 @@ import datetime
 import os
 import sqlite3
 
-from database import client
+from database import sync_client
 
 
 def update():
@@ -37,24 +37,24 @@ def update():
 
     cur.execute('select command, run_count from analytics')
     for i in cur.fetchall():
-        client['Analytics'].update_one({'Command': i[0]}, {'$set': {'RunCount': i[1]}}, upsert=True)
+        sync_client['Analytics'].update_one({'Command': i[0]}, {'$set': {'RunCount': i[1]}}, upsert=True)
 
     # Automod Actions
 
     cur.execute('select id, guild_id, rule_id, rule_name, action, additional from automod_actions')
     for i in cur.fetchall():
-        client['AutomodActions'].update_one({'GuildID': str(i[1]), 'RuleID': i[2]},
-                                            {'$set': {'RuleName': i[3], 'Action': i[4], 'Additional': i[5]}},
-                                            upsert=True)
+        sync_client['AutomodActions'].update_one({'GuildID': str(i[1]), 'RuleID': i[2]},
+                                                 {'$set': {'RuleName': i[3], 'Action': i[4], 'Additional': i[5]}},
+                                                 upsert=True)
 
     # Chat Revive
 
     cur.execute('select guild_id, channel_id, role_id, revival_time, last_message, revived from chat_revive')
     for i in cur.fetchall():
-        client['ChatRevive'].update_one({'GuildID': str(i[0]), 'ChannelID': str(i[1])},
-                                        {'$set': {'RoleID': i[2], 'RevivalTime': i[3],
-                                                  'LastMessage': datetime.datetime.now(datetime.UTC),
-                                                  'Revived': True if str(i[5]) == '1' else False}}, upsert=True)
+        sync_client['ChatRevive'].update_one({'GuildID': str(i[0]), 'ChannelID': str(i[1])},
+                                             {'$set': {'RoleID': i[2], 'RevivalTime': i[3],
+                                                       'LastMessage': datetime.datetime.now(datetime.UTC),
+                                                       'Revived': True if str(i[5]) == '1' else False}}, upsert=True)
 
     # Chat Summary
 
@@ -73,7 +73,7 @@ def update():
         for j in members:
             final_dict[f'Messages.{str(j[2])}'] = j[3]
 
-        client['ChatSummary'].update_one({
+        sync_client['ChatSummary'].update_one({
             'GuildID': str(i[0]),
             'ChannelID': str(i[1])
         }, {
@@ -87,7 +87,7 @@ def update():
         cur.execute('select id, giveaway_id, user_id from giveaway_participants where giveaway_id = ?', (i[0],))
         participants = cur.fetchall()
 
-        client['Giveaways'].insert_one({
+        sync_client['Giveaways'].insert_one({
             'ChannelID': str(i[1]),
             'MessageID': str(i[2]),
             'Item': i[3],
@@ -100,14 +100,14 @@ def update():
 
     cur.execute('select guild_id, user_id, xp from leveling')
     for i in cur.fetchall():
-        client['Leveling'].update_one({'GuildID': str(i[0]), 'UserID': str(i[1])}, {'$set': {'XP': int(i[2])}},
-                                      upsert=True)
+        sync_client['Leveling'].update_one({'GuildID': str(i[0]), 'UserID': str(i[1])}, {'$set': {'XP': int(i[2])}},
+                                           upsert=True)
 
     # Leveling: Multipliers
 
     cur.execute('select guild_id, name, multiplier, start_date, end_date from leveling_multiplier')
     for i in cur.fetchall():
-        client['LevelingMultiplier'].update_one({
+        sync_client['LevelingMultiplier'].update_one({
             'GuildID': str(i[0])
         }, {
             '$set': {
@@ -122,7 +122,7 @@ def update():
 
     cur.execute('select guild_id, role_id from moderator_roles')
     for i in cur.fetchall():
-        client['ModeratorRoles'].insert_one({'GuildID': str(i[0]), 'RoleID': str(i[1])})
+        sync_client['ModeratorRoles'].insert_one({'GuildID': str(i[0]), 'RoleID': str(i[1])})
 
     # Per User Settings
     cur.execute('select user_id from per_user_settings')
@@ -134,13 +134,13 @@ def update():
         for j in settings:
             dict_settings[j[2]] = j[3]
 
-        client['UserSettings'].update_one({'UserID': str(i[0])}, {'$set': dict_settings}, upsert=True)
+        sync_client['UserSettings'].update_one({'UserID': str(i[0])}, {'$set': dict_settings}, upsert=True)
 
     # Roles on Join
 
     cur.execute('select id, guild_id, role_id from roles_on_join')
     for i in cur.fetchall():
-        client['RolesOnJoin'].insert_one({'GuildID': str(i[1]), 'RoleID': str(i[2])})
+        sync_client['RolesOnJoin'].insert_one({'GuildID': str(i[1]), 'RoleID': str(i[2])})
 
     # Server Settings
 
@@ -152,7 +152,7 @@ def update():
         for j in cur.fetchall():
             dict_settings[j[0]] = j[1]
 
-        client['ServerSettings'].update_one({
+        sync_client['ServerSettings'].update_one({
             'GuildID': str(i[0])
         }, {
             '$set': dict_settings
@@ -162,20 +162,20 @@ def update():
 
     cur.execute('select id, channel_id from suggestion_channels')
     for i in cur.fetchall():
-        client['SuggestionChannels'].insert_one({'GuildID': str(i[0]), 'ChannelID': str(i[1])})
+        sync_client['SuggestionChannels'].insert_one({'GuildID': str(i[0]), 'ChannelID': str(i[1])})
 
     # Temporary VC's
 
     cur.execute('select id, channel_id, guild_id from temporary_vc_creator_channels')
     for i in cur.fetchall():
-        client['TemporaryVCCreators'].update_one({'GuildID': str(i[2]), 'ChannelID': str(i[1])}, {'$set': {}},
-                                                 upsert=True)
+        sync_client['TemporaryVCCreators'].update_one({'GuildID': str(i[2]), 'ChannelID': str(i[1])}, {'$set': {}},
+                                                      upsert=True)
 
     # Tickets
 
     cur.execute('select id, guild_id, ticket_channel_id, user_id, mtime, atime from tickets')
     for i in cur.fetchall():
-        client['TicketChannels'].update_one({
+        sync_client['TicketChannels'].update_one({
             'GuildID': str(i[1]),
             'TicketChannelID': str(i[2])
         }, {
@@ -190,7 +190,7 @@ def update():
 
     cur.execute('select id, guild_id, user_id, reason, timestamp from warnings')
     for i in cur.fetchall():
-        client['Warnings'].insert_one({
+        sync_client['Warnings'].insert_one({
             'GuildID': str(i[1]),
             'UserID': str(i[2]),
             'Reason': i[3],
@@ -201,7 +201,7 @@ def update():
 
     cur.execute('select id, guild_id, warnings, action from warnings_actions')
     for i in cur.fetchall():
-        client['WarningActions'].insert_one({
+        sync_client['WarningActions'].insert_one({
             'GuildID': str(i[1]),
             'Warnings': int(i[2]),
             'Action': i[3]
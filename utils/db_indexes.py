@@ -0,0 +1,120 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import logging
+
+import pymongo
+import sentry_sdk
+from pymongo.collection import Collection
+
+from database import sync_client
+
+
+def merge_duplicates(collection: Collection, keys: list[str], merge) -> None:
+    """Merge documents that share the same values of `keys`, so a unique index can be created over them
+
+    Args:
+        collection (Collection): Collection to clean up
+        keys (list[str]): Fields that should be unique together
+        merge: Function taking the duplicate documents and returning the fields to `$set` on the one that's kept
+    """
+    duplicates = collection.aggregate([
+        {'$group': {'_id': {key: f'${key}' for key in keys}, 'ids': {'$push': '$_id'}, 'count': {'$sum': 1}}},
+        {'$match': {'count': {'$gt': 1}}}
+    ], allowDiskUse=True)
+
+    for group in duplicates:
+        documents = list(collection.find({'_id': {'$in': group['ids']}}))
+        keep, *remove = documents
+        collection.update_one({'_id': keep['_id']}, {'$set': merge(documents)})
+        collection.delete_many({'_id': {'$in': [i['_id'] for i in remove]}})
+        logging.warning("Merged %d duplicate %s documents for %s", len(documents), collection.name, group['_id'])
+
+
+def run_step(description: str, step) -> bool:
+    """Run one index or migration step, logging it if it fails so the other steps still run
+
+    Args:
+        description (str): What the step does, for the log message
+        step: Function running the step
+
+    Returns:
+        bool: Whether the step succeeded
+    """
+    try:
+        step()
+        return True
+    except Exception as e:
+        logging.error("Failed to %s: %s", description, e)
+        sentry_sdk.capture_exception(e)
+        return False
+
+
+def create_indexes():
+    """Create the indexes the bot relies on. Runs once on startup, creating an index that already exists does
+    nothing."""
+    # Leveling: one document per member, XP is incremented with an upsert
+    run_step("merge duplicate Leveling documents",
+             lambda: merge_duplicates(sync_client['Leveling'], ['GuildID', 'UserID'],
+                                      lambda documents: {'XP': sum(i.get('XP', 0) for i in documents)}))
+    run_step("create the Leveling member index",
+             lambda: sync_client['Leveling'].create_index([('GuildID', pymongo.ASCENDING),
+                                                           ('UserID', pymongo.ASCENDING)], unique=True))
+    # Leveling leaderboard pages, sorted by XP
+    run_step("create the Leveling leaderboard index",
+             lambda: sync_client['Leveling'].create_index([('GuildID', pymongo.ASCENDING), ('XP', pymongo.DESCENDING),
+                                                           ('UserID', pymongo.ASCENDING)]))
+
+    # Chat streaks: one document per member, updated with a single upsert per message
+    run_step("merge duplicate ChatStreaks documents",
+             lambda: merge_duplicates(sync_client['ChatStreaks'], ['GuildID', 'MemberID'],
+                                      lambda documents: {key: value for key, value in
+                                                         max(documents, key=lambda i: i['LastMessage']).items()
+                                                         if key != '_id'}))
+    run_step("create the ChatStreaks member index",
+             lambda: sync_client['ChatStreaks'].create_index([('GuildID', pymongo.ASCENDING),
+                                                              ('MemberID', pymongo.ASCENDING)], unique=True))
+
+    # Chat summary: daily counters, deleted by MongoDB once ExpireAt passes
+    run_step("create the ChatSummaryDays index",
+             lambda: sync_client['ChatSummaryDays'].create_index([('GuildID', pymongo.ASCENDING),
+                                                                  ('ChannelID', pymongo.ASCENDING),
+                                                                  ('Day', pymongo.ASCENDING)], unique=True))
+    run_step("create the ChatSummaryCounts member index",
+             lambda: sync_client['ChatSummaryCounts'].create_index([('GuildID', pymongo.ASCENDING),
+                                                                    ('ChannelID', pymongo.ASCENDING),
+                                                                    ('Day', pymongo.ASCENDING),
+                                                                    ('UserID', pymongo.ASCENDING)], unique=True))
+    # Top members of a day, sorted by message count
+    run_step("create the ChatSummaryCounts top members index",
+             lambda: sync_client['ChatSummaryCounts'].create_index([('GuildID', pymongo.ASCENDING),
+                                                                    ('ChannelID', pymongo.ASCENDING),
+                                                                    ('Day', pymongo.ASCENDING),
+                                                                    ('Count', pymongo.DESCENDING),
+                                                                    ('UserID', pymongo.ASCENDING)]))
+    for collection in ('ChatSummaryDays', 'ChatSummaryCounts'):
+        run_step(f"create the {collection} expiry index",
+                 lambda: sync_client[collection].create_index('ExpireAt', expireAfterSeconds=0))
+
+    # Giveaways: the expiry worker looks for the earliest end time
+    run_step("create the Giveaways end time index", lambda: sync_client['Giveaways'].create_index('EndTime'))
+    # Giveaways are looked up by their message when someone reacts
+    run_step("create the Giveaways message index", lambda: sync_client['Giveaways'].create_index('MessageID'))
+    # Giveaway participants: one document per entrant
+    run_step("create the GiveawayParticipants index",
+             lambda: sync_client['GiveawayParticipants'].create_index([('GiveawayID', pymongo.ASCENDING),
+                                                                       ('UserID', pymongo.ASCENDING)], unique=True))
@@ -0,0 +1,93 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import asyncio
+import heapq
+import itertools
+import time
+
+
+class DeadlineScheduler:
+    """Keys waiting for a deadline, kept in a min-heap so the earliest one is always known.
+
+    Rescheduling or cancelling a key doesn't search the heap: the key's current deadline is kept separately, and heap
+    entries that don't match it are skipped when they reach the top. `wait` sleeps until the earliest deadline, waking
+    up early if something is scheduled before it.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.heap = []  # (deadline, sequence, key)
+        self.deadlines = {}  # key -> current deadline
+        self.sequence = itertools.count()
+        self.changed = asyncio.Event()
+
+    def schedule(self, key, deadline: float):
+        """Schedule a key, replacing its previous deadline
+
+        Args:
+            key: Anything hashable
+            deadline (float): Time to fire at, in the scheduler's clock (UNIX timestamp by default)
+        """
+        self.deadlines[key] = deadline
+        heapq.heappush(self.heap, (deadline, next(self.sequence), key))
+        if self.heap[0][2] == key:
+            self.changed.set()
+
+    def cancel(self, key):
+        self.deadlines.pop(key, None)
+
+    def next_deadline(self) -> float | None:
+        """Get the earliest deadline, or None if nothing is scheduled"""
+        while self.heap:
+            deadline, _, key = self.heap[0]
+            if self.deadlines.get(key) == deadline:
+                return deadline
+            heapq.heappop(self.heap)
+        return None
+
+    def pop_due(self) -> list:
+        """Remove and return every key whose deadline has passed, earliest first"""
+        now = self.clock()
+        due = []
+        while (deadline := self.next_deadline()) is not None and deadline <= now:
+            _, _, key = heapq.heappop(self.heap)
+            del self.deadlines[key]
+            due.append(key)
+        return due
+
+    async def wait(self) -> list:
+        """Sleep until at least one deadline passes
+
+        Returns:
+            list: The keys that are due, earliest first
+        """
+        while True:
+            due = self.pop_due()
+            if due:
+                return due
+
+            deadline = self.next_deadline()
+            self.changed.clear()
+            timeout = None if deadline is None else max(deadline - self.clock(), 0)
+            try:
+                await asyncio.wait_for(self.changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def __len__(self):
+        return len(self.deadlines)
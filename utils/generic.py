@@ -17,55 +17,55 @@
 
 import datetime
 
-from utils.languages import get_translation_for_key_localized as trl
+from utils.languages import LocaleContext, get_translation_for_key_localized as trl
 from utils.tzutil import get_now_for_server
 
 
-def pretty_time_delta(seconds: int | float, user_id: int, server_id: int, show_seconds=True, show_minutes=True) -> str:
+async def pretty_time_delta(seconds: int | float, user_id: int, server_id: int, show_seconds=True,
+                            show_minutes=True, locale: LocaleContext | None = None) -> str:
     seconds = abs(int(seconds))
     days, seconds = divmod(seconds, 86400)
     hours, seconds = divmod(seconds, 3600)
     minutes, seconds = divmod(seconds, 60)
     if days > 0:
-        # return trl(user_id, server_id, "pretty_time_delta_4").format(days=days, hours=hours, minutes=minutes,
-        # seconds=seconds)
         if not show_minutes:
-            return trl(user_id, server_id, "pretty_time_delta_4_no_minutes").format(days=days, hours=hours)
+            key, values = "pretty_time_delta_4_no_minutes", {'days': days, 'hours': hours}
         elif not show_seconds:
-            return trl(user_id, server_id, "pretty_time_delta_4_no_seconds").format(days=days, hours=hours,
-                                                                                    minutes=minutes)
+            key, values = "pretty_time_delta_4_no_seconds", {'days': days, 'hours': hours, 'minutes': minutes}
         else:
-            return trl(user_id, server_id, "pretty_time_delta_4").format(days=days, hours=hours, minutes=minutes,
-                                                                         seconds=seconds)
+            key, values = "pretty_time_delta_4", {'days': days, 'hours': hours, 'minutes': minutes,
+                                                  'seconds': seconds}
     elif hours > 0:
-        # return trl(user_id, server_id, "pretty_time_delta_3").format(hours=hours, minutes=minutes, seconds=seconds)
         if not show_minutes:
-            return trl(user_id, server_id, "pretty_time_delta_3_no_minutes").format(hours=hours)
+            key, values = "pretty_time_delta_3_no_minutes", {'hours': hours}
         elif not show_seconds:
-            return trl(user_id, server_id, "pretty_time_delta_3_no_seconds").format(hours=hours, minutes=minutes)
+            key, values = "pretty_time_delta_3_no_seconds", {'hours': hours, 'minutes': minutes}
         else:
-            return trl(user_id, server_id, "pretty_time_delta_3").format(hours=hours, minutes=minutes, seconds=seconds)
+            key, values = "pretty_time_delta_3", {'hours': hours, 'minutes': minutes, 'seconds': seconds}
     elif minutes > 0:
-        # return trl(user_id, server_id, "pretty_time_delta_2").format(minutes=minutes, seconds=seconds)
         if not show_minutes:
-            return trl(user_id, server_id, "pretty_time_delta_less_than_an_hour")
+            key, values = "pretty_time_delta_less_than_an_hour", None
         elif not show_seconds:
-            return trl(user_id, server_id, "pretty_time_delta_2_no_seconds").format(minutes=minutes)
+            key, values = "pretty_time_delta_2_no_seconds", {'minutes': minutes}
         else:
-            return trl(user_id, server_id, "pretty_time_delta_2").format(minutes=minutes, seconds=seconds)
+            key, values = "pretty_time_delta_2", {'minutes': minutes, 'seconds': seconds}
     else:
         if not show_minutes:
-            return trl(user_id, server_id, "pretty_time_delta_less_than_an_hour")
+            key, values = "pretty_time_delta_less_than_an_hour", None
         elif not show_seconds:
-            return trl(user_id, server_id, "pretty_time_delta_less_than_a_minute")
+            key, values = "pretty_time_delta_less_than_a_minute", None
         else:
-            return trl(user_id, server_id, "pretty_time_delta_1").format(seconds=seconds)
+            key, values = "pretty_time_delta_1", {'seconds': seconds}
+
+    text = await trl(user_id, server_id, key, locale=locale)
+    return text.format(**values) if values is not None else text
 
 
 def pretty_time(seconds_since_epoch: int | float) -> str:
     return datetime.datetime.fromtimestamp(seconds_since_epoch).strftime('%Y/%m/%d %H:%M:%S')
 
 
-def get_date_time_str(guild_id: int) -> str:
+async def get_date_time_str(guild_id: int, locale: LocaleContext | None = None) -> str:
     # format: yyyy/mm/dd hh:mm
-    return get_now_for_server(guild_id).strftime('%Y/%m/%d %H:%M')
+    now = locale.now() if locale is not None else await get_now_for_server(guild_id)
+    return now.strftime('%Y/%m/%d %H:%M')
@@ -0,0 +1,94 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import collections
+import time
+
+from utils.config import get_key
+
+
+class LanguageCache:
+    """Least recently used cache of resolved languages, keyed by (user, guild).
+
+    Entries are dropped when the user's or guild's language setting changes, and expire after `ttl` seconds
+    (0 = never) so changes made by other bot processes are picked up.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = collections.OrderedDict()  # (user ID, guild ID) -> (time resolved, language)
+        self.users = collections.defaultdict(set)  # user ID -> keys
+        self.guilds = collections.defaultdict(set)  # guild ID -> keys
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, guild_id: int) -> str | None:
+        key = (user_id, guild_id)
+        cached = self.entries.get(key)
+        if cached is None or (self.ttl and time.monotonic() - cached[0] > self.ttl):
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return cached[1]
+
+    def put(self, user_id: int, guild_id: int, language: str):
+        key = (user_id, guild_id)
+        self.entries[key] = (time.monotonic(), language)
+        self.entries.move_to_end(key)
+        self.users[user_id].add(key)
+        self.guilds[guild_id].add(key)
+
+        while len(self.entries) > self.max_size:
+            self._remove(next(iter(self.entries)))
+
+    def _remove(self, key: tuple[int, int]):
+        self.entries.pop(key, None)
+        for index, i in ((self.users, key[0]), (self.guilds, key[1])):
+            keys = index.get(i)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[i]
+
+    def invalidate_user(self, user_id: int):
+        for key in list(self.users.get(int(user_id), ())):
+            self._remove(key)
+
+    def invalidate_guild(self, guild_id: int | None = None):
+        if guild_id is None:
+            self.entries.clear()
+            self.users.clear()
+            self.guilds.clear()
+            return
+
+        for key in list(self.guilds.get(int(guild_id), ())):
+            self._remove(key)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'cached': len(self.entries)
+        }
+
+
+language_cache = LanguageCache(int(get_key("Language_CacheSize", "50000")), int(get_key("Settings_CacheTTL", "300")))
@@ -0,0 +1,107 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import re
+
+from utils.translation_catalog import TranslationCatalog, catalog
+
+# Display names end with the completeness, which changes whenever the language file does
+COMPLETENESS_SUFFIX = re.compile(r" - \d+%$")
+
+
+class LanguageInfo:
+    """Metadata of one language file"""
+
+    __slots__ = ('code', 'name', 'completeness')
+
+    def __init__(self, code: str, name: str, completeness: int):
+        self.code = code
+        self.name = name
+        self.completeness = completeness
+
+    @property
+    def display_name(self) -> str:
+        """Name shown in language choices, for example `Čeština - 95%`"""
+        if self.code == 'en':
+            return self.name
+        return f"{self.name} - {self.completeness}%"
+
+
+class LanguageRegistry:
+    """Code, native name and completeness of every language, taken from the translation catalog.
+
+    Lookups by code and by name are dictionary accesses. The metadata is rebuilt only when the catalog was reloaded,
+    which is noticed by the catalog object changing.
+    """
+
+    def __init__(self):
+        self.source = None
+        self.languages = {}  # code -> LanguageInfo
+        self.codes = {}  # native name -> code
+
+    def _get_languages(self) -> dict[str, LanguageInfo]:
+        current = catalog.current
+        if current is not self.source:
+            self._build(current)
+        return self.languages
+
+    def _build(self, source: TranslationCatalog):
+        languages = {code: LanguageInfo(code, source.names.get(code, code), source.completeness.get(code, 0))
+                     for code in source.languages}
+
+        self.languages = languages
+        self.codes = {info.name: info.code for info in languages.values()}
+        self.source = source
+
+    def get(self, code: str) -> LanguageInfo:
+        """Get the metadata of a language
+
+        Args:
+            code (str): Language code
+
+        Returns:
+            LanguageInfo: Metadata of the language
+
+        Raises:
+            ValueError: If the language doesn't exist
+        """
+        info = self._get_languages().get(code)
+        if info is None:
+            raise ValueError("Language does not exist")
+        return info
+
+    def get_code(self, name: str, default: str | None = None) -> str | None:
+        """Get the language code from a native name or display name
+
+        Display names are matched by their native name, so choices shown before the completeness changed still work.
+
+        Args:
+            name (str): Native name (`Čeština`) or display name (`Čeština - 95%`)
+            default (str, optional): Returned when no language has this name
+
+        Returns:
+            str: Language code
+        """
+        self._get_languages()
+        return self.codes.get(COMPLETENESS_SUFFIX.sub("", name), default)
+
+    def all(self) -> list[LanguageInfo]:
+        """Get the metadata of every language, sorted by language code"""
+        return list(self._get_languages().values())
+
+
+language_registry = LanguageRegistry()
@@ -15,16 +15,72 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-import json
+import datetime
 import logging
-import os.path
 
+from utils.language_cache import language_cache
+from utils.language_registry import language_registry
 from utils.per_user_settings import get_per_user_setting, set_per_user_setting
 from utils.settings import get_setting, set_setting
 from utils.tips import append_tip_to_message
+from utils.translation_catalog import catalog
+from utils.tzutil import get_timezone_offset, now_for_offset
 
 
-def get_translation_for_key_localized(user_id: int, guild_id: int, key: str, append_tip=False) -> str:
+class LocaleContext:
+    """Language, timezone and tips preference of one user in one server, resolved once per interaction or event.
+
+    Pass it to `trl`, `pretty_time_delta` and `get_date_time_str` instead of resolving the language again for every
+    translated string.
+    """
+
+    __slots__ = ('user_id', 'guild_id', 'language', 'tz_offset', 'tips_enabled')
+
+    def __init__(self, user_id: int, guild_id: int, language: str, tz_offset: float, tips_enabled: bool):
+        self.user_id = user_id
+        self.guild_id = guild_id
+        self.language = language
+        self.tz_offset = tz_offset
+        self.tips_enabled = tips_enabled
+
+    @classmethod
+    async def resolve(cls, user_id: int, guild_id: int) -> "LocaleContext":
+        """Resolve the locale of a user in a server
+
+        Args:
+            user_id (int): User ID, if 0, will skip user language and tips preference
+            guild_id (int): Guild ID, if 0, will skip server language and timezone
+
+        Returns:
+            LocaleContext: The resolved locale
+        """
+        language = await get_language(guild_id, user_id)
+        tz_offset = await get_timezone_offset(guild_id) if guild_id else 0.0
+        tips_enabled = await get_per_user_setting(user_id, "tips_enabled", "true") == "true" if user_id else True
+        return cls(user_id, guild_id, language, tz_offset, tips_enabled)
+
+    def trl(self, key: str, append_tip=False) -> str:
+        """Get translation for a key in this locale's language
+
+        Args:
+            key (str): Key
+            append_tip (bool, optional): Append a tip to the message, if the user has tips enabled. Defaults to False.
+
+        Returns:
+            str: Translation
+        """
+        translation = catalog.get(self.language, key)
+        if append_tip and self.tips_enabled:
+            return append_tip_to_message(self.guild_id, self.user_id, translation, self.language)
+        return translation
+
+    def now(self) -> datetime.datetime:
+        """Get the current time in the server's timezone"""
+        return now_for_offset(self.tz_offset, datetime.datetime.now())
+
+
+async def get_translation_for_key_localized(user_id: int, guild_id: int, key: str, append_tip=False,
+                                            locale: LocaleContext | None = None) -> str:
     """Get translation for a key in the user's language, server language, or English
 
     Args:
@@ -32,56 +88,62 @@ def get_translation_for_key_localized(user_id: int, guild_id: int, key: str, app
         guild_id (int): Guild ID, if 0, will skip server language
         key (str): Key
         append_tip (bool, optional): Append a tip to the message. Defaults to False.
+        locale (LocaleContext, optional): Already resolved locale, skips resolving the language again
 
     Returns:
         str: Translation
     """
-    translation = ""
-    language = get_language(guild_id, user_id)
-
-    with open(f"lang/{language}.json", encoding='utf8') as f:
-        translations: dict = json.load(f)
+    if locale is not None:
+        return locale.trl(key, append_tip)
 
-    with open('lang/en.json', encoding='utf8') as f:
-        en_translations: dict = json.load(f)
+    language = await get_language(guild_id, user_id)
+    translation = catalog.get(language, key)
 
-    translation = translations.get(key, translation) or en_translations.get(key, translation) or f"lang.en.{key}"
-
-    if append_tip and get_per_user_setting(user_id, "tips_enabled", "true") == "true":
+    if append_tip and await get_per_user_setting(user_id, "tips_enabled", "true") == "true":
         return append_tip_to_message(guild_id, user_id, translation, language)
     return translation
 
 
-def get_language(guild_id: int, user_id: int) -> str:
-    """Get the language for a user, guild or use English as a
-    fallback
+async def get_language(guild_id: int, user_id: int) -> str:
+    """Get the language for a user, falling back to the guild's language and then English
 
     Args:
-        guild_id (int): Guild ID
-        user_id (int): User ID
+        guild_id (int): Guild ID, if 0, will skip server language
+        user_id (int): User ID, if 0, will skip user language
 
     Returns:
         str: Language code
     """
+    guild_id, user_id = int(guild_id), int(user_id)
+    language = language_cache.get(user_id, guild_id)
+    if language is None:
+        language = await resolve_language(guild_id, user_id)
+        language_cache.put(user_id, guild_id, language)
 
+    return language
+
+
+async def resolve_language(guild_id: int, user_id: int) -> str:
     # Get user language
     if user_id != 0:
-        user_lang = get_per_user_setting(user_id, "language", "en")
-        if not os.path.exists(f"lang/{user_lang}.json"):
-            set_per_user_setting(user_id, "language", "en")
+        user_lang = await get_per_user_setting(user_id, "language", None)
+        if user_lang is not None and user_lang not in catalog:
+            await set_per_user_setting(user_id, "language", None)
             logging.error(
                 "WARNING: User {id} has somehow set the user language to {lang}, which is not a valid language. "
-                "Reset to EN".format(id=user_id, lang=user_lang))
-        return user_lang
+                "Reset to server language".format(id=user_id, lang=user_lang))
+        elif user_lang is not None:
+            return user_lang
 
     # Get server language
     if guild_id != 0:
-        server_lang = get_setting(guild_id, "language", "en")
-        if not os.path.exists(f"lang/{server_lang}.json"):
-            set_setting(guild_id, "language", "en")
+        server_lang = await get_setting(guild_id, "language", "en")
+        if server_lang not in catalog:
+            await set_setting(guild_id, "language", "en")
             logging.error(
                 "WARNING: Server {id} has somehow set the server language to {lang}, which is not a valid language. "
                 "Reset to EN".format(id=guild_id, lang=server_lang))
+            return "en"
         return server_lang
 
     # Global (English)
@@ -94,12 +156,7 @@ def get_list_of_languages():
     Returns:
         list: List of languages
     """
-    languages = []
-    for file in os.listdir("lang"):
-        if file.endswith(".json"):
-            languages.append(file[:-5])
-
-    return languages
+    return [i.code for i in language_registry.all()]
 
 
 def get_language_completeness(lang: str) -> int:
@@ -108,26 +165,7 @@ def get_language_completeness(lang: str) -> int:
     Returns:
         int: Percentage of translations completed
     """
-    # Validate lang exists
-    if not os.path.exists(f"lang/{lang}.json"):
-        raise ValueError("Language does not exist")
-
-    # Load English translations
-    with open("lang/en.json", encoding='utf8') as f:
-        en_translations: dict = json.load(f)
-
-    # Load target language
-    with open(f"lang/{lang}.json", encoding='utf8') as f:
-        lang_translations: dict = json.load(f)
-
-    total = len(en_translations)
-    translated = 0
-
-    for i in zip(en_translations.values(), lang_translations.values()):
-        if i[0].strip() != i[1].strip():
-            translated += 1
-
-    return int((translated / total) * 100)
+    return language_registry.get(lang).completeness
 
 
 def get_language_name(lang_code: str, completeness: bool = True) -> str:
@@ -137,22 +175,8 @@ def get_language_name(lang_code: str, completeness: bool = True) -> str:
     Returns:
         str: Language name
     """
-
-    if lang_code == 'en':
-        return 'English'
-
-    # Validate lang exists
-    if not os.path.exists(f"lang/{lang_code}.json"):
-        raise ValueError("Language does not exist")
-
-    with open(f"lang/{lang_code}.json", encoding='utf8') as f:
-        name = json.load(f).get("language", lang_code)
-
-    completeness_percent = get_language_completeness(lang_code)
-    if completeness:
-        return f"{name} - {completeness_percent}%"
-    else:
-        return name
+    info = language_registry.get(lang_code)
+    return info.display_name if completeness else info.name
 
 
 def get_language_names() -> list[str]:
@@ -161,14 +185,7 @@ def get_language_names() -> list[str]:
     Returns:
         list: List of language names
     """
-
-    # Generate a list of language names using get_language_name and return it
-
-    languages = []
-    for i in get_list_of_languages():
-        languages.append(get_language_name(i))
-
-    return languages
+    return [i.display_name for i in language_registry.all()]
 
 
 def language_name_to_code(lang_name: str) -> str:
@@ -177,11 +194,4 @@ def language_name_to_code(lang_name: str) -> str:
     Returns:
         str: Language code
     """
-
-    # Generate a list of language names using get_language_name and return it
-
-    for i in get_list_of_languages():
-        if get_language_name(i) == lang_name:
-            return i
-
-    return 'en'
+    return language_registry.get_code(lang_name, 'en')
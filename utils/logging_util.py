@@ -15,18 +15,150 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import asyncio
+import collections
+import logging
+
 import discord
+import sentry_sdk
 
+from utils.config import get_key
+from utils.languages import get_translation_for_key_localized as trl
 from utils.settings import get_setting
 
+EMBEDS_PER_MESSAGE = 10  # Discord's limit
+CHARACTERS_PER_MESSAGE = 6000  # Discord's limit for all embeds of a message together
 
-async def log_into_logs(server: discord.Guild, message: discord.Embed):
-    log_id = get_setting(server.id, 'logging_channel', '0')
-    log_chan = server.get_channel(int(log_id))
-    if log_chan is None:
-        return
 
-    if not log_chan.can_send():
-        return
+class LogQueue:
+    """Per-guild queues of log embeds, sent to the log channel up to 10 embeds (6000 characters) per message.
+
+    The first embed queued for a guild starts a flush after `interval` seconds, so bursts are coalesced into few
+    messages; a queue with 10 embeds is sent right away. Sending waits out Discord's rate limits, and while it does
+    new embeds keep queueing. When a guild has more than `max_queued` embeds waiting, new ones are dropped and
+    counted, and the next message says how many were skipped.
+    """
+
+    def __init__(self, interval: float, max_queued: int):
+        self.interval = interval
+        self.max_queued = max_queued
+        self.queues: dict[int, collections.deque] = {}
+        self.dropped: dict[int, int] = {}
+        self.tasks: dict[int, asyncio.Task] = {}
+        self.full: dict[int, asyncio.Event] = {}
+        self.closing = False
+
+    async def get_log_channel(self, guild: discord.Guild) -> discord.TextChannel | None:
+        log_id = await get_setting(guild.id, 'logging_channel', '0')
+        log_chan = guild.get_channel(int(log_id))
+        if log_chan is None or not log_chan.can_send():
+            return None
+        return log_chan
+
+    async def put(self, guild: discord.Guild, embed: discord.Embed):
+        if await self.get_log_channel(guild) is None:
+            return
+
+        queue = self.queues.setdefault(guild.id, collections.deque())
+        if len(queue) >= self.max_queued:
+            self.dropped[guild.id] = self.dropped.get(guild.id, 0) + 1
+            return
+
+        queue.append(embed)
+        full = self.full.setdefault(guild.id, asyncio.Event())
+        if len(queue) >= EMBEDS_PER_MESSAGE:
+            full.set()
+
+        if guild.id not in self.tasks:
+            self.tasks[guild.id] = asyncio.create_task(self.run(guild))
+
+    async def run(self, guild: discord.Guild):
+        try:
+            while self.queues.get(guild.id):
+                full = self.full[guild.id]
+                if len(self.queues[guild.id]) < EMBEDS_PER_MESSAGE and not self.closing:
+                    try:
+                        await asyncio.wait_for(full.wait(), self.interval)
+                    except asyncio.TimeoutError:
+                        pass
+                full.clear()
+                await self.send_batch(guild)
+        finally:
+            self.tasks.pop(guild.id, None)
+            if not self.queues.get(guild.id):
+                self.queues.pop(guild.id, None)
+                self.full.pop(guild.id, None)
+
+    async def send_batch(self, guild: discord.Guild):
+        queue = self.queues.get(guild.id)
+        embeds = []
+        dropped = self.dropped.pop(guild.id, 0)
+        if dropped:
+            embeds.append(discord.Embed(
+                title=await trl(0, guild.id, "logging_events_dropped_title"),
+                description=(await trl(0, guild.id, "logging_events_dropped")).format(count=dropped),
+                color=discord.Color.orange()))
+
+        characters = sum(len(i) for i in embeds)
+        while queue and len(embeds) < EMBEDS_PER_MESSAGE:
+            if embeds and characters + len(queue[0]) > CHARACTERS_PER_MESSAGE:
+                break  # The rest goes into the next message
+            characters += len(queue[0])
+            embeds.append(queue.popleft())
 
-    await log_chan.send(embed=message)
+        if not embeds:
+            return
+
+        log_chan = None
+        try:
+            log_chan = await self.get_log_channel(guild)
+            if log_chan is None:
+                return
+            await log_chan.send(embeds=embeds)
+        except Exception as e:
+            if log_chan is None or len(embeds) == 1:
+                logging.error("Failed to send %d log embeds in guild %d: %s", len(embeds), guild.id, e)
+                sentry_sdk.capture_exception(e)
+                return
+
+            # Don't lose the whole batch because of one embed Discord rejects, send them one by one
+            logging.warning("Failed to send %d log embeds in guild %d, sending them separately: %s", len(embeds),
+                            guild.id, e)
+            for embed in embeds:
+                try:
+                    await log_chan.send(embed=embed)
+                except Exception as e:
+                    logging.error("Failed to send a log embed in guild %d: %s", guild.id, e)
+                    sentry_sdk.capture_exception(e)
+
+    async def flush_all(self, timeout: float = 10):
+        """Send everything that's queued without waiting for the interval, used when the bot shuts down
+
+        Args:
+            timeout (float, optional): Seconds to wait for the queues to empty. Defaults to 10.
+        """
+        self.closing = True
+        for full in self.full.values():
+            full.set()
+
+        tasks = list(self.tasks.values())
+        if not tasks:
+            return
+
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            logging.warning("Gave up sending logs of %d guilds on shutdown", len(pending))
+
+    def stats(self) -> dict:
+        return {
+            'queued_embeds': sum(len(i) for i in self.queues.values()),
+            'dropped_embeds': sum(self.dropped.values()),
+            'active_guilds': len(self.tasks)
+        }
+
+
+log_queue = LogQueue(float(get_key("Logging_FlushInterval", "2")), int(get_key("Logging_MaxQueued", "100")))
+
+
+async def log_into_logs(server: discord.Guild, message: discord.Embed):
+    await log_queue.put(server, message)
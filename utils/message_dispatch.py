@@ -0,0 +1,140 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import asyncio
+import time
+import types
+
+import discord
+import sentry_sdk
+
+from utils.config import get_key
+from utils.languages import LocaleContext
+from utils.settings import get_settings
+
+
+class MessageContext:
+    """Everything message handlers need to know about a message, resolved once and shared by all of them.
+
+    Attributes:
+        message (discord.Message): The message
+        guild (discord.Guild): Guild the message was sent in
+        author (discord.Member): Author of the message
+        settings (MappingProxyType): Read-only copy of the guild's settings when the message arrived
+        permissions (discord.Permissions): The bot's permissions in the channel
+        enabled (MappingProxyType): Feature name -> whether it handles this message
+    """
+
+    __slots__ = ('message', 'guild', 'author', 'settings', 'permissions', 'enabled', '_locale')
+
+    def __init__(self, message: discord.Message, settings: types.MappingProxyType,
+                 enabled: types.MappingProxyType):
+        set_attr = super().__setattr__
+        set_attr('message', message)
+        set_attr('guild', message.guild)
+        set_attr('author', message.author)
+        set_attr('settings', settings)
+        set_attr('permissions', message.channel.permissions_for(message.guild.me))
+        set_attr('enabled', enabled)
+        set_attr('_locale', None)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("MessageContext is read-only")
+
+    def get_setting(self, key: str, default):
+        return self.settings.get(key, default)
+
+    async def locale(self) -> LocaleContext:
+        """Locale of the author, resolved on first use since most messages never need it. Handlers replying to the
+        author translate with it, so the language is resolved once for all of them."""
+        if self._locale is None:
+            super().__setattr__('_locale', asyncio.ensure_future(LocaleContext.resolve(self.author.id, self.guild.id)))
+        return await asyncio.shield(self._locale)
+
+
+class HandlerTiming:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed: float, failed: bool):
+        self.calls += 1
+        self.errors += failed
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+class MessageDispatcher:
+    """Single `on_message` entry point for every feature.
+
+    Features register a handler taking a `MessageContext`. For every message sent by a user in a guild the
+    dispatcher builds the context once and runs the handlers of every enabled feature concurrently. At most
+    `max_concurrency` handlers run at the same time across all messages; the rest wait their turn. Each handler is
+    timed.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.handlers = {}
+        self.checks = {}
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.timings = {}
+
+    def register(self, name: str, handler, enabled=None):
+        """Register a message handler
+
+        Args:
+            name (str): Feature name, used in timings
+            handler: Coroutine function taking a `MessageContext`
+            enabled (optional): Function taking the message and the guild's settings, returning whether the feature
+                handles the message. It runs for every message, so it must not touch the database. Defaults to None,
+                handling every message.
+        """
+        self.handlers[name] = handler
+        self.checks[name] = enabled
+        self.timings.setdefault(name, HandlerTiming())
+
+    async def run_handler(self, name: str, handler, ctx: MessageContext):
+        async with self.semaphore:
+            failed = False
+            start = time.perf_counter()
+            try:
+                await handler(ctx)
+            except Exception as e:
+                failed = True
+                sentry_sdk.capture_exception(e)
+            finally:
+                self.timings[name].add(time.perf_counter() - start, failed)
+
+    async def dispatch(self, message: discord.Message):
+        if message.guild is None or message.author.bot or not self.handlers:
+            return
+
+        settings = await get_settings(message.guild.id)
+        enabled = types.MappingProxyType({name: check is None or check(message, settings)
+                                          for name, check in self.checks.items()})
+        ctx = MessageContext(message, settings, enabled)
+        await asyncio.gather(*(self.run_handler(name, handler, ctx) for name, handler in self.handlers.items()
+                               if enabled[name]))
+
+    def stats(self) -> dict:
+        return {name: {'calls': i.calls, 'errors': i.errors, 'average': i.total / i.calls if i.calls else 0.0,
+                       'max': i.max} for name, i in self.timings.items()}
+
+
+message_dispatcher = MessageDispatcher(int(get_key("MessageDispatch_MaxConcurrency", "64")))
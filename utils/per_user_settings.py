@@ -16,21 +16,25 @@
 #
 
 from database import client
+from utils.language_cache import language_cache
 
 
-def get_per_user_setting(user_id: int, setting_name: str, default_value) -> str:
-    res = client['UserSettings'].find_one({'UserID': str(user_id)})
+async def get_per_user_setting(user_id: int, setting_name: str, default_value) -> str:
+    res = await client['UserSettings'].find_one({'UserID': str(user_id)})
     return res[setting_name] if res and setting_name in res else default_value
 
 
-def set_per_user_setting(user_id: int, setting_name: str, setting_value):
+async def set_per_user_setting(user_id: int, setting_name: str, setting_value):
     if setting_name == "_id" or setting_name == "UserID":
         raise Exception('Invalid setting name')
 
-    if client['UserSettings'].count_documents({'UserID': str(user_id)}) == 0:
-        client['UserSettings'].insert_one({'UserID': str(user_id)})
+    if await client['UserSettings'].count_documents({'UserID': str(user_id)}) == 0:
+        await client['UserSettings'].insert_one({'UserID': str(user_id)})
 
     if setting_value is not None:
-        client['UserSettings'].update_one({'UserID': str(user_id)}, {'$set': {setting_name: setting_value}})
+        await client['UserSettings'].update_one({'UserID': str(user_id)}, {'$set': {setting_name: setting_value}})
     else:
-        client['UserSettings'].update_one({'UserID': str(user_id)}, {'$unset': {setting_name: 1}})
+        await client['UserSettings'].update_one({'UserID': str(user_id)}, {'$unset': {setting_name: 1}})
+
+    if setting_name == "language":
+        language_cache.invalidate_user(user_id)
@@ -15,24 +15,188 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import asyncio
+import logging
+import threading
+import time
+import types
+
+import sentry_sdk
+
 from database import client
+from utils.config import get_key
+from utils.language_cache import language_cache
+
+
+class SettingsCache:
+    """Cache of whole ServerSettings documents, one per guild.
+
+    Documents are loaded on first use and then served from memory. Writes go through to the database and update the
+    cached document. Documents expire after `ttl` seconds (0 = never), so changes made by other bot processes sharing
+    the database are picked up. With a replica set, `start_change_stream` invalidates changed guilds immediately.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.documents = {}  # GuildID -> (load time, document)
+        self.guild_ids = {}  # document _id -> GuildID, for change stream events
+        self.loading = {}  # GuildID -> task loading the document
+        self.generations = {}  # GuildID -> number of writes, so a load racing a write doesn't cache stale data
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.watching = False
+
+    def _get_cached(self, guild_id: str) -> dict | None:
+        cached = self.documents.get(guild_id)
+        if cached is None:
+            return None
+
+        loaded_at, document = cached
+        if self.ttl and time.monotonic() - loaded_at > self.ttl:
+            del self.documents[guild_id]
+            return None
+
+        return document
+
+    async def _load(self, guild_id: str) -> dict:
+        generation = self.generations.get(guild_id, 0)
+        document = await client['ServerSettings'].find_one({'GuildID': guild_id}) or {}
+        if '_id' in document:
+            self.guild_ids[document['_id']] = guild_id
+        if self.generations.get(guild_id, 0) == generation:
+            self.documents[guild_id] = (time.monotonic(), document)
+        return document
+
+    async def get(self, guild_id: str) -> dict:
+        document = self._get_cached(guild_id)
+        if document is not None:
+            self.hits += 1
+            return document
+
+        self.misses += 1
+
+        # Concurrent misses for the same guild share one database read
+        task = self.loading.get(guild_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load(guild_id))
+            self.loading[guild_id] = task
+            task.add_done_callback(lambda _: self.loading.pop(guild_id, None))
+
+        return await asyncio.shield(task)
+
+    async def get_many(self, guild_ids: list[str]) -> dict[str, dict]:
+        """Get the documents of several guilds, loading every guild that isn't cached with one query"""
+        documents = {}
+        missing = []
+        for guild_id in guild_ids:
+            document = self._get_cached(guild_id)
+            if document is not None:
+                self.hits += 1
+                documents[guild_id] = document
+            else:
+                self.misses += 1
+                missing.append(guild_id)
 
+        if missing:
+            generations = {i: self.generations.get(i, 0) for i in missing}
+            loaded = {i: {} for i in missing}
+            async for document in client['ServerSettings'].find({'GuildID': {'$in': missing}}):
+                loaded[document['GuildID']] = document
+                self.guild_ids[document['_id']] = document['GuildID']
 
-def get_setting(server_id: int, key: str, default):
-    res = client['ServerSettings'].find_one({'GuildID': str(server_id)})
-    if not res:
-        return default
-    if key not in res:
-        return default
+            now = time.monotonic()
+            for guild_id, document in loaded.items():
+                if self.generations.get(guild_id, 0) == generations[guild_id]:
+                    self.documents[guild_id] = (now, document)
+                documents[guild_id] = document
 
-    return res[key] if res and key in res else default
+        return documents
 
+    def update(self, guild_id: str, key: str, value) -> None:
+        self.generations[guild_id] = self.generations.get(guild_id, 0) + 1
+        document = self._get_cached(guild_id)
+        if document is None:
+            return
 
-def set_setting(server_id: int, key: str, value) -> None:
-    if client['ServerSettings'].count_documents({'GuildID': str(server_id)}) == 0:
-        client['ServerSettings'].insert_one({'GuildID': str(server_id)})
+        # Cached documents are never changed in place, snapshots handed out by get_settings stay as they were
+        document = dict(document)
+        if value is not None:
+            document[key] = value
+        else:
+            document.pop(key, None)
+        self.documents[guild_id] = (self.documents[guild_id][0], document)
 
+    def invalidate(self, guild_id: str | None = None) -> None:
+        self.invalidations += 1
+        language_cache.invalidate_guild(guild_id)
+        if guild_id is None:
+            for i in self.documents:
+                self.generations[i] = self.generations.get(i, 0) + 1
+            self.documents.clear()
+        else:
+            self.generations[guild_id] = self.generations.get(guild_id, 0) + 1
+            self.documents.pop(guild_id, None)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'invalidations': self.invalidations,
+            'cached_guilds': len(self.documents)
+        }
+
+    def start_change_stream(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Watch ServerSettings for changes made by other processes. Requires MongoDB running as a replica set."""
+        if self.watching:
+            return
+        self.watching = True
+
+        def watch():
+            try:
+                with client['ServerSettings'].collection.watch(full_document='updateLookup') as stream:
+                    for change in stream:
+                        guild_id = (change.get('fullDocument') or {}).get('GuildID')
+                        if guild_id is None:
+                            guild_id = self.guild_ids.get(change.get('documentKey', {}).get('_id'))
+                        loop.call_soon_threadsafe(self.invalidate, guild_id)
+            except Exception as e:
+                logging.error("ServerSettings change stream stopped, falling back to TTL expiry: %s", e)
+                sentry_sdk.capture_exception(e)
+                self.watching = False
+
+        threading.Thread(target=watch, name="akabot-settings-watch", daemon=True).start()
+
+
+settings_cache = SettingsCache(int(get_key("Settings_CacheTTL", "300")))
+
+
+async def get_settings(server_id: int) -> types.MappingProxyType:
+    """Get every setting of a server as a read-only mapping. The mapping is a snapshot, later changes to the
+    settings don't show up in it.
+
+    Args:
+        server_id (int): Server ID
+
+    Returns:
+        MappingProxyType: The server's settings
+    """
+    return types.MappingProxyType(await settings_cache.get(str(server_id)))
+
+
+async def get_setting(server_id: int, key: str, default):
+    res = await settings_cache.get(str(server_id))
+    return res[key] if key in res else default
+
+
+async def set_setting(server_id: int, key: str, value) -> None:
     if value is not None:
-        client['ServerSettings'].update_one({'GuildID': str(server_id)}, {'$set': {key: value}})
+        await client['ServerSettings'].update_one({'GuildID': str(server_id)}, {'$set': {key: value}}, upsert=True)
     else:
-        client['ServerSettings'].update_one({'GuildID': str(server_id)}, {'$unset': {key: 1}})
+        await client['ServerSettings'].update_one({'GuildID': str(server_id)}, {'$unset': {key: 1}}, upsert=True)
+
+    settings_cache.update(str(server_id), key, value)
+    if key == 'language':
+        language_cache.invalidate_guild(server_id)
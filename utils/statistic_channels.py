@@ -17,20 +17,20 @@
 from database import client
 
 
-def db_get_statistic_channels(guild_id: int):
+async def db_get_statistic_channels(guild_id: int):
     """Returns an array of {GuildID: str, ChannelID: str, StatisticText: str}"""
-    data = client['StatisticChannels'].find({'GuildID': str(guild_id)}).to_list()
+    data = await client['StatisticChannels'].find({'GuildID': str(guild_id)}).to_list()
 
     return data
 
 
-def db_set_statistic_channel(guild_id: int, channel_id: int, statistic_text: str):
+async def db_set_statistic_channel(guild_id: int, channel_id: int, statistic_text: str):
     """Updates or creates a record in DB"""
-    client['StatisticChannels'].update_one({'GuildID': str(guild_id), 'ChannelID': str(channel_id)}, {'$set': {
+    await client['StatisticChannels'].update_one({'GuildID': str(guild_id), 'ChannelID': str(channel_id)}, {'$set': {
         'StatisticText': statistic_text}},
-                                           upsert=True)
+                                                 upsert=True)
 
 
-def db_remove_statistic_channel(guild_id: int, channel_id: int):
+async def db_remove_statistic_channel(guild_id: int, channel_id: int):
     """Removes a record from DB"""
-    client['StatisticChannels'].delete_one({'GuildID': str(guild_id), 'ChannelID': str(channel_id)})
+    await client['StatisticChannels'].delete_one({'GuildID': str(guild_id), 'ChannelID': str(channel_id)})
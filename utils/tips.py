@@ -15,35 +15,69 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-import json
+import collections
 import random
-import re
 
+from utils.config import get_key
+from utils.translation_catalog import catalog
 
-def get_tips_from_lang_file(guild_id: int, user_id: int, lang: str) -> list[str]:
+
+class TipRotation:
+    """Chooses which tip a user sees next.
+
+    `random` picks any tip of the language. `round_robin` walks through the tips in order, starting at a random tip,
+    so a user doesn't see the same tip again until they have seen all of them. Positions are kept in memory for the
+    most recently active `max_users` users, no database reads are needed.
+    """
+
+    def __init__(self, mode: str = "random", max_users: int = 100_000):
+        self.mode = mode
+        self.max_users = max_users
+        self.positions = collections.OrderedDict()  # user ID -> index of the next tip
+
+    def pick(self, user_id: int, tips: tuple[str, ...]) -> str:
+        """Pick the next tip for a user
+
+        Args:
+            user_id (int): User ID
+            tips (tuple): Tips of the user's language, must not be empty
+
+        Returns:
+            str: Tip
+        """
+        if self.mode != "round_robin":
+            return random.choice(tips)
+
+        position = self.positions.pop(user_id, None)
+        if position is None:
+            position = random.randrange(len(tips))
+
+        self.positions[user_id] = position + 1
+        if len(self.positions) > self.max_users:
+            self.positions.popitem(last=False)
+
+        return tips[position % len(tips)]
+
+
+tip_rotation = TipRotation(get_key("Tips_Rotation", "random"))
+
+
+def get_tips_from_lang_file(guild_id: int, user_id: int, lang: str) -> tuple[str, ...]:
     """Get the tips from the language file
 
     Args:
         guild_id (int): Guild ID
         user_id (int): User ID
-        lang (str): Language to get tips in (returns empty array when no tips are available for this language)
+        lang (str): Language to get tips in (returns empty tuple when no tips are available for this language)
 
     Returns:
-        list: List of tips
+        tuple: Tips, in the order of their numbers
     """
-    with open(f"lang/{lang}.json", encoding='utf8') as f:
-        file = json.load(f)
-
-    tips = []
-    for key in file:
-        if re.match(r"^tip_\d+$", key):
-            tips.append(file[key])
-
-    return tips
+    return catalog.tips.get(lang, ())
 
 
 def append_tip_to_message(guild_id: int, user_id: int, msg: str, lang: str) -> str:
-    """Append a random tip to a message
+    """Append a tip to a message
 
     Args:
         guild_id (int): Guild ID
@@ -58,5 +92,5 @@ def append_tip_to_message(guild_id: int, user_id: int, msg: str, lang: str) -> s
     if len(tips) == 0:
         return msg  # No tips available for this language
 
-    tip = tips[random.randint(0, len(tips) - 1)]
+    tip = tip_rotation.pick(user_id, tips)
     return f"{msg}\n\n-# **Tip:** {tip}"
@@ -0,0 +1,250 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import asyncio
+import json
+import logging
+import os
+import re
+import string
+import time
+import types
+
+import sentry_sdk
+
+from utils.config import get_key
+
+TIP_KEY = re.compile(r"^tip_(\d+)$")
+
+
+def get_directory_signature(path: str) -> tuple:
+    """Get the name, modification time and size of every language file in a directory, to detect changes
+
+    Args:
+        path (str): Directory with the language files
+
+    Returns:
+        tuple: Signature, equal between two calls when no language file changed
+    """
+    signature = []
+    for file in sorted(os.listdir(path)):
+        if file.endswith(".json"):
+            stat = os.stat(os.path.join(path, file))
+            signature.append((file, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def get_placeholders(text: str) -> set[str] | None:
+    """Get the names of the format placeholders in a translation, or None if the translation can't be formatted"""
+    try:
+        return {name for _, name, _, _ in string.Formatter().parse(text) if name is not None}
+    except ValueError:
+        return None
+
+
+class TranslationCatalog:
+    """Every language file, loaded once and kept in memory.
+
+    Each language maps every English key, with missing or empty translations already filled in from English, so a
+    lookup is a single dictionary access. The mappings are read-only and shared between all callers.
+
+    Tips (`tip_<n>` keys) are indexed per language into tuples, holding only the tips the language file itself
+    translates, so picking one is a single index. `names` has each language file's own name for its language, and
+    `completeness` the percentage of English keys it translates.
+    """
+
+    def __init__(self, languages: dict[str, types.MappingProxyType], tips: dict[str, tuple[str, ...]] | None = None,
+                 names: dict[str, str] | None = None, completeness: dict[str, int] | None = None):
+        self.languages = types.MappingProxyType(languages)
+        self.english = languages['en']
+        self.tips = types.MappingProxyType(tips or {})
+        self.names = types.MappingProxyType(names or {})
+        self.completeness = types.MappingProxyType(completeness or {})
+
+    @classmethod
+    def load(cls, path: str = "lang") -> "TranslationCatalog":
+        """Load and validate every language file in a directory
+
+        Translations using format placeholders that the English text doesn't have are replaced with English, as
+        formatting them would fail.
+
+        Args:
+            path (str, optional): Directory with the language files. Defaults to "lang".
+
+        Returns:
+            TranslationCatalog: The loaded catalog
+
+        Raises:
+            ValueError: If a language file isn't valid, or there is no English language file
+        """
+        files = {}
+        for file in sorted(os.listdir(path)):
+            if file.endswith(".json"):
+                with open(os.path.join(path, file), encoding='utf8') as f:
+                    translations = json.load(f)
+                if not isinstance(translations, dict) or not all(isinstance(i, str) for i in translations.values()):
+                    raise ValueError(f"{file} must be an object of strings")
+                files[file[:-5]] = translations
+
+        if 'en' not in files:
+            raise ValueError("Missing English language file")
+
+        en_translations = files['en']
+        en_placeholders = {key: get_placeholders(value) for key, value in en_translations.items()}
+        languages = {}
+        tips = {}
+        names = {}
+        completeness = {}
+        for code, translations in files.items():
+            merged = dict(en_translations)
+            for key, value in translations.items():
+                if not value:
+                    continue
+                placeholders = get_placeholders(value)
+                if key in en_placeholders and (placeholders is None or not placeholders <= en_placeholders[key]):
+                    logging.warning("Translation %s of %s has placeholders not in English, using English", key, code)
+                    continue
+                merged[key] = value
+            languages[code] = types.MappingProxyType(merged)
+
+            numbered = [(int(match.group(1)), value) for key, value in translations.items()
+                        if value and (match := TIP_KEY.match(key))]
+            tips[code] = tuple(value for _, value in sorted(numbered))
+
+            names[code] = translations.get("language", code)
+            if code == 'en':
+                completeness[code] = 100
+            else:
+                translated = sum(1 for key, value in en_translations.items()
+                                 if translations.get(key, value).strip() not in ('', value.strip()))
+                completeness[code] = int(translated / len(en_translations) * 100)
+
+        return cls(languages, tips, names, completeness)
+
+    def diff(self, other: "TranslationCatalog") -> dict[str, int]:
+        """Count keys that differ from another catalog, across all languages
+
+        Args:
+            other (TranslationCatalog): Older catalog
+
+        Returns:
+            dict: Number of added, removed and changed keys, and added and removed languages
+        """
+        stats = {'added': 0, 'removed': 0, 'changed': 0,
+                 'languages_added': len(self.languages.keys() - other.languages.keys()),
+                 'languages_removed': len(other.languages.keys() - self.languages.keys())}
+        for code, translations in self.languages.items():
+            old = other.languages.get(code, {})
+            stats['added'] += len(translations.keys() - old.keys())
+            stats['removed'] += len(old.keys() - translations.keys())
+            stats['changed'] += sum(1 for key, value in translations.items() if key in old and old[key] != value)
+        return stats
+
+    def __contains__(self, language: str) -> bool:
+        return language in self.languages
+
+    def get(self, language: str, key: str) -> str:
+        """Get the translation of a key
+
+        Args:
+            language (str): Language code, unknown languages fall back to English
+            key (str): Key
+
+        Returns:
+            str: Translation, or `lang.en.<key>` if the key doesn't exist
+        """
+        return self.languages.get(language, self.english).get(key) or f"lang.en.{key}"
+
+
+class ReloadableCatalog:
+    """The current translation catalog, reloaded when the language files change.
+
+    A reload parses and validates the files on a worker thread and then replaces the whole catalog with one
+    assignment, so every lookup sees either the old or the new catalog, never a mix. If the new files aren't valid,
+    the old catalog stays in use.
+    """
+
+    def __init__(self, path: str = "lang"):
+        self.path = path
+        self.signature = get_directory_signature(path)
+        self.current = TranslationCatalog.load(path)
+        self.reloads = 0
+        self.task = None
+
+    @property
+    def languages(self) -> types.MappingProxyType:
+        return self.current.languages
+
+    @property
+    def tips(self) -> types.MappingProxyType:
+        return self.current.tips
+
+    def __contains__(self, language: str) -> bool:
+        return language in self.current
+
+    def get(self, language: str, key: str) -> str:
+        return self.current.get(language, key)
+
+    async def reload(self, force: bool = False) -> bool:
+        """Reload the catalog if the language files changed
+
+        Args:
+            force (bool, optional): Reload even if no file changed. Defaults to False.
+
+        Returns:
+            bool: Whether a new catalog was swapped in
+        """
+        loop = asyncio.get_running_loop()
+        signature = await loop.run_in_executor(None, get_directory_signature, self.path)
+        if signature == self.signature and not force:
+            return False
+
+        started = time.monotonic()
+        try:
+            new = await loop.run_in_executor(None, TranslationCatalog.load, self.path)
+        except Exception as e:
+            # Keep the old catalog, and don't retry until the files change again
+            self.signature = signature
+            logging.error("Language files changed but aren't valid, keeping the loaded translations: %s", e)
+            sentry_sdk.capture_exception(e)
+            return False
+
+        old, self.current, self.signature = self.current, new, signature
+        self.reloads += 1
+        diff = new.diff(old)
+        logging.info("Reloaded translations in %.0f ms: %d keys added, %d removed, %d changed, %d languages added, "
+                     "%d removed", (time.monotonic() - started) * 1000, diff['added'], diff['removed'],
+                     diff['changed'], diff['languages_added'], diff['languages_removed'])
+        return True
+
+    async def run(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reload()
+            except Exception as e:
+                logging.error("Failed to check the language files for changes: %s", e)
+                sentry_sdk.capture_exception(e)
+
+    def start(self, interval: float):
+        """Start polling the language files every `interval` seconds, if not polling already"""
+        if interval > 0 and (self.task is None or self.task.done()):
+            self.task = asyncio.create_task(self.run(interval))
+
+
+catalog = ReloadableCatalog()
+catalog_reload_interval = float(get_key("Translations_ReloadInterval", "10"))
@@ -16,11 +16,67 @@
 #
 
 import datetime
+import functools
 
-from utils.settings import get_setting
+from utils.settings import settings_cache
 
 
-def get_server_midnight_time(server_id: int) -> datetime.datetime:
+@functools.lru_cache(maxsize=1024)
+def parse_timezone_offset(value: str) -> float:
+    """Parse a timezone_offset setting, invalid values count as UTC"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+async def get_timezone_offset(server_id: int) -> float:
+    """Get the server's timezone offset in hours
+
+    The offset is read from the cached server settings, so it doesn't need a database read unless the server's settings
+    expired from the cache.
+
+    Args:
+        server_id (int): Server ID
+
+    Returns:
+        float: Offset from UTC in hours
+    """
+    document = await settings_cache.get(str(server_id))
+    return parse_timezone_offset(document.get("timezone_offset", "0"))
+
+
+async def get_timezone_offsets(server_ids: list[int | str]) -> dict[str, float]:
+    """Get the timezone offsets of many servers, loading every server that isn't cached with one query
+
+    Args:
+        server_ids (list): Server IDs
+
+    Returns:
+        dict: Server ID (as str) -> offset from UTC in hours
+    """
+    documents = await settings_cache.get_many(list({str(i) for i in server_ids}))
+    return {server_id: parse_timezone_offset(document.get("timezone_offset", "0"))
+            for server_id, document in documents.items()}
+
+
+def midnight_for_offset(tz_offset: float, timestamp: float) -> datetime.datetime:
+    """Get the time at midnight for a timezone offset, at a point in time"""
+    return datetime.datetime.fromtimestamp(timestamp // 86400 * 86400 + (86400 * 3) + tz_offset * 3600)
+
+
+def next_midnight_timestamp(tz_offset: float, timestamp: float) -> float:
+    """Get the UNIX timestamp of the next local midnight for a timezone offset, after a point in time"""
+    local = timestamp + tz_offset * 3600
+    return (local // 86400 + 1) * 86400 - tz_offset * 3600
+
+
+def now_for_offset(tz_offset: float, now: datetime.datetime) -> datetime.datetime:
+    """Get the current time for a timezone offset"""
+    return now + datetime.timedelta(hours=tz_offset)
+
+
+async def get_server_midnight_time(server_id: int) -> datetime.datetime:
     """Get the time at midnight for the server's timezone
 
     Args:
@@ -29,12 +85,10 @@ def get_server_midnight_time(server_id: int) -> datetime.datetime:
     Returns:
         datetime: Time at midnight
     """
-    tz_offset = get_setting(server_id, "timezone_offset", "0")
-    stamp1 = datetime.datetime.now(datetime.UTC).timestamp() // 86400 * 86400 + (86400 * 3) + float(tz_offset) * 3600
-    return datetime.datetime.fromtimestamp(stamp1)
+    return midnight_for_offset(await get_timezone_offset(server_id), datetime.datetime.now(datetime.UTC).timestamp())
 
 
-def adjust_time_for_server(time: datetime.datetime, server_id: int) -> datetime.datetime:
+async def adjust_time_for_server(time: datetime.datetime, server_id: int) -> datetime.datetime:
     """Adjust time for the server's timezone
 
     Args:
@@ -44,11 +98,10 @@ def adjust_time_for_server(time: datetime.datetime, server_id: int) -> datetime.
     Returns:
         datetime: Adjusted time
     """
-    tz_offset = get_setting(server_id, "timezone_offset", "0")
-    return time + datetime.timedelta(hours=float(tz_offset))
+    return now_for_offset(await get_timezone_offset(server_id), time)
 
 
-def get_now_for_server(server_id: int) -> datetime.datetime:
+async def get_now_for_server(server_id: int) -> datetime.datetime:
     """Get the current time for the server's timezone
 
     Args:
@@ -57,4 +110,25 @@ def get_now_for_server(server_id: int) -> datetime.datetime:
     Returns:
         datetime: Current time
     """
-    return adjust_time_for_server(datetime.datetime.now(), server_id)
+    return await adjust_time_for_server(datetime.datetime.now(), server_id)
+
+
+async def get_local_times(server_ids: list[int | str]) -> dict[str, tuple[datetime.datetime, datetime.datetime]]:
+    """Get the current time and the time at midnight for many servers at once
+
+    Settings of servers that aren't cached are loaded with one query, and every server is computed for the same
+    instant, so scheduled tasks see a consistent time across servers.
+
+    Args:
+        server_ids (list): Server IDs
+
+    Returns:
+        dict: Server ID (as str) -> (current time, time at midnight)
+    """
+    now = datetime.datetime.now()
+    timestamp = datetime.datetime.now(datetime.UTC).timestamp()
+
+    times = {}
+    for server_id, tz_offset in (await get_timezone_offsets(server_ids)).items():
+        times[server_id] = (now_for_offset(tz_offset, now), midnight_for_offset(tz_offset, timestamp))
+    return times
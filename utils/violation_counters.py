@@ -0,0 +1,107 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import collections
+import time
+
+
+class ViolationCounters:
+    """Sliding window counters of recent actions, keyed by (guild, user, action).
+
+    Every key has its own deque of expiry times, oldest first, so adding, expiring and counting only touch that key.
+    Keys are kept in the order they were last used. Once the number of keys doubles since the last sweep, every key
+    whose actions have all expired is dropped, so memory follows the keys active in the window. When there are more
+    than `max_keys` the least recently used ones are dropped too. Each key remembers at most
+    `max_actions_per_key` actions, which is plenty for thresholds that only need to know "more than N".
+    """
+
+    def __init__(self, max_keys: int = 100_000, max_actions_per_key: int = 1000, clock=time.monotonic):
+        self.counters: collections.OrderedDict[tuple[int, int, str], collections.deque] = collections.OrderedDict()
+        self.max_keys = max_keys
+        self.max_actions_per_key = max_actions_per_key
+        self.clock = clock
+        self.sweep_at = 1024  # Number of keys at which the next sweep of expired keys runs
+
+    def add_action(self, guild_id: int, user_id: int, action: str, expires: int):
+        """Record an action
+
+        Args:
+            guild_id (int): Guild ID
+            user_id (int): User ID, 0 for actions counted for the whole guild
+            action (str): Action name
+            expires (int): Number of seconds the action is counted for
+        """
+        if expires < 0:
+            raise ValueError('expires must be greater than 0')
+
+        now = self.clock()
+        key = (guild_id, user_id, action)
+        counter = self.counters.get(key)
+        if counter is None:
+            counter = collections.deque(maxlen=self.max_actions_per_key)
+            self.counters[key] = counter
+        else:
+            self.counters.move_to_end(key)
+
+        counter.append(now + expires)
+        self.evict(now)
+
+    def count_actions(self, guild_id: int, user_id: int, action: str) -> int:
+        """Count the actions that haven't expired yet
+
+        Args:
+            guild_id (int): Guild ID
+            user_id (int): User ID, 0 for actions counted for the whole guild
+            action (str): Action name
+
+        Returns:
+            int: Number of actions
+        """
+        key = (guild_id, user_id, action)
+        counter = self.counters.get(key)
+        if counter is None:
+            return 0
+
+        now = self.clock()
+        while counter and counter[0] <= now:
+            counter.popleft()
+
+        if not counter:
+            del self.counters[key]
+
+        return len(counter)
+
+    def evict(self, now: float):
+        if len(self.counters) >= self.sweep_at:
+            self.sweep(now)
+
+        # Least recently used keys are at the front, stop at the first one that's still active
+        while self.counters:
+            key, counter = next(iter(self.counters.items()))
+            if len(self.counters) <= self.max_keys and counter and counter[-1] > now:
+                break
+            del self.counters[key]
+
+    def sweep(self, now: float):
+        """Drop every key whose actions have all expired. Runs when the number of keys doubles, so the cost of going
+        through all keys is spread over the actions added in between."""
+        for key in [key for key, counter in self.counters.items() if not counter or counter[-1] <= now]:
+            del self.counters[key]
+        self.sweep_at = max(len(self.counters) * 2, 1024)
+
+    def __len__(self):
+        return len(self.counters)
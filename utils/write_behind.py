@@ -0,0 +1,138 @@
+#      Akabot is a general purpose bot with a ton of features.
+#      Copyright (C) 2023-2025 mldchan
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU Affero General Public License as
+#      published by the Free Software Foundation, either version 3 of the
+#      License, or (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU Affero General Public License for more details.
+#
+#      You should have received a copy of the GNU Affero General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import asyncio
+import logging
+
+import sentry_sdk
+from pymongo import UpdateOne
+
+from database import client
+from utils.config import get_key
+
+
+class WriteBehind:
+    """Buffers frequent small updates (counters, last seen times) in memory and writes them in bulk.
+
+    Updates to the same document are merged: `$inc` amounts add up, `$set` keeps the latest value. Every `interval`
+    seconds, or as soon as `max_pending` documents have pending updates, each collection's updates are written with
+    one unordered `bulk_write`. At most `interval` seconds or `max_pending` documents worth of updates can be lost if
+    the bot crashes; `close` writes everything out on a clean shutdown.
+    """
+
+    def __init__(self, interval: float, max_pending: int):
+        self.interval = interval
+        self.max_pending = max_pending
+        self.pending = {}  # (collection, filter, upsert) -> {'$inc': {...}, '$set': {...}, '$setOnInsert': {...}}
+        self.task = None
+        self.flushing = None
+        self.lock = asyncio.Lock()  # One flush at a time, so a flush returns only once earlier updates are written
+        self.written = 0
+        self.flushes = 0
+
+    def _get(self, collection: str, query: dict, upsert: bool) -> dict:
+        key = (collection, tuple(sorted(query.items())), upsert)
+        update = self.pending.get(key)
+        if update is None:
+            update = self.pending[key] = {}
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return update
+
+    def inc(self, collection: str, query: dict, fields: dict, upsert: bool = False, set_on_insert: dict = None):
+        """Increment fields of a document
+
+        Args:
+            collection (str): Collection name
+            query (dict): Filter matching the document, equality only
+            fields (dict): Field -> amount to add
+            upsert (bool, optional): Create the document if it doesn't exist. Defaults to False.
+            set_on_insert (dict, optional): Fields to set when the document is created. Defaults to None.
+        """
+        update = self._get(collection, query, upsert)
+        inc = update.setdefault('$inc', {})
+        for field, amount in fields.items():
+            inc[field] = inc.get(field, 0) + amount
+        if set_on_insert:
+            update.setdefault('$setOnInsert', {}).update(set_on_insert)
+        self._check_pending()
+
+    def set(self, collection: str, query: dict, fields: dict, upsert: bool = False):
+        """Set fields of a document, the latest value wins
+
+        Args:
+            collection (str): Collection name
+            query (dict): Filter matching the document, equality only
+            fields (dict): Field -> value
+            upsert (bool, optional): Create the document if it doesn't exist. Defaults to False.
+        """
+        self._get(collection, query, upsert).setdefault('$set', {}).update(fields)
+        self._check_pending()
+
+    def _check_pending(self):
+        if len(self.pending) >= self.max_pending:
+            self._start_flush()
+
+    def _start_flush(self) -> asyncio.Task:
+        if self.flushing is None or self.flushing.done():
+            self.flushing = asyncio.create_task(self.flush())
+        return self.flushing
+
+    async def run(self):
+        while self.pending:
+            await asyncio.sleep(self.interval)
+            # Shielded so stopping the loop can't interrupt a write half way
+            await asyncio.shield(self._start_flush())
+
+    async def flush(self):
+        """Write every pending update now. If a background flush is already writing, waits for it first, so every
+        update made before the call is in the database once this returns."""
+        async with self.lock:
+            pending, self.pending = self.pending, {}
+            operations = {}
+            for (collection, query, upsert), update in pending.items():
+                operations.setdefault(collection, []).append(UpdateOne(dict(query), update, upsert=upsert))
+
+            for collection, ops in operations.items():
+                try:
+                    await client[collection].bulk_write(ops, ordered=False)
+                    self.written += len(ops)
+                except Exception as e:
+                    logging.error("Failed to write %d buffered updates to %s: %s", len(ops), collection, e)
+                    sentry_sdk.capture_exception(e)
+
+            self.flushes += 1
+
+    async def close(self):
+        """Stop the flush loop and write everything that's pending, used when the bot shuts down"""
+        if self.task is not None:
+            self.task.cancel()
+        if self.flushing is not None:
+            await self.flushing
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            'pending': len(self.pending),
+            'written': self.written,
+            'flushes': self.flushes
+        }
+
+
+write_behind = WriteBehind(float(get_key("WriteBehind_FlushInterval", "5")),
+                           int(get_key("WriteBehind_MaxPending", "10000")))